@@ -1,3 +1,4 @@
 """Disjoint Set data structure."""
 
 from algolib.disjoint_set.disjoint_set import DisjointSet
+from algolib.disjoint_set.int_disjoint_set import IntDisjointSet
@@ -1,10 +1,14 @@
 """Disjoint-set data structure that allows efficient way of finding which set
-item belongs to and merging two different sets.
+item belongs to and merging two different sets. Sets are stored as trees where
+smaller tree is always attached under the root of larger one and every find
+halves the path by making every other item on it point to its grandparent.
+Find is iterative so long paths never hit the recursion limit.
 
-Time complexity of the operations:
-- Find which set item belongs to: O(log n)
-- Merging two sets: O(log n)
-- Checking if two items belong to same set: O(log n)
+Time complexity of the operations, amortized where α is the inverse Ackermann
+function:
+- Find which set item belongs to: O(α(n))
+- Merging two sets: O(α(n))
+- Checking if two items belong to same set: O(α(n))
 
 For more information see Wikipedia:
 https://en.wikipedia.org/wiki/Disjoint-set_data_structure
@@ -16,8 +20,10 @@ class DisjointSet(object):
     belongs to and merging two different sets.
 
     Attributes:
-        _items: Dictionary of items belonging to set where keys are items
-            and values are pairs [parent, number of items in set]
+        _parent: Dictionary of items belonging to set where keys are items
+            and values are parent items, root is its own parent.
+        _size: Dictionary where keys are items and values are number of items
+            in the set, only up to date for roots.
     """
     def __init__(self, it):
         """Initializer, initializes Disjoint-set with items from given iterable.
@@ -25,10 +31,24 @@ class DisjointSet(object):
         Args:
             it: Iterable of items to add to the object.
         """
-        self._items = {item: [item, 1] for item in it}
+        self._parent = {item: item for item in it}
+        self._size = dict.fromkeys(self._parent, 1)
 
     def __len__(self):
-        return len(self._items)
+        return len(self._parent)
+
+    def __iter__(self):
+        return iter(self._parent)
+
+    def add(self, item):
+        """Adds item to its own set unless it already exists.
+
+        Args:
+            item: Item to add.
+        """
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
 
     def find(self, item):
         """Returns the set where this item belongs to. If items x & y belong
@@ -40,14 +60,17 @@ class DisjointSet(object):
         Returns:
             Set identifier which is one of the items in the object.
         """
-        parent = self._items[item][0]
-        if item != parent:
-            parent = self.find(parent)
-
-            # Compress path
-            self._items[item][0] = parent
-
-        return parent
+        parent = self._parent
+        current = parent[item]
+        while current != item:
+            # Halve the path by pointing every other item to its grandparent
+            # and continuing from there
+            grandparent = parent[current]
+            parent[item] = grandparent
+            item = grandparent
+            current = parent[item]
+
+        return item
 
     def union(self, x, y):
         """Merges sets containing two different items together. If items already
@@ -56,15 +79,22 @@ class DisjointSet(object):
         Args:
             x: First item.
             y: Second item.
+
+        Returns:
+            True if sets were merged, False if items were already in same set.
         """
-        parent_x = self.find(x)
-        parent_y = self.find(y)
-
-        if parent_x != parent_y:
-            merge_from, merge_to = sorted([parent_x, parent_y],
-                                          key=lambda i: self._items[i][1])
-            self._items[merge_from][0] = merge_to
-            self._items[merge_to][1] += self._items[merge_from][1]
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        size = self._size
+        if size[root_x] < size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        size[root_x] += size[root_y]
+
+        return True
 
     def same_component(self, x, y):
         """Returns boolean value telling if two different items belong to
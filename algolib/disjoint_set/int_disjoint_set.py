@@ -0,0 +1,107 @@
+"""Disjoint-set data structure for integer items 0 to n - 1. Works like
+DisjointSet but parents and set sizes are stored in arrays indexed by the item
+instead of dictionaries which makes it faster and several times more memory
+efficient.
+
+Time complexity of the operations, amortized where α is the inverse Ackermann
+function:
+- Find which set item belongs to: O(α(n))
+- Merging two sets: O(α(n))
+- Checking if two items belong to same set: O(α(n))
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Disjoint-set_data_structure
+"""
+from array import array
+
+
+class IntDisjointSet(object):
+    """Disjoint-set data structure for integers 0 to n - 1 that allows user to
+    check which set item belongs to and merging two different sets.
+
+    Attributes:
+        _parent: Array where _parent[i] is parent of item i, root is its own
+            parent.
+        _size: Array where _size[i] is number of items in the set, only up to
+            date for roots.
+    """
+    def __init__(self, n):
+        """Initializer, initializes Disjoint-set with items 0 to n - 1 each in
+        its own set.
+
+        Args:
+            n: Number of items.
+
+        Raises:
+            ValueError: In case n is negative.
+        """
+        if n < 0:
+            raise ValueError('Number of items must be non-negative')
+
+        self._parent = array('l', range(n))
+        self._size = array('l', [1]) * n
+
+    def __len__(self):
+        return len(self._parent)
+
+    def __iter__(self):
+        return iter(range(len(self._parent)))
+
+    def find(self, item):
+        """Returns the set where this item belongs to. If items x & y belong
+        to the same set then find(x) == find(y).
+
+        Args:
+            item: Item whose set to search.
+
+        Returns:
+            Set identifier which is one of the items in the object.
+        """
+        parent = self._parent
+        current = parent[item]
+        while current != item:
+            # Halve the path by pointing every other item to its grandparent
+            # and continuing from there
+            grandparent = parent[current]
+            parent[item] = grandparent
+            item = grandparent
+            current = parent[item]
+
+        return item
+
+    def union(self, x, y):
+        """Merges sets containing two different items together. If items already
+        belong to same set does nothing.
+
+        Args:
+            x: First item.
+            y: Second item.
+
+        Returns:
+            True if sets were merged, False if items were already in same set.
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        size = self._size
+        if size[root_x] < size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        size[root_x] += size[root_y]
+
+        return True
+
+    def same_component(self, x, y):
+        """Returns boolean value telling if two different items belong to
+        same set.
+
+        Args:
+            x: First item.
+            y: Second item.
+
+        Returns:
+            True if items belong to same set, False if not.
+        """
+        return self.find(x) == self.find(y)
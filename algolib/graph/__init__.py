@@ -2,15 +2,32 @@
 
 from algolib.graph.undirected import Undirected
 from algolib.graph.directed import Directed
+from algolib.graph.multi_undirected import MultiUndirected
+from algolib.graph.multi_directed import MultiDirected
+from algolib.graph.view import GraphView, ReversedView
+from algolib.graph.view import induced_subgraph, edge_subgraph, reversed_graph
+from algolib.graph.stats import Stats
 
 from algolib.graph.dfs import DFS
 from algolib.graph.bfs import BFS
-from algolib.graph.bipartite import bipartite
+from algolib.graph.bipartite import bipartite, bipartition, odd_cycle
 from algolib.graph.topsort import top_sort
+from algolib.graph.reachability import ReachabilityIndex
 from algolib.graph.cut import cut_edges, cut_vertices
 from algolib.graph.strong_components import strong_components
 from algolib.graph.prim import prim
 from algolib.graph.kruskal import kruskal
+from algolib.graph.streaming import stream_components, stream_kruskal, \
+    degree_stats
 from algolib.graph.dijkstra import dijkstra, dijkstra_path
+from algolib.graph.k_shortest import k_shortest_paths
+from algolib.graph.dynamic_shortest_paths import DynamicShortestPaths
 from algolib.graph.floyd import floyd
 from algolib.graph.edmonds_karp import edmonds_karp
+from algolib.graph.pagerank import pagerank, pagerank_top
+from algolib.graph.triangles import triangles, clustering, global_clustering
+from algolib.graph.k_core import core_number, k_core
+from algolib.graph.community import label_propagation, louvain, modularity
+from algolib.graph.partition import partition, part_subgraphs, edge_cut
+from algolib.graph.landmarks import DistanceOracle
+from algolib.graph.contraction import ContractionHierarchy
@@ -50,6 +50,7 @@ class BFS(object):
                 source: Edge start vertex.
                 dest: Edge end vertex.
                 edge: Edge key.
+        stats: Stats object to fill or None.
     """
 
     # States
@@ -65,7 +66,7 @@ class BFS(object):
             self.parent = None
 
     def __init__(self, graph, process_vertex_early=_hook,
-                 process_vertex_late=_hook, process_edge=_hook):
+                 process_vertex_late=_hook, process_edge=_hook, stats=None):
         """Initializer, initializes BFS from given graph and hooks.
 
         Args:
@@ -75,8 +76,10 @@ class BFS(object):
             process_vertex_late: Optional hook to be called right before vertex
                 processing ends.
             process_edge: Optional hook to be called when edge is processed.
+            stats: Optional Stats object to fill.
         """
         self.graph = graph
+        self.stats = stats
         self._vertex = {vertex: self.State() for vertex in graph.vertices}
         self.process_vertex_early = process_vertex_early
         self.process_vertex_late = process_vertex_late
@@ -93,13 +96,17 @@ class BFS(object):
         Raises:
             Exceptions from hooks, by default nothing.
         """
+        edges_from = self.graph.edges_from
         self[vertex].state = self.DISCOVERED
         que = deque([vertex])
+        if self.stats is not None:
+            edges_from = self.__count_edges(edges_from, que)
+
         while que:
             vertex = que.popleft()
             self.process_vertex_early(self.graph, self, vertex)
             self[vertex].state = self.PROCESSED
-            for edge, other in self.graph.edges_from(vertex):
+            for edge, other in edges_from(vertex):
                 obj = self[other]
                 if obj.state != self.PROCESSED or self.graph.directed:
                     if not self.process_edge(self.graph, self, vertex,
@@ -111,6 +118,18 @@ class BFS(object):
                     que.append(other)
             self.process_vertex_late(self.graph, self, vertex)
 
+    def __count_edges(self, edges_from, que):
+        # Wraps edge iterator so that it fills stats, vertex has already been
+        # popped from the queue when its edges are iterated
+        stats = self.stats
+        edges_from = stats.count_edges(edges_from, settle=True)
+
+        def wrapper(vertex):
+            stats.frontier(len(que) + 1)
+            return edges_from(vertex)
+
+        return wrapper
+
     def __getitem__(self, item):
         return self._vertex[item]
 
@@ -1,19 +1,55 @@
-"""Tests if graph is bipartite, time complexity: O(V + E)."""
-from algolib.graph.bfs import BFS
+"""Tests if graph is bipartite and finds the partition or an odd cycle proving
+that graph isn't bipartite. Vertices are two-colored with an iterative BFS
+that processes each edge once and stops at the first conflicting edge. For
+directed graphs edge directions are ignored and loops are ignored altogether.
+Works also with multigraphs where parallel edges don't affect the result.
+
+Time complexity: O(V + E)
+"""
+from collections import deque
 
 # Vertex colors in bipartite graph
-UNCOLORED = -1
 WHITE = 0
 BLACK = 1
 
 
-def __process_edge(_graph, bfs, source, dest, _edge):
-    if bfs.color[source] == bfs.color[dest]:
-        bfs.bipartite = False
-        raise StopIteration
+def __neighbors(graph, vertex):
+    for _, n in graph.edges_from(vertex):
+        yield n
+    if graph.directed:
+        incoming = graph.incoming[vertex]
+        for n in (incoming.values() if graph.multigraph else incoming):
+            yield n
+
+
+def __two_color(graph):
+    # Returns tuple (color, parent, conflict) where color is {vertex: color}
+    # dictionary, parent is {vertex: BFS parent} dictionary and conflict is
+    # an edge (x, y) connecting two vertices with same color or None if
+    # coloring succeeded
+    color = {}
+    parent = {}
+
+    for start in graph.vertices:
+        if start in color:
+            continue
 
-    bfs.color[dest] = int(not bfs.color[source])
-    return True
+        color[start] = WHITE
+        parent[start] = None
+        que = deque([start])
+        while que:
+            vertex = que.popleft()
+            other_color = 1 - color[vertex]
+            for n in __neighbors(graph, vertex):
+                n_color = color.get(n)
+                if n_color is None:
+                    color[n] = other_color
+                    parent[n] = vertex
+                    que.append(n)
+                elif n_color != other_color and n != vertex:
+                    return color, parent, (vertex, n)
+
+    return color, parent, None
 
 
 def bipartite(graph):
@@ -25,16 +61,67 @@ def bipartite(graph):
     Returns:
         True if graph is bipartite, False if not.
     """
-    bfs = BFS(graph, process_edge=__process_edge)
-    bfs.color = {vertex: UNCOLORED for vertex in graph.vertices}
-    bfs.bipartite = True
-
-    try:
-        for vertex in graph.vertices:
-            if bfs.color[vertex] == UNCOLORED:
-                bfs.color[vertex] = WHITE
-                bfs.execute(vertex)
-    except StopIteration:
-        pass
-
-    return bfs.bipartite
+    return __two_color(graph)[2] is None
+
+
+def bipartition(graph):
+    """Splits vertices of a bipartite graph to two sets so that every edge
+    connects vertices in different sets.
+
+    Args:
+        graph: Graph to split.
+
+    Returns:
+        Tuple of two vertex sets or None in case graph isn't bipartite.
+    """
+    color, _, conflict = __two_color(graph)
+    if conflict is not None:
+        return None
+
+    result = (set(), set())
+    for vertex, c in color.items():
+        result[c].add(vertex)
+
+    return result
+
+
+def odd_cycle(graph):
+    """Finds a cycle of odd length which proves that graph isn't bipartite.
+
+    Args:
+        graph: Graph to check.
+
+    Returns:
+        List of vertices forming an odd cycle where consecutive vertices and
+        the last and first vertex are connected by an edge. None in case
+        graph is bipartite.
+    """
+    _, parent, conflict = __two_color(graph)
+    if conflict is None:
+        return None
+
+    # Both ends of conflicting edge are in the same BFS tree, walk up from
+    # both until the paths meet at the lowest common ancestor
+    x, y = conflict
+    ancestors = {}
+    current = x
+    while current is not None:
+        ancestors[current] = len(ancestors)
+        current = parent[current]
+
+    tail = []
+    current = y
+    while current not in ancestors:
+        tail.append(current)
+        current = parent[current]
+
+    head = []
+    steps = ancestors[current] + 1
+    current = x
+    for _ in range(steps):
+        head.append(current)
+        current = parent[current]
+
+    # head goes from x up to common ancestor, tail from y up to (not
+    # including) common ancestor
+    return head[::-1] + tail
@@ -0,0 +1,282 @@
+"""Community detection with label propagation and Louvain method. Vertices are
+numbered and adjacency is stored as a list of {neighbor index: weight}
+dictionaries where parallel edges are combined. Edge directions are ignored
+and edges without weight property have weight 1.
+
+Label propagation starts with every vertex in its own community and then
+repeatedly moves vertices to the community with largest total edge weight
+among their neighbors, ties are broken randomly. Vertices are updated
+asynchronously in random order. With multiple processes vertices are split to
+ranges which are updated in parallel, within a range updates are asynchronous
+and between ranges they are synchronous.
+
+Louvain method greedily moves vertices between communities as long as
+modularity increases and then aggregates communities to single vertices and
+repeats until there's no improvement.
+
+Time complexity:
+- label propagation: O(E) per iteration
+- Louvain: O(E) per pass, typically O(E log V) in total
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Label_propagation_algorithm
+https://en.wikipedia.org/wiki/Louvain_method
+"""
+from multiprocessing import Pool
+from random import Random
+
+# Adjacency used by worker processes, set by pool initializer
+_ADJACENCY = None
+
+
+def __adjacency(graph, weight):
+    # Returns tuple (vertices, adjacency) where loops are stored with
+    # double weight so that sum of row is the weighted degree
+    vertices = list(graph.vertices)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    adjacency = [{} for _ in vertices]
+    endpoints = graph.endpoints if graph.multigraph else tuple
+
+    for edge, properties in graph.edges.items():
+        x, y = endpoints(edge)
+        w = properties.get(weight, 1) if weight is not None else 1
+        i = index[x]
+        j = index[y]
+        adjacency[i][j] = adjacency[i].get(j, 0) + w
+        adjacency[j][i] = adjacency[j].get(i, 0) + w
+
+    return vertices, adjacency
+
+
+def __communities(vertices, labels):
+    # Groups vertices by label in order of first appearance
+    result = {}
+    for vertex, label in zip(vertices, labels):
+        result.setdefault(label, set()).add(vertex)
+
+    return list(result.values())
+
+
+def _initialize_worker(adjacency):
+    """Pool initializer that stores adjacency for worker."""
+    # pylint: disable=global-statement
+    global _ADJACENCY
+    _ADJACENCY = adjacency
+
+
+def _propagate(args, adjacency=None):
+    """Runs one round of asynchronous label propagation over vertex range.
+
+    Args:
+        args: Tuple (start, stop, labels, seed) where labels is a list of
+            labels for all vertices. Labels within the range are updated in
+            place.
+        adjacency: Adjacency, if not given the one stored by pool initializer
+            is used.
+
+    Returns:
+        Tuple (labels of the range, number of changed labels).
+    """
+    start, stop, labels, seed = args
+    adjacency = adjacency if adjacency is not None else _ADJACENCY
+    rng = Random(seed)
+    order = list(range(start, stop))
+    rng.shuffle(order)
+    changed = 0
+
+    for i in order:
+        totals = {}
+        for j, w in adjacency[i].items():
+            if j != i:
+                label = labels[j]
+                totals[label] = totals.get(label, 0) + w
+        if not totals:
+            continue
+
+        best = max(totals.values())
+        if totals.get(labels[i]) == best:
+            continue
+
+        candidates = [label for label, total in totals.items()
+                      if total == best]
+        labels[i] = candidates[rng.randrange(len(candidates))] \
+            if len(candidates) > 1 else candidates[0]
+        changed += 1
+
+    return labels[start:stop], changed
+
+
+def label_propagation(graph, weight='weight', seed=None, max_iterations=100,
+                      processes=None):
+    """Finds communities with label propagation.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+        weight: Optional name of the edge weight property, None to treat all
+            edges equally.
+        seed: Optional seed for random number generator.
+        max_iterations: Optional maximum number of rounds.
+        processes: Optional number of processes to use.
+
+    Returns:
+        List of communities where each community is a set of vertices.
+    """
+    vertices, adjacency = __adjacency(graph, weight)
+    n = len(vertices)
+    labels = list(range(n))
+    rng = Random(seed)
+
+    if not processes or processes < 2 or n < 2:
+        for _ in range(max_iterations):
+            _, changed = _propagate((0, n, labels, rng.random()), adjacency)
+            if not changed:
+                break
+        return __communities(vertices, labels)
+
+    step = (n + processes - 1) // processes
+    ranges = [(i, min(i + step, n)) for i in range(0, n, step)]
+    pool = Pool(processes, initializer=_initialize_worker,
+                initargs=(adjacency,))
+    try:
+        for _ in range(max_iterations):
+            args = [(start, stop, labels, rng.random())
+                    for start, stop in ranges]
+            changed = 0
+            for (start, stop), (part, count) in \
+                    zip(ranges, pool.map(_propagate, args)):
+                labels[start:stop] = part
+                changed += count
+            if not changed:
+                break
+    finally:
+        pool.close()
+        pool.join()
+
+    return __communities(vertices, labels)
+
+
+def __move(adjacency, resolution, rng):
+    # Moves vertices between communities while modularity improves,
+    # returns tuple (community of every vertex, True if anything moved)
+    n = len(adjacency)
+    degree = [sum(row.values()) for row in adjacency]
+    total_weight = float(sum(degree))
+    community = list(range(n))
+    tot = list(degree)
+    moved = False
+    if not total_weight:
+        return community, moved
+
+    order = list(range(n))
+    rng.shuffle(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in order:
+            current = community[i]
+            k = degree[i]
+
+            # Weights from vertex to neighboring communities
+            links = {}
+            for j, w in adjacency[i].items():
+                if j != i:
+                    links[community[j]] = links.get(community[j], 0) + w
+
+            # Remove vertex from its community and find best one to join,
+            # vertex stays where it is unless gain is strictly better
+            tot[current] -= k
+            scale = resolution * k / total_weight
+            best = current
+            best_gain = links.get(current, 0) - scale * tot[current]
+            for c, w in links.items():
+                gain = w - scale * tot[c]
+                if gain > best_gain:
+                    best = c
+                    best_gain = gain
+
+            tot[best] += k
+            if best != current:
+                community[i] = best
+                improved = moved = True
+
+    return community, moved
+
+
+def __aggregate(adjacency, community):
+    # Returns tuple (new adjacency, renumbered communities)
+    numbers = {}
+    renumbered = [numbers.setdefault(c, len(numbers)) for c in community]
+    result = [{} for _ in numbers]
+    for i, row in enumerate(adjacency):
+        ci = renumbered[i]
+        for j, w in row.items():
+            cj = renumbered[j]
+            result[ci][cj] = result[ci].get(cj, 0) + w
+
+    return result, renumbered
+
+
+def louvain(graph, weight='weight', resolution=1.0, seed=None):
+    """Finds communities with Louvain method.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+        weight: Optional name of the edge weight property, None to treat all
+            edges equally.
+        resolution: Optional resolution parameter, values larger than 1
+            favor smaller communities.
+        seed: Optional seed for random number generator.
+
+    Returns:
+        List of communities where each community is a set of vertices.
+    """
+    vertices, adjacency = __adjacency(graph, weight)
+    rng = Random(seed)
+
+    # Community of every original vertex
+    labels = list(range(len(vertices)))
+    while True:
+        community, moved = __move(adjacency, resolution, rng)
+        if not moved:
+            break
+
+        adjacency, renumbered = __aggregate(adjacency, community)
+        labels = [renumbered[label] for label in labels]
+
+    return __communities(vertices, labels)
+
+
+def modularity(graph, communities, weight='weight', resolution=1.0):
+    """Calculates modularity of given partition.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+        communities: Iterable of vertex sets that partition the graph.
+        weight: Optional name of the edge weight property, None to treat all
+            edges equally.
+        resolution: Optional resolution parameter.
+
+    Returns:
+        Modularity, 0 if graph doesn't have any edges.
+    """
+    vertices, adjacency = __adjacency(graph, weight)
+    label = {}
+    for i, community in enumerate(communities):
+        for vertex in community:
+            label[vertex] = i
+    labels = [label[vertex] for vertex in vertices]
+
+    total_weight = float(sum(sum(row.values()) for row in adjacency))
+    if not total_weight:
+        return 0.0
+
+    internal = {}
+    tot = {}
+    for i, row in enumerate(adjacency):
+        tot[labels[i]] = tot.get(labels[i], 0) + sum(row.values())
+        for j, w in row.items():
+            if labels[i] == labels[j]:
+                internal[labels[i]] = internal.get(labels[i], 0) + w
+
+    return sum(internal.get(c, 0) / total_weight -
+               resolution * (t / total_weight) ** 2 for c, t in tot.items())
@@ -0,0 +1,278 @@
+"""Contraction hierarchies for fast shortest path queries. Preprocessing
+contracts vertices one by one in order of importance and adds shortcut edges
+that preserve shortest path distances between the remaining vertices. Vertex
+importance is the edge difference (shortcuts added - edges removed) plus the
+number of already contracted neighbors and it's updated lazily. Shortcut is
+skipped if local witness search finds a path that is not longer.
+
+Query runs bidirectional Dijkstra's algorithm where both searches only follow
+edges to vertices contracted later. Shortcuts on the found path are unpacked to
+original edges. Works with directed and undirected graphs where every edge has
+non-negative property 'weight'.
+
+Time complexity:
+- preprocessing: depends on graph structure, near linear for road networks
+- query: O(S log S) where S is size of the upward search space
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Contraction_hierarchies
+"""
+import pickle
+from algolib.priority_queue import PriorityQueue
+
+INF = float('inf')
+
+
+class ContractionHierarchy(object):
+    """Contraction hierarchy built from a weighted graph.
+
+    Attributes:
+        rank: {vertex: order} dictionary telling when vertex was contracted.
+        _up: Dictionary where _up[x][y] = (weight, via) is edge or shortcut
+            from x to y where y has higher rank than x. via is the contracted
+            vertex in the middle of a shortcut or None for original edges.
+        _down: Dictionary where _down[y][x] = (weight, via) is edge or shortcut
+            from x to y where x has higher rank than y.
+    """
+    def __init__(self, graph, settle_limit=100):
+        """Initializer, builds the hierarchy.
+
+        Args:
+            graph: Directed or undirected graph where every edge has
+                non-negative property 'weight'.
+            settle_limit: Optional maximum number of vertices settled by
+                a single witness search. Larger value results in less
+                shortcuts but slower preprocessing.
+        """
+        self.rank = {}
+        self._up = {}
+        self._down = {}
+
+        # Remaining graph where out[x][y] = in[y][x] = (weight, via)
+        out = {vertex: {} for vertex in graph.vertices}
+        inc = {vertex: {} for vertex in graph.vertices}
+        edges = graph.edges
+        for vertex in graph.vertices:
+            for edge, other in graph.edges_from(vertex):
+                weight = edges[edge]['weight']
+                if other != vertex and weight < out[vertex].get(other,
+                                                                (INF,))[0]:
+                    out[vertex][other] = inc[other][vertex] = (weight, None)
+
+        deleted = dict.fromkeys(graph.vertices, 0)
+        queue = PriorityQueue(
+            (self.__priority(out, inc, deleted, vertex, settle_limit)[0],
+             vertex) for vertex in graph.vertices)
+
+        while queue:
+            _, vertex = queue.pop()
+            priority, shortcuts = self.__priority(out, inc, deleted, vertex,
+                                                  settle_limit)
+
+            # Priority may have increased since it was calculated
+            if queue and priority > queue.min()[0]:
+                queue.push(priority, vertex)
+                continue
+
+            self.rank[vertex] = len(self.rank)
+            self._up[vertex] = out.pop(vertex)
+            self._down[vertex] = inc.pop(vertex)
+
+            for other in self._up[vertex]:
+                del inc[other][vertex]
+                deleted[other] += 1
+            for other in self._down[vertex]:
+                del out[other][vertex]
+                deleted[other] += 1
+
+            for source, dest, weight in shortcuts:
+                if weight < out[source].get(dest, (INF,))[0]:
+                    out[source][dest] = inc[dest][source] = (weight, vertex)
+
+    @staticmethod
+    def __witness(out, source, skip, limit, settle_limit):
+        # Dijkstra from source that doesn't go through skip and stops at
+        # given distance, returns distances of found vertices
+        distances = {source: 0}
+        queue = PriorityQueue([(0, source)])
+        settled = 0
+
+        while queue:
+            distance, vertex = queue.pop()
+            settled += 1
+            if distance > limit or settled > settle_limit:
+                break
+
+            for other, (weight, _) in out[vertex].items():
+                if other == skip:
+                    continue
+
+                new_distance = distance + weight
+                current = distances.get(other)
+                if current is None:
+                    queue.push(new_distance, other)
+                elif new_distance < current:
+                    queue.change_priority(new_distance, other)
+                else:
+                    continue
+                distances[other] = new_distance
+
+        return distances
+
+    def __priority(self, out, inc, deleted, vertex, settle_limit):
+        # Returns tuple (priority, shortcuts) where shortcuts is a list of
+        # (source, dest, weight) tuples needed to contract the vertex
+        shortcuts = []
+        outgoing = out[vertex]
+        if outgoing:
+            max_out = max(weight for weight, _ in outgoing.values())
+            for source, (weight_in, _) in inc[vertex].items():
+                distances = self.__witness(out, source, vertex,
+                                           weight_in + max_out, settle_limit)
+                for dest, (weight_out, _) in outgoing.items():
+                    weight = weight_in + weight_out
+                    if dest != source and distances.get(dest, INF) > weight:
+                        shortcuts.append((source, dest, weight))
+
+        priority = len(shortcuts) - len(outgoing) - len(inc[vertex]) + \
+            deleted[vertex]
+        return priority, shortcuts
+
+    def __edge(self, x, y):
+        # Returns (weight, via) of edge from x to y
+        if self.rank[x] < self.rank[y]:
+            return self._up[x][y]
+        return self._down[y][x]
+
+    def __unpack(self, x, y):
+        # Returns list of original vertices on path from x to y, x excluded
+        result = []
+        stack = [(x, y)]
+        while stack:
+            x, y = stack.pop()
+            via = self.__edge(x, y)[1]
+            if via is None:
+                result.append(y)
+            else:
+                stack.append((via, y))
+                stack.append((x, via))
+
+        return result
+
+    def __search(self, source, target):
+        # Bidirectional upward search, returns tuple (distance, meeting
+        # vertex, forward parents, backward parents)
+        searches = [
+            ({source: 0}, {source: None}, PriorityQueue([(0, source)]),
+             self._up),
+            ({target: 0}, {target: None}, PriorityQueue([(0, target)]),
+             self._down)
+        ]
+        best = INF
+        meeting = None
+
+        while any(queue and queue.min()[0] < best
+                  for _, _, queue, _ in searches):
+            for i, (distances, parents, queue, edges) in enumerate(searches):
+                if not queue or queue.min()[0] >= best:
+                    continue
+
+                distance, vertex = queue.pop()
+                other_distance = searches[1 - i][0].get(vertex)
+                if other_distance is not None and \
+                        distance + other_distance < best:
+                    best = distance + other_distance
+                    meeting = vertex
+
+                for other, (weight, _) in edges[vertex].items():
+                    new_distance = distance + weight
+                    current = distances.get(other)
+                    if current is None:
+                        queue.push(new_distance, other)
+                    elif new_distance < current:
+                        queue.change_priority(new_distance, other)
+                    else:
+                        continue
+                    distances[other] = new_distance
+                    parents[other] = vertex
+
+        return best, meeting, searches[0][1], searches[1][1]
+
+    def distance(self, source, target):
+        """Returns shortest path distance between two vertices.
+
+        Args:
+            source: Source vertex.
+            target: Target vertex.
+
+        Returns:
+            Distance, float('inf') if target is not reachable.
+        """
+        return self.__search(source, target)[0]
+
+    def shortest_path(self, source, target):
+        """Finds shortest path between two vertices.
+
+        Args:
+            source: Source vertex.
+            target: Target vertex.
+
+        Returns:
+            Dictionary in the same format as returned by dijkstra where
+            vertices on the path are keys and values are [distance, parent]
+            pairs. Can be passed to dijkstra_path to get the path.
+        """
+        _, meeting, forward, backward = self.__search(source, target)
+        if meeting is None:
+            return {source: [0, None], target: [INF, None]}
+
+        # Collect vertices of the hierarchy path from source to target
+        path = [meeting]
+        while forward[path[-1]] is not None:
+            path.append(forward[path[-1]])
+        path.reverse()
+        while backward[path[-1]] is not None:
+            path.append(backward[path[-1]])
+
+        # Zero weight edges may cause the path to visit a vertex twice,
+        # in that case the loop is cut out
+        result = {source: [0, None]}
+        for x, y in zip(path, path[1:]):
+            for vertex in self.__unpack(x, y):
+                if vertex not in result:
+                    distance = result[x][0] + self.__edge(x, vertex)[0]
+                    result[vertex] = [distance, x]
+                x = vertex
+
+        return result
+
+    def save(self, path):
+        """Saves the hierarchy to a file.
+
+        Args:
+            path: File path.
+        """
+        with open(path, 'wb') as f:
+            pickle.dump((self.rank, self._up, self._down), f,
+                        pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Loads hierarchy from a file written by save. File is read with
+        pickle so it must come from a trusted source.
+
+        Args:
+            path: File path.
+
+        Returns:
+            ContractionHierarchy object.
+        """
+        with open(path, 'rb') as f:
+            rank, up, down = pickle.load(f)
+
+        result = cls.__new__(cls)
+        result.rank = rank
+        result._up = up
+        result._down = down
+
+        return result
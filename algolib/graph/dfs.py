@@ -51,6 +51,10 @@ class DFS(object):
                 source: Edge start vertex.
                 dest: Edge end vertex.
                 edge: Edge key.
+        stats: Stats object to fill or None, frontier is the recursion depth.
+        _depth: Current recursion depth, only tracked when stats is given.
+        _edges_from: Edge iterator function of the graph, wrapped to fill
+            stats when they're given.
     """
 
     # States
@@ -83,7 +87,7 @@ class DFS(object):
     # pylint: enable=too-few-public-methods
 
     def __init__(self, graph, process_vertex_early=_hook,
-                 process_vertex_late=_hook, process_edge=_hook):
+                 process_vertex_late=_hook, process_edge=_hook, stats=None):
         """Initializer, initializes DFS from given graph and hooks.
 
         Args:
@@ -93,8 +97,15 @@ class DFS(object):
             process_vertex_late: Optional hook to be called right before vertex
                 processing ends.
             process_edge: Optional hook to be called when edge is processed.
+            stats: Optional Stats object to fill.
         """
         self.graph = graph
+        self.stats = stats
+        self._depth = 0
+        self._edges_from = graph.edges_from
+        if stats is not None:
+            self._edges_from = self.__count_edges(
+                stats.count_edges(graph.edges_from, settle=True))
         self._vertex = {vertex: self.State() for vertex in graph.vertices}
         self.time = 0
         self.process_vertex_early = process_vertex_early
@@ -120,7 +131,7 @@ class DFS(object):
         directed = self.graph.directed
 
         # Iterate over edge key, neighbor pairs
-        for edge, other in self.graph.edges_from(vertex):
+        for edge, other in self._edges_from(vertex):
             n = self[other]
 
             if n.state == self.UNDISCOVERED:
@@ -135,6 +146,19 @@ class DFS(object):
         v.exit = self.time
         v.state = self.PROCESSED
 
+    def __count_edges(self, edges_from):
+        # Wraps edge iterator so that recursion depth is tracked as frontier
+        def wrapper(vertex):
+            self._depth += 1
+            self.stats.frontier(self._depth)
+            try:
+                for item in edges_from(vertex):
+                    yield item
+            finally:
+                self._depth -= 1
+
+        return wrapper
+
     def edge_category(self, source, dest):
         """Categorizes a given edge, note that given return value is only valid
         when called from process_edge hook.
@@ -1,13 +1,25 @@
 """Dijkstra's algorithm for finding shortest path between vertices in weighted
-graph. Works both with directed and undirected graphs as long as all the edges
-have a property called 'weight'.
+graph. Works both with directed and undirected graphs, including multigraphs,
+as long as all the edges have a property called 'weight'.
 
 Time complexity: O(E log V)
 """
+from algolib.graph.stats import phase
 from algolib.priority_queue import PriorityQueue
 
 
-def dijkstra(graph, source, target=None, queue_constructor=PriorityQueue):
+def __neighbors(graph, vertex):
+    return graph[vertex].items()
+
+
+def __multigraph_neighbors(graph, vertex):
+    edges = graph.edges
+    for edge, other in graph.edges_from(vertex):
+        yield other, edges[edge]
+
+
+def dijkstra(graph, source, target=None, queue_constructor=PriorityQueue,
+             stats=None):
     """Dijkstra's algorithm that finds minimum distance from given vertex.
 
     Args:
@@ -25,29 +37,37 @@ def dijkstra(graph, source, target=None, queue_constructor=PriorityQueue):
                 will change the priority of existing key.
             - Returned object must evaluate True in boolean context in case it
                 contains items and False if it's empty.
+        stats: Optional Stats object to fill.
 
     Returns:
         Dictionary where vertices are keys and values are [distance, parent]
         pairs.
     """
-    queue = queue_constructor((float('inf'), vertex)
-                              for vertex in graph.vertices)
-    result = {vertex: [float('inf'), None] for vertex in graph.vertices}
-    queue.change_priority(0, source)
-    result[source][0] = 0
-
-    while queue and source != target:
-        distance, source = queue.pop()
-
-        # Graph is disconnected
-        if distance == float('inf'):
-            break
-
-        for other in graph[source]:
-            distance_to_other = distance + graph[source][other]['weight']
-            if distance_to_other < result[other][0]:
-                queue.change_priority(distance_to_other, other)
-                result[other] = [distance_to_other, source]
+    neighbors = __multigraph_neighbors if graph.multigraph else __neighbors
+    if stats is not None:
+        queue_constructor = stats.queue(queue_constructor)
+        neighbors = stats.count_edges(neighbors, settle=True)
+
+    with phase(stats, 'initialize'):
+        queue = queue_constructor((float('inf'), vertex)
+                                  for vertex in graph.vertices)
+        result = {vertex: [float('inf'), None] for vertex in graph.vertices}
+        queue.change_priority(0, source)
+        result[source][0] = 0
+
+    with phase(stats, 'search'):
+        while queue and source != target:
+            distance, source = queue.pop()
+
+            # Graph is disconnected
+            if distance == float('inf'):
+                break
+
+            for other, properties in neighbors(graph, source):
+                distance_to_other = distance + properties['weight']
+                if distance_to_other < result[other][0]:
+                    queue.change_priority(distance_to_other, other)
+                    result[other] = [distance_to_other, source]
 
     return result
 
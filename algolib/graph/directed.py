@@ -10,10 +10,212 @@ Time complexity of the operations:
 - insert vertex: O(1)
 - delete vertex: O(number of connected edges)
 - iterate vertices/edges: O(n)
+- snapshot: O(1)
+
+Graph supports copy-on-write snapshots. Snapshot shares all the dicts with the
+graph it was taken from. Top level dicts are wrapped to SnapshotDicts that
+write changes to a private layer on top of the shared contents, and each
+modification copies adjacency dicts of the vertices it touches unless they
+have already been copied. Once a SnapshotDict has as many changes as the
+shared dict has keys it's merged back to a plain dict so modifications stay
+amortized O(1). Lookups from SnapshotDict take O(log number of snapshots)
+time. Edge and vertex property dicts are shared so they must not be modified
+in place.
 
 Interface is loosely based on NetworkX (http://networkx.github.io/).
 """
 from collections import defaultdict
+from collections.abc import MutableMapping
+
+# Marks removed keys in SnapshotDict layers
+_REMOVED = object()
+
+
+class SnapshotDict(MutableMapping):
+    """Dictionary that shares its contents with snapshots. Contents are kept
+    in layers where the first one is the base dict and every later layer
+    contains changes to the previous ones, removed keys are marked with a
+    sentinel. Only the last layer is modified, the others may be shared with
+    snapshots. Missing keys return new value from default_factory like with
+    defaultdict but the value isn't inserted so reads never modify the dict.
+
+    Attributes:
+        default_factory: Function returning value for missing keys, None if
+            missing keys raise KeyError.
+        _layers: List of dicts from the base to the private top layer.
+        _changes: Number of entries in the layers above the base.
+        _size: Number of keys.
+    """
+    def __init__(self, base, default_factory=None):
+        """Initializer, wraps given dict.
+
+        Args:
+            base: Dict to wrap, must not be modified afterwards.
+            default_factory: Optional function returning value for missing
+                keys.
+        """
+        self.default_factory = default_factory
+        self._layers = [base, {}]
+        self._changes = 0
+        self._size = len(base)
+
+    def __lookup(self, key):
+        for layer in reversed(self._layers):
+            if key in layer:
+                return layer[key]
+
+        return _REMOVED
+
+    def __getitem__(self, key):
+        value = self.__lookup(key)
+        if value is _REMOVED:
+            if self.default_factory is None:
+                raise KeyError(key)
+            return self.default_factory()
+
+        return value
+
+    def __contains__(self, key):
+        return self.__lookup(key) is not _REMOVED
+
+    def get(self, key, default=None):
+        value = self.__lookup(key)
+        return default if value is _REMOVED else value
+
+    def setdefault(self, key, default=None):
+        value = self.__lookup(key)
+        if value is _REMOVED:
+            self[key] = value = default
+
+        return value
+
+    def pop(self, key, *default):
+        value = self.__lookup(key)
+        if value is _REMOVED:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        del self[key]
+        return value
+
+    def __setitem__(self, key, value):
+        if self.__lookup(key) is _REMOVED:
+            self._size += 1
+
+        top = self._layers[-1]
+        if key not in top:
+            self._changes += 1
+        top[key] = value
+
+    def __delitem__(self, key):
+        if self.__lookup(key) is _REMOVED:
+            raise KeyError(key)
+
+        self._size -= 1
+        top = self._layers[-1]
+        if key not in top:
+            self._changes += 1
+        top[key] = _REMOVED
+
+    def __iter__(self):
+        layers = self._layers
+        for i in range(len(layers) - 1, -1, -1):
+            above = layers[i + 1:]
+            for key, value in layers[i].items():
+                if value is not _REMOVED and \
+                        not any(key in layer for layer in above):
+                    yield key
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return 'SnapshotDict({})'.format(dict(self.items()))
+
+    def snapshot(self):
+        """Returns new SnapshotDict with the same contents. After this both
+        dicts write their changes to new private layers.
+
+        Returns:
+            New SnapshotDict.
+        """
+        layers = self._layers[:]
+        top = layers.pop()
+        if top:
+            # Merge with layers that aren't much larger so that number of
+            # layers stays logarithmic
+            while len(layers) > 1 and len(layers[-1]) <= 2 * len(top):
+                merged = dict(layers.pop())
+                merged.update(top)
+                top = merged
+            layers.append(top)
+
+        other = SnapshotDict.__new__(SnapshotDict)
+        other.default_factory = self.default_factory
+        other._size = self._size
+        other._changes = self._changes = sum(len(x) for x in layers[1:])
+        self._layers = layers + [{}]
+        other._layers = layers + [{}]
+
+        return other
+
+    def settle(self):
+        """Merges the layers to a plain dict if there are at least as many
+        changes as there are keys in the base dict.
+
+        Returns:
+            New dict, or defaultdict if default_factory is set, if the layers
+            were merged. Otherwise this object.
+        """
+        base = self._layers[0]
+        if self._changes < len(base):
+            return self
+
+        result = defaultdict(self.default_factory) if self.default_factory \
+            else {}
+        result.update(base)
+        for layer in self._layers[1:]:
+            for key, value in layer.items():
+                if value is _REMOVED:
+                    result.pop(key, None)
+                else:
+                    result[key] = value
+
+        return result
+
+    @staticmethod
+    def share(mapping):
+        """Returns two SnapshotDicts sharing the contents of given dict.
+
+        Args:
+            mapping: Dict, defaultdict or SnapshotDict. Dict and defaultdict
+                must not be modified afterwards.
+
+        Returns:
+            Tuple of two SnapshotDicts.
+        """
+        if not isinstance(mapping, SnapshotDict):
+            mapping = SnapshotDict(mapping,
+                                   getattr(mapping, 'default_factory', None))
+
+        return mapping, mapping.snapshot()
+
+    @staticmethod
+    def settled(mapping):
+        """Returns given dict, or plain dict with the same contents if it's
+        SnapshotDict that can be merged, see settle.
+
+        Args:
+            mapping: Dict, defaultdict or SnapshotDict.
+
+        Returns:
+            Dict, defaultdict or SnapshotDict.
+        """
+        if isinstance(mapping, SnapshotDict):
+            return mapping.settle()
+
+        return mapping
 
 
 class Directed(object):
@@ -30,6 +232,9 @@ class Directed(object):
         incoming: Three level dictionary of incoming edges where the first
             level key is destination vertex, second level key is source vertex
             and third level is edge properties.
+        _layered: True if any of the top level dicts is SnapshotDict.
+        _owned: Set of vertices whose adjacency dicts are not shared with
+            a snapshot, None if no adjacency dicts are shared.
     """
 
     def __init__(self):
@@ -38,6 +243,30 @@ class Directed(object):
         self.edges = {}
         self._outgoing = defaultdict(dict)
         self.incoming = defaultdict(dict)
+        self._layered = False
+        self._owned = None
+
+    def __own(self, *vertices):
+        # Merge top level dicts with enough changes back to plain dicts and
+        # copy shared adjacency dicts before they're modified
+        if self._layered:
+            self.vertices = SnapshotDict.settled(self.vertices)
+            self.edges = SnapshotDict.settled(self.edges)
+            self._outgoing = SnapshotDict.settled(self._outgoing)
+            self.incoming = SnapshotDict.settled(self.incoming)
+            self._layered = any(isinstance(x, SnapshotDict) for x in (
+                self.vertices, self.edges, self._outgoing, self.incoming))
+
+        if self._owned is not None:
+            for vertex in vertices:
+                if vertex not in self._owned:
+                    self._owned.add(vertex)
+                    # Rows are copied separately since vertex may have
+                    # only one of them
+                    if vertex in self._outgoing:
+                        self._outgoing[vertex] = dict(self._outgoing[vertex])
+                    if vertex in self.incoming:
+                        self.incoming[vertex] = dict(self.incoming[vertex])
 
     @property
     def directed(self):
@@ -48,6 +277,16 @@ class Directed(object):
         """
         return True
 
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            Always False.
+        """
+        return False
+
     def insert_vertex(self, name, **kwargs):
         """Inserts vertex to graph.
 
@@ -56,6 +295,7 @@ class Directed(object):
             **kwargs: Optional properties, if vertex already exists then given
                 properties will be used to update existing ones.
         """
+        self.__own()
         kwargs.update(self.vertices.get(name, {}))
         self.vertices[name] = kwargs
         self._outgoing.setdefault(name, {})
@@ -68,6 +308,7 @@ class Directed(object):
         Args:
             name: Name of the vertex.
         """
+        self.__own()
         del self.vertices[name]
 
         # Remove edges without copying the keys
@@ -88,8 +329,11 @@ class Directed(object):
             dest: Destination vertex.
             **kwargs: Optional properties for the edge
         """
-        self.vertices.setdefault(source, {})
-        self.vertices.setdefault(dest, {})
+        self.__own(source, dest)
+        for vertex in (source, dest):
+            self.vertices.setdefault(vertex, {})
+            self._outgoing.setdefault(vertex, {})
+            self.incoming.setdefault(vertex, {})
 
         kwargs.update(self.edges.get((source, dest), {}))
         self._outgoing[source][dest] = kwargs
@@ -103,6 +347,7 @@ class Directed(object):
             source: Source vertex.
             dest: Destination vertex.
         """
+        self.__own(source, dest)
         del self.edges[(source, dest)]
         del self._outgoing[source][dest]
         del self.incoming[dest][source]
@@ -195,3 +440,25 @@ class Directed(object):
         return other
 
     copy = __copy__
+
+    def snapshot(self):
+        """Returns a point-in-time copy of the graph that shares the
+        underlying dicts with this graph. Both graphs write changes to top
+        level dicts to private layers and copy shared adjacency dicts when
+        they're modified so changes are not visible to the other one.
+        Snapshot must be taken by the thread modifying the graph, after that
+        the snapshot may be read concurrently by other threads.
+
+        Returns:
+            New Directed graph.
+        """
+        other = Directed.__new__(Directed)
+        self.vertices, other.vertices = SnapshotDict.share(self.vertices)
+        self.edges, other.edges = SnapshotDict.share(self.edges)
+        self._outgoing, other._outgoing = SnapshotDict.share(self._outgoing)
+        self.incoming, other.incoming = SnapshotDict.share(self.incoming)
+        other._layered = self._layered = True
+        other._owned = set()
+        self._owned = set()
+
+        return other
@@ -0,0 +1,177 @@
+"""Single source shortest paths that are kept up to date when edge weights
+change. Structure starts from the result of Dijkstra's algorithm and keeps an
+index of children in the shortest path tree. When weight of an edge decreases
+the change is propagated Dijkstra style from the edge end vertex. When weight
+of a tree edge increases the subtree under it is detached, every vertex in the
+subtree gets a tentative distance from its neighbors outside of the subtree
+and Dijkstra's algorithm is run within the subtree. Increasing weight of an
+edge that is not part of the tree doesn't require any work. This is the
+approach of Ramalingam and Reps.
+
+Works with directed and undirected graphs where every edge has non-negative
+property 'weight', multigraphs are not supported.
+
+Time complexity of an update: O(A log A) where A is the number of affected
+vertices and their edges.
+"""
+from algolib.graph.dijkstra import dijkstra, dijkstra_path
+from algolib.priority_queue import PriorityQueue
+
+INF = float('inf')
+
+
+class DynamicShortestPaths(object):
+    """Shortest paths from single source vertex.
+
+    Attributes:
+        graph: Graph the paths are calculated from.
+        source: Source vertex.
+        result: Dictionary in the same format as returned by dijkstra where
+            vertices are keys and values are [distance, parent] pairs.
+        _children: {vertex: set of children} dictionary of the shortest path
+            tree.
+    """
+    def __init__(self, graph, source, result=None):
+        """Initializer, calculates shortest paths unless they're given.
+
+        Args:
+            graph: Directed or undirected graph where every edge has
+                non-negative 'weight' property.
+            source: Source vertex.
+            result: Optional result of dijkstra called with the same graph
+                and source, it's copied so caller can keep using it.
+
+        Raises:
+            ValueError: In case graph is a multigraph.
+        """
+        if graph.multigraph:
+            raise ValueError('Multigraphs are not supported')
+
+        if result is None:
+            result = dijkstra(graph, source)
+
+        self.graph = graph
+        self.source = source
+        self.result = {vertex: list(value) for vertex, value in result.items()}
+        self._children = {vertex: set() for vertex in graph.vertices}
+        for vertex, (_, parent) in self.result.items():
+            if parent is not None:
+                self._children[parent].add(vertex)
+
+    def distance(self, vertex):
+        """Returns shortest path distance from source to given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            Distance, float('inf') if vertex is not reachable.
+        """
+        return self.result[vertex][0]
+
+    def path(self, vertex):
+        """Returns shortest path from source to given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            List of vertices from source to given vertex, None if vertex is
+            not reachable.
+        """
+        return dijkstra_path(self.result, self.source, vertex)
+
+    def __incoming(self, vertex):
+        return self.graph.incoming[vertex] if self.graph.directed \
+            else self.graph[vertex]
+
+    def __set(self, vertex, distance, parent):
+        old = self.result[vertex][1]
+        if old is not None:
+            self._children[old].discard(vertex)
+        if parent is not None:
+            self._children[parent].add(vertex)
+        self.result[vertex] = [distance, parent]
+
+    def __propagate(self, queue, queued):
+        # Dijkstra's algorithm from the vertices in queue
+        result = self.result
+        while queue:
+            distance, vertex = queue.pop()
+            queued.discard(vertex)
+            for other, properties in self.graph[vertex].items():
+                distance_to_other = distance + properties['weight']
+                if distance_to_other < result[other][0]:
+                    self.__set(other, distance_to_other, vertex)
+                    if other in queued:
+                        queue.change_priority(distance_to_other, other)
+                    else:
+                        queue.push(distance_to_other, other)
+                        queued.add(other)
+
+    def __decrease(self, x, y, weight):
+        distance = self.result[x][0] + weight
+        if distance < self.result[y][0]:
+            self.__set(y, distance, x)
+            self.__propagate(PriorityQueue([(distance, y)]), {y})
+
+    def __increase(self, y):
+        # Collect subtree under y and detach it
+        subtree = [y]
+        for vertex in subtree:
+            subtree.extend(self._children[vertex])
+        affected = set(subtree)
+        for vertex in subtree:
+            self.__set(vertex, INF, None)
+
+        # Find best parent outside of the subtree for every affected vertex
+        queue = PriorityQueue()
+        queued = set()
+        for vertex in subtree:
+            best = INF
+            parent = None
+            for other, properties in self.__incoming(vertex).items():
+                if other not in affected:
+                    distance = self.result[other][0] + properties['weight']
+                    if distance < best:
+                        best = distance
+                        parent = other
+
+            if parent is not None:
+                self.__set(vertex, best, parent)
+                queue.push(best, vertex)
+                queued.add(vertex)
+
+        self.__propagate(queue, queued)
+
+    def update_weight(self, x, y, weight):
+        """Changes weight of an edge and updates the shortest paths. Edge is
+        reinserted to the graph with a copy of its properties where weight is
+        changed, properties dictionary isn't modified in place since it may be
+        shared with snapshots of the graph.
+
+        Args:
+            x: Edge source vertex.
+            y: Edge destination vertex.
+            weight: New non-negative weight.
+
+        Raises:
+            KeyError: In case edge doesn't exist.
+            ValueError: In case weight is negative.
+        """
+        if weight < 0:
+            raise ValueError('Weight must be non-negative')
+
+        properties = self.graph[x][y]
+        old = properties['weight']
+        self.graph.remove_edge(x, y)
+        self.graph.insert_edge(x, y, **dict(properties, weight=weight))
+        pairs = [(x, y)] if self.graph.directed else [(x, y), (y, x)]
+
+        if weight < old:
+            for source, dest in pairs:
+                self.__decrease(source, dest, weight)
+        elif weight > old:
+            for source, dest in pairs:
+                if self.result[dest][1] == source:
+                    self.__increase(dest)
@@ -1,5 +1,5 @@
 """Edmonds-Karp algorithm for finding maximum flow over a graph. Works on both
-directed and undirected graphs.
+directed and undirected graphs, including multigraphs.
 Time complexity: O(VE^2)
 
 For more information see Wikipedia:
@@ -9,6 +9,7 @@ from collections import deque
 from itertools import tee
 from algolib.graph.bfs import BFS
 from algolib.graph.directed import Directed
+from algolib.graph.stats import phase
 
 
 def __process_edge(graph, _dfs, source, dest, _edge):
@@ -25,25 +26,33 @@ def __pairwise(it):
 def __initialize_result(graph):
     # Generate a flow graph where every edge has initial flow of 0
     # and opposing edge with capacity 0. More units can flow through an edge
-    # as long as capacity > 0.
-    if graph.directed:
-        result = graph.copy()
-        # Iterate over source graph since we're changing the result that can't
-        # be done while iterating and they have same edges anyway
-        for x, y in graph.edges.keys():
-            result.edges[(x, y)]['flow'] = 0
-            if x not in result[y]:
-                result.insert_edge(y, x, flow=0, capacity=0)
-    else:
-        result = Directed()
-        for (x, y), properties in graph.edges.items():
-            result.insert_edge(x, y, flow=0, capacity=properties['capacity'])
-            result.insert_edge(y, x, flow=0, capacity=properties['capacity'])
+    # as long as capacity > 0. Undirected edges are seen from both ends so
+    # they get capacity in both directions and capacities of parallel edges
+    # are summed up. Edges of simple directed graph keep their properties.
+    result = Directed()
+    for vertex, properties in graph.vertices.items():
+        result.insert_vertex(vertex, **properties)
+
+    edges = graph.edges
+    keep = graph.directed and not graph.multigraph
+    for vertex in graph.vertices:
+        for edge, other in graph.edges_from(vertex):
+            if other not in result[vertex]:
+                result.insert_edge(vertex, other, flow=0, capacity=0)
+            properties = result[vertex][other]
+            capacity = properties['capacity'] + edges[edge]['capacity']
+            if keep:
+                properties.update(edges[edge])
+                properties['flow'] = 0
+            properties['capacity'] = capacity
+
+            if vertex not in result[other]:
+                result.insert_edge(other, vertex, flow=0, capacity=0)
 
     return result
 
 
-def edmonds_karp(graph, source, destination):
+def edmonds_karp(graph, source, destination, stats=None):
     """Find maximum flow between two vertices in a weighted graph.
 
     Args:
@@ -51,22 +60,46 @@ def edmonds_karp(graph, source, destination):
             'capacity' that indicates how many units may flow through it.
         source: Source vertex.
         destination: Destination vertex.
+        stats: Optional Stats object to fill, iterations is the number of
+            augmenting paths found.
 
     Returns:
         Tuple (flow graph, total flow) where flow graph is directed weighted
         graph that indicates the flow in the original graph. Every edge in
         the flow graph has property 'flow' which is positive integer that
-        represents the flow through the edge.
+        represents the flow through the edge and property 'capacity' which
+        is the residual capacity. Edges of a simple directed graph keep
+        their other properties, with undirected graphs and multigraphs only
+        flow and capacity are set. With multigraphs flow between two
+        vertices is the total flow over all the parallel edges.
     """
-    result = __initialize_result(graph)
+    with phase(stats, 'initialize'):
+        result = __initialize_result(graph)
 
     if source == destination:
         return result, float('inf')
 
+    with phase(stats, 'search'):
+        total = __augment(result, source, destination, stats)
+
+    # Sanitize the result by removing edges which don't have any flow
+    remove = {edge for edge, properties in result.edges.items()
+              if not properties['flow']}
+
+    for edge in remove:
+        result.remove_edge(*edge)
+
+    return result, total
+
+
+def __augment(result, source, destination, stats):
+    # Add flow along shortest augmenting paths until there are none left,
+    # returns total flow
     total = 0
+    paths = 0
     while True:
         # Find shortest augmenting path with BFS
-        bfs = BFS(result, process_edge=__process_edge)
+        bfs = BFS(result, process_edge=__process_edge, stats=stats)
         bfs.execute(source)
 
         # Generate path from BFS result
@@ -105,11 +138,9 @@ def edmonds_karp(graph, source, destination):
                 result[x][y]['flow'] = volume - result[y][x]['flow']
                 result[y][x]['flow'] = 0
 
-    # Sanitize the result by removing edges which don't have any flow
-    remove = {edge for edge, properties in result.edges.items()
-              if not properties['flow']}
+        paths += 1
 
-    for edge in remove:
-        result.remove_edge(*edge)
+    if stats is not None:
+        stats.iterations += paths
 
-    return result, total
+    return total
@@ -0,0 +1,77 @@
+"""k-core decomposition. k-core is the maximal subgraph where every vertex has
+at least k neighbors within the subgraph and core number of a vertex is the
+largest k for which the vertex belongs to k-core. Implementation uses the
+bucket algorithm by Batagelj and Zaversnik which repeatedly removes vertex
+with minimum degree. Edge directions, loops and parallel edges are ignored.
+
+Time complexity: O(V + E)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Degeneracy_(graph_theory)
+"""
+from algolib.graph.neighbors import neighbor_set
+from algolib.graph.view import induced_subgraph
+
+
+def core_number(graph):
+    """Calculates core number of every vertex.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+
+    Returns:
+        Dictionary where keys are vertices and values are core numbers.
+    """
+    neighbors = {vertex: neighbor_set(graph, vertex)
+                 for vertex in graph.vertices}
+    degree = {vertex: len(n) for vertex, n in neighbors.items()}
+    if not degree:
+        return {}
+
+    # Sort vertices by degree with bucket sort, position of vertex in order
+    # and start index of every degree in order are maintained when degrees
+    # are decreased
+    max_degree = max(degree.values())
+    start = [0] * (max_degree + 2)
+    for d in degree.values():
+        start[d + 1] += 1
+    for d in range(1, max_degree + 2):
+        start[d] += start[d - 1]
+
+    order = [None] * len(degree)
+    position = {}
+    fill = list(start)
+    for vertex, d in degree.items():
+        position[vertex] = fill[d]
+        order[fill[d]] = vertex
+        fill[d] += 1
+
+    for vertex in order:
+        for other in neighbors[vertex]:
+            d = degree[other]
+            if d > degree[vertex]:
+                # Move other to the start of its bucket and decrease degree
+                first = order[start[d]]
+                if first != other:
+                    pos = position[other]
+                    order[start[d]], order[pos] = other, first
+                    position[other], position[first] = start[d], pos
+                start[d] += 1
+                degree[other] = d - 1
+
+    return degree
+
+
+def k_core(graph, k, core=None):
+    """Returns k-core of a graph.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+        k: Minimum number of neighbors.
+        core: Optional result of core_number, calculated if not given.
+
+    Returns:
+        GraphView containing vertices of the k-core and edges between them.
+    """
+    core = core if core is not None else core_number(graph)
+    return induced_subgraph(graph, (v for v, c in core.items() if c >= k))
@@ -0,0 +1,121 @@
+"""Yen's algorithm for finding k shortest loopless paths between two vertices
+in weighted graph. Every new path deviates from one of the already found paths
+at a spur vertex. Spur paths are searched from views of the graph that hide
+the root path vertices and the edges used by found paths sharing the same
+root, so the graph itself is never modified. Only spur vertices at or after
+the point where the latest path deviated from its parent are examined
+(Lawler's modification) and shortest path tree towards the target is used as
+a spur path whenever it avoids the hidden vertices and edges.
+
+Works with directed and undirected graphs where every edge has non-negative
+property 'weight', multigraphs are not supported.
+
+Time complexity: O(K * V * E log V)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Yen%27s_algorithm
+"""
+from algolib.graph.dijkstra import dijkstra, dijkstra_path
+from algolib.graph.view import GraphView, reversed_graph
+from algolib.priority_queue import PriorityQueue
+
+INF = float('inf')
+
+
+def __spur_path(graph, tree, spur, target, hidden_vertices, hidden_edges):
+    # Returns tuple (path, distances) from spur to target where distances
+    # are distances from spur, None if target is not reachable
+    path = dijkstra_path(tree, target, spur)
+    if path is not None:
+        path.reverse()
+        if (path[0], path[1]) not in hidden_edges and \
+                hidden_vertices.isdisjoint(path):
+            return path, [tree[spur][0] - tree[v][0] for v in path]
+
+    directed = graph.directed
+
+    def edge_ok(x, y, _):
+        return (x, y) not in hidden_edges and \
+            (directed or (y, x) not in hidden_edges)
+
+    view = GraphView(graph, vertex_filter=lambda v: v not in hidden_vertices,
+                     edge_filter=edge_ok)
+    result = dijkstra(view, spur, target)
+    path = dijkstra_path(result, spur, target)
+    if path is None:
+        return None
+
+    return path, [result[v][0] for v in path]
+
+
+def k_shortest_paths(graph, source, target):
+    """Generates loopless paths from source to target in order of increasing
+    distance. Paths are searched lazily as the result is iterated.
+
+    Args:
+        graph: Directed or undirected graph or a view where each edge has
+            non-negative 'weight' property.
+        source: Source vertex.
+        target: Target vertex.
+
+    Returns:
+        Iterator yielding tuples (distance, path) where path is list of
+        vertices from source to target, both ends included.
+
+    Raises:
+        ValueError: In case graph is a multigraph.
+    """
+    if graph.multigraph:
+        raise ValueError('Multigraphs are not supported')
+
+    return __generate(graph, source, target)
+
+
+def __generate(graph, source, target):
+    # Shortest path tree towards target, tree[v] = [distance to target,
+    # next vertex on the path]
+    tree = dijkstra(reversed_graph(graph) if graph.directed else graph,
+                    target)
+    if tree[source][0] == INF:
+        return
+
+    path = dijkstra_path(tree, target, source)[::-1]
+    distances = [tree[source][0] - tree[v][0] for v in path]
+
+    # Found paths, candidates are kept in queue keyed by path tuple and
+    # candidates maps path tuple to (distances, deviation index)
+    found = []
+    candidates = {}
+    queue = PriorityQueue()
+    deviation = 0
+
+    while True:
+        found.append(path)
+        yield distances[-1], path
+
+        for i in range(deviation, len(path) - 1):
+            spur = path[i]
+            root = path[:i + 1]
+            hidden_edges = {(p[i], p[i + 1]) for p in found
+                            if len(p) > i + 1 and p[:i + 1] == root}
+            hidden_vertices = frozenset(root[:-1])
+
+            spur_result = __spur_path(graph, tree, spur, target,
+                                      hidden_vertices, hidden_edges)
+            if spur_result is None:
+                continue
+
+            spur_path, spur_distances = spur_result
+            key = tuple(root + spur_path[1:])
+            if key not in candidates:
+                candidate_distances = distances[:i] + \
+                    [distances[i] + d for d in spur_distances]
+                candidates[key] = (candidate_distances, i)
+                queue.push(candidate_distances[-1], key)
+
+        if not queue:
+            return
+
+        _, key = queue.pop()
+        path = list(key)
+        distances, deviation = candidates[key]
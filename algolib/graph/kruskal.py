@@ -3,25 +3,34 @@ weighted graph. For sparse graphs the algorithm is faster than Prim's.
 Time complexity: O(E log E) which comes from sorting the edges at the
 beginning.
 """
-from algolib.disjoint_set import DisjointSet
+from algolib.disjoint_set import IntDisjointSet
+from algolib.graph.stats import phase
 
 
-def kruskal(graph):
+def kruskal(graph, stats=None):
     """Find minimum spanning tree from undirected weighted graph.
 
     Args:
         graph: Undirected graph where each edge has 'weight' property.
+        stats: Optional Stats object to fill.
 
     Returns:
         List of edges in minimum spanning tree.
     """
-    edges = sorted(graph.edges, key=lambda x: graph[x[0]][x[1]]['weight'])
-    components = DisjointSet(graph.vertices)
-    result = []
-
-    for edge in edges:
-        if not components.same_component(*edge):
-            components.union(*edge)
-            result.append(edge)
+    with phase(stats, 'sort'):
+        edges = sorted(graph.edges, key=lambda x: graph[x[0]][x[1]]['weight'])
+
+    with phase(stats, 'search'):
+        index = {vertex: i for i, vertex in enumerate(graph.vertices)}
+        components = IntDisjointSet(len(index))
+        result = []
+
+        for edge in edges:
+            if components.union(index[edge[0]], index[edge[1]]):
+                result.append(edge)
+
+    if stats is not None:
+        stats.edges_scanned += len(edges)
+        stats.edges_relaxed += len(result)
 
     return result
@@ -0,0 +1,208 @@
+"""Landmark based distance oracle for approximate shortest path distances.
+Shortest path distances from a small set of landmark vertices to every vertex
+(and from every vertex to landmarks with directed graphs) are precomputed with
+Dijkstra's algorithm and stored in compact float arrays. Distance between any
+two vertices is then bounded from both sides with triangle inequality.
+Landmarks are selected with farthest point heuristic which starts from the
+vertex with most edges and then picks the vertex farthest away from the already
+selected landmarks.
+
+Time complexity where k is number of landmarks:
+- creation: O(k * E log V)
+- query: O(k)
+
+Memory usage: 8 * k * V bytes for undirected and 16 * k * V for directed graphs
+"""
+from array import array
+import pickle
+from algolib.graph.dijkstra import dijkstra
+from algolib.graph.view import reversed_graph
+from algolib.priority_queue import PriorityQueue
+
+INF = float('inf')
+
+
+def _distances(graph, source, vertices, queue_constructor):
+    result = dijkstra(graph, source, queue_constructor=queue_constructor)
+    return array('d', (result[vertex][0] for vertex in vertices))
+
+
+class DistanceOracle(object):
+    """Distance oracle that gives lower and upper bounds of shortest path
+    distances between vertices.
+
+    Attributes:
+        landmarks: List of landmark vertices.
+        directed: True if oracle was built from directed graph.
+        _index: {vertex: index} dictionary.
+        _from: List of arrays where _from[i][j] is distance from landmark i to
+            vertex with index j.
+        _to: List of arrays where _to[i][j] is distance from vertex with index
+            j to landmark i. Same as _from with undirected graphs.
+    """
+    def __init__(self, graph, k, landmarks=None,
+                 queue_constructor=PriorityQueue):
+        """Initializer, selects landmarks and calculates the distances.
+
+        Args:
+            graph: Graph where every edge has 'weight' property.
+            k: Number of landmarks to select.
+            landmarks: Optional iterable of landmarks to use, if given then k
+                is ignored.
+            queue_constructor: Optional priority queue constructor passed
+                to dijkstra.
+        """
+        vertices = list(graph.vertices)
+        self.directed = graph.directed
+        self._index = {vertex: i for i, vertex in enumerate(vertices)}
+        self._from = []
+        self._to = []
+
+        if self.directed:
+            reverse = reversed_graph(graph)
+        if landmarks is not None:
+            landmarks = list(landmarks)
+            k = len(landmarks)
+        else:
+            k = min(k, len(vertices))
+
+        # Minimum distance between selected landmarks and every vertex, used
+        # to pick the next landmark
+        self.landmarks = []
+        closest = [INF] * len(vertices)
+        for i in range(k):
+            if landmarks is not None:
+                landmark = landmarks[i]
+            else:
+                landmark = self.__next_landmark(graph, vertices, closest)
+
+            self.landmarks.append(landmark)
+            self._from.append(_distances(graph, landmark, vertices,
+                                         queue_constructor))
+            if self.directed:
+                self._to.append(_distances(reverse, landmark, vertices,
+                                           queue_constructor))
+            else:
+                self._to.append(self._from[-1])
+
+            closest = [min(x, y, z) for x, y, z in
+                       zip(closest, self._from[-1], self._to[-1])]
+
+    def __next_landmark(self, graph, vertices, closest):
+        if not self.landmarks:
+            if graph.directed:
+                return max(vertices, key=lambda v: graph.degree_in(v) +
+                           graph.degree_out(v))
+            return max(vertices, key=graph.degree)
+
+        # Farthest vertex that is connected to the landmarks, in case there
+        # are unconnected vertices pick one of them to cover new component
+        chosen = set(self.landmarks)
+        best = None
+        for i, vertex in enumerate(vertices):
+            if vertex in chosen:
+                continue
+            if closest[i] == INF:
+                return vertex
+            if best is None or closest[i] > closest[best]:
+                best = i
+
+        return vertices[best]
+
+    def lower_bound(self, source, dest):
+        """Returns lower bound of the shortest path distance.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            Lower bound, float('inf') if destination is known to be
+            unreachable from source.
+        """
+        if source == dest:
+            return 0
+
+        i = self._index[source]
+        j = self._index[dest]
+        result = 0
+        for dist_from, dist_to in zip(self._from, self._to):
+            # d(l, dest) <= d(l, source) + d(source, dest)
+            if dist_from[i] != INF:
+                result = max(result, dist_from[j] - dist_from[i])
+            # d(source, l) <= d(source, dest) + d(dest, l)
+            if dist_to[j] != INF:
+                result = max(result, dist_to[i] - dist_to[j])
+
+        return result
+
+    def upper_bound(self, source, dest):
+        """Returns upper bound of the shortest path distance.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            Upper bound, float('inf') if no path through landmarks exists.
+        """
+        if source == dest:
+            return 0
+
+        i = self._index[source]
+        j = self._index[dest]
+        return min([dist_to[i] + dist_from[j]
+                    for dist_from, dist_to in zip(self._from, self._to)] +
+                   [INF])
+
+    def bounds(self, source, dest):
+        """Returns lower and upper bound of the shortest path distance.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            Tuple (lower bound, upper bound).
+        """
+        return self.lower_bound(source, dest), self.upper_bound(source, dest)
+
+    def save(self, path):
+        """Saves the oracle to a file.
+
+        Args:
+            path: File path.
+        """
+        data = {
+            'vertices': sorted(self._index, key=self._index.get),
+            'landmarks': self.landmarks,
+            'directed': self.directed,
+            'from': [x.tobytes() for x in self._from],
+            'to': [x.tobytes() for x in self._to] if self.directed else None
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Loads oracle from a file written by save. File is read with pickle
+        so it must come from a trusted source.
+
+        Args:
+            path: File path.
+
+        Returns:
+            DistanceOracle object.
+        """
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+
+        result = cls.__new__(cls)
+        result.landmarks = data['landmarks']
+        result.directed = data['directed']
+        result._index = {v: i for i, v in enumerate(data['vertices'])}
+        result._from = [array('d', x) for x in data['from']]
+        result._to = [array('d', x) for x in data['to']] \
+            if result.directed else result._from
+
+        return result
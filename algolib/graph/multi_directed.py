@@ -0,0 +1,334 @@
+"""Directed graph that may contain multiple edges between the same vertices and
+loops. Every edge is identified by an integer id returned when the edge is
+inserted. Endpoints and properties of the edges are stored in flat lists
+indexed by edge id and ids of removed edges are reused so the lists stay
+compact. Adjacency dicts map edge id to the vertex on the other end.
+
+Time complexity of the operations:
+- check if edge (x, y) exists: O(out degree of x)
+- check degree of vertex: O(1)
+- insert/delete edge: O(1)
+- insert vertex: O(1)
+- delete vertex: O(number of connected edges)
+- iterate vertices/edges: O(n)
+
+Algorithms which access edges only through edges_from and edges, like BFS,
+DFS, dijkstra and edmonds_karp, work with multigraphs.
+"""
+from collections import defaultdict
+from collections.abc import Mapping
+
+
+class EdgeTable(Mapping):
+    """Dictionary-like storage of edges where keys are integer edge ids and
+    values are dictionary of edge properties.
+
+    Attributes:
+        _source: List of first endpoints indexed by edge id.
+        _dest: List of second endpoints indexed by edge id.
+        _properties: List of property dicts indexed by edge id, None if edge
+            with the id doesn't exist.
+        _free: List of ids of removed edges that can be reused.
+    """
+    def __init__(self):
+        """Initializer, initializes empty table."""
+        self._source = []
+        self._dest = []
+        self._properties = []
+        self._free = []
+
+    def insert(self, source, dest, properties):
+        """Inserts edge to table.
+
+        Args:
+            source: First endpoint.
+            dest: Second endpoint.
+            properties: Dictionary of edge properties.
+
+        Returns:
+            Edge id.
+        """
+        if self._free:
+            edge = self._free.pop()
+            self._source[edge] = source
+            self._dest[edge] = dest
+            self._properties[edge] = properties
+        else:
+            edge = len(self._properties)
+            self._source.append(source)
+            self._dest.append(dest)
+            self._properties.append(properties)
+
+        return edge
+
+    def remove(self, edge):
+        """Removes edge from table.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            Tuple (source, dest) of removed edge endpoints.
+
+        Raises:
+            KeyError: In case edge doesn't exist.
+        """
+        if self.get(edge) is None:
+            raise KeyError(edge)
+
+        result = self._source[edge], self._dest[edge]
+        self._source[edge] = self._dest[edge] = self._properties[edge] = None
+        self._free.append(edge)
+
+        return result
+
+    def endpoints(self, edge):
+        """Returns endpoints of given edge.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            Tuple (source, dest).
+
+        Raises:
+            KeyError: In case edge doesn't exist.
+        """
+        if self.get(edge) is None:
+            raise KeyError(edge)
+
+        return self._source[edge], self._dest[edge]
+
+    def __getitem__(self, item):
+        try:
+            result = self._properties[item] if item >= 0 else None
+        except (IndexError, TypeError):
+            raise KeyError(item)
+
+        if result is None:
+            raise KeyError(item)
+
+        return result
+
+    def __iter__(self):
+        for edge, properties in enumerate(self._properties):
+            if properties is not None:
+                yield edge
+
+    def __len__(self):
+        return len(self._properties) - len(self._free)
+
+
+class MultiDirected(object):
+    """Directed graph which may contain loops and multiple edges.
+
+    Attributes:
+        vertices: Dictionary of vertices where keys are vertex names and
+            values are dictionary of vertex properties.
+        edges: EdgeTable where keys are edge ids and values are dictionary of
+            edge properties.
+        _outgoing: Two level dictionary of outgoing edges where the first
+            level key is source vertex, second level key is edge id and value
+            is destination vertex.
+        incoming: Two level dictionary of incoming edges where the first
+            level key is destination vertex, second level key is edge id and
+            value is source vertex.
+    """
+
+    def __init__(self):
+        """Initializer, initializes empty graph."""
+        self.vertices = {}
+        self.edges = EdgeTable()
+        self._outgoing = defaultdict(dict)
+        self.incoming = defaultdict(dict)
+
+    @property
+    def directed(self):
+        """Returns boolean value telling if graph is directed or not.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    def insert_vertex(self, name, **kwargs):
+        """Inserts vertex to graph.
+
+        Args:
+            name: Vertex name, any hashable object
+            **kwargs: Optional properties, if vertex already exists then given
+                properties will be used to update existing ones.
+        """
+        kwargs.update(self.vertices.get(name, {}))
+        self.vertices[name] = kwargs
+        self._outgoing.setdefault(name, {})
+        self.incoming.setdefault(name, {})
+
+    def remove_vertex(self, name):
+        """Removes vertex from graph. Removes also all the edges the vertex
+        is part of.
+
+        Args:
+            name: Name of the vertex.
+        """
+        del self.vertices[name]
+
+        # Remove edges without copying the keys
+        while self._outgoing[name]:
+            self.remove_edge(next(iter(self._outgoing[name])))
+
+        while self.incoming[name]:
+            self.remove_edge(next(iter(self.incoming[name])))
+
+        del self._outgoing[name]
+        del self.incoming[name]
+
+    def insert_edge(self, source, dest, **kwargs):
+        """Inserts new edge to graph. If vertices don't exist they are created.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+            **kwargs: Optional properties for the edge
+
+        Returns:
+            Id of the new edge.
+        """
+        self.vertices.setdefault(source, {})
+        self.vertices.setdefault(dest, {})
+
+        edge = self.edges.insert(source, dest, kwargs)
+        self._outgoing[source][edge] = dest
+        self.incoming[dest][edge] = source
+
+        return edge
+
+    def remove_edge(self, edge):
+        """Removes edge from graph.
+
+        Args:
+            edge: Edge id.
+        """
+        source, dest = self.edges.remove(edge)
+        del self._outgoing[source][edge]
+        del self.incoming[dest][edge]
+
+    def endpoints(self, edge):
+        """Returns endpoints of given edge.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            Tuple (source, dest).
+        """
+        return self.edges.endpoints(edge)
+
+    def connected(self, source, dest):
+        """Returns boolean value telling if given vertices are connected by
+        at least one edge.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            True if vertices are connected by edge, False if not
+        """
+        return next(self.edges_between(source, dest), None) is not None
+
+    def edges_between(self, source, dest):
+        """Returns iterator iterating over edges between given nodes.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            Iterator iterating over ids of the edges between given vertices.
+        """
+        for edge, other in self._outgoing[source].items():
+            if other == dest:
+                yield edge
+
+    def edges_from(self, vertex):
+        """Returns iterator iterating over all the outgoing edges of given
+        vertex.
+
+        Args:
+            vertex: Edge start vertex.
+
+        Returns:
+            Iterator iterating over all the outgoing edges of given vertex.
+            Iterator returns (edge id, destination vertex) tuples where edge
+            id can be used to index MultiDirected.edges.
+        """
+        return iter(self._outgoing[vertex].items())
+
+    def __getitem__(self, item):
+        return self._outgoing[item]
+
+    def degree_in(self, vertex):
+        """Returns in degree of given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            In degree.
+        """
+        return len(self.incoming[vertex])
+
+    def degree_out(self, vertex):
+        """Returns out degree of given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            Out degree.
+        """
+        return len(self._outgoing[vertex])
+
+    def __eq__(self, other):
+        return isinstance(other, MultiDirected) and \
+               self.vertices == other.vertices and \
+               dict(self.edges.items()) == dict(other.edges.items()) and \
+               all(self.endpoints(e) == other.endpoints(e) for e in self.edges)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __copy__(self):
+        other = MultiDirected()
+        for vertex, properties in self.vertices.items():
+            other.insert_vertex(vertex, **properties)
+
+        # Copy the lists directly so that edge ids stay the same
+        # pylint: disable=protected-access
+        table = other.edges
+        table._source = list(self.edges._source)
+        table._dest = list(self.edges._dest)
+        table._properties = [p if p is None else dict(p)
+                             for p in self.edges._properties]
+        table._free = list(self.edges._free)
+        # pylint: enable=protected-access
+
+        for edge in table:
+            source, dest = table.endpoints(edge)
+            other._outgoing[source][edge] = dest
+            other.incoming[dest][edge] = source
+
+        return other
+
+    copy = __copy__
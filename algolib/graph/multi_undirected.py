@@ -0,0 +1,226 @@
+"""Undirected graph that may contain multiple edges between the same vertices
+and loops. Every edge is identified by an integer id returned when the edge is
+inserted. Endpoints and properties of the edges are stored in flat lists
+indexed by edge id and ids of removed edges are reused so the lists stay
+compact. Adjacency dicts map edge id to the vertex on the other end.
+
+Time complexity of the operations:
+- check if edge (x, y) exists: O(degree of x)
+- check degree of vertex: O(1)
+- insert/delete edge: O(1)
+- insert vertex: O(1)
+- delete vertex: O(number of connected edges)
+- iterate vertices/edges: O(n)
+
+Algorithms which access edges only through edges_from and edges, like BFS,
+DFS, dijkstra and edmonds_karp, work with multigraphs.
+"""
+from collections import defaultdict
+from algolib.graph.multi_directed import EdgeTable
+
+
+class MultiUndirected(object):
+    """Undirected graph which may contain loops and multiple edges.
+
+    Attributes:
+        vertices: Dictionary of vertices where keys are vertex names and
+            values are dictionary of vertex properties.
+        edges: EdgeTable where keys are edge ids and values are dictionary of
+            edge properties.
+        _neighbors: Two level dictionary where first level keys are vertices,
+            second level keys are edge ids and values are vertices on the
+            other end of the edge. Loops are stored only once.
+        _loops: Dictionary of vertices that have loops where values are number
+            of loops.
+    """
+
+    def __init__(self):
+        """Initializer, initializes empty graph."""
+        self.vertices = {}
+        self.edges = EdgeTable()
+        self._neighbors = defaultdict(dict)
+        self._loops = defaultdict(int)
+
+    @property
+    def directed(self):
+        """Returns boolean value telling if graph is directed or not.
+
+        Returns:
+            Always False.
+        """
+        return False
+
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    def insert_vertex(self, name, **kwargs):
+        """Inserts vertex to graph.
+
+        Args:
+            name: Vertex name, any hashable object
+            **kwargs: Optional properties, if vertex already exists then given
+                properties will be used to update existing ones.
+        """
+        kwargs.update(self.vertices.get(name, {}))
+        self.vertices[name] = kwargs
+        self._neighbors.setdefault(name, {})
+
+    def remove_vertex(self, name):
+        """Removes vertex from graph. Removes also all the edges the vertex
+        is part of.
+
+        Args:
+            name: Name of the vertex.
+        """
+        del self.vertices[name]
+
+        # Iterate over edges without copying
+        while self._neighbors[name]:
+            self.remove_edge(next(iter(self._neighbors[name])))
+
+        del self._neighbors[name]
+
+    def insert_edge(self, x, y, **kwargs):
+        """Inserts new edge to graph. If vertices don't exist they are created.
+
+        Args:
+            x: First vertex.
+            y: Second vertex.
+            **kwargs: Optional properties for the edge
+
+        Returns:
+            Id of the new edge.
+        """
+        self.vertices.setdefault(x, {})
+        self.vertices.setdefault(y, {})
+
+        edge = self.edges.insert(x, y, kwargs)
+        self._neighbors[x][edge] = y
+        self._neighbors[y][edge] = x
+        if x == y:
+            self._loops[x] += 1
+
+        return edge
+
+    def remove_edge(self, edge):
+        """Removes edge from graph.
+
+        Args:
+            edge: Edge id.
+        """
+        x, y = self.edges.remove(edge)
+        del self._neighbors[x][edge]
+
+        if x != y:
+            del self._neighbors[y][edge]
+        else:
+            self._loops[x] -= 1
+            if not self._loops[x]:
+                del self._loops[x]
+
+    def endpoints(self, edge):
+        """Returns endpoints of given edge.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            Tuple (x, y) in the order given when edge was inserted.
+        """
+        return self.edges.endpoints(edge)
+
+    def connected(self, x, y):
+        """Returns boolean value telling if given vertices are connected by
+        at least one edge.
+
+        Args:
+            x: First vertex.
+            y: Second vertex.
+
+        Returns:
+            True if vertices are connected by edge, False if not
+        """
+        return next(self.edges_between(x, y), None) is not None
+
+    def edges_between(self, x, y):
+        """Returns iterator iterating over edges between given nodes.
+
+        Args:
+            x: First vertex.
+            y: Second vertex.
+
+        Returns:
+            Iterator iterating over ids of the edges between given vertices.
+        """
+        for edge, other in self._neighbors[x].items():
+            if other == y:
+                yield edge
+
+    def edges_from(self, vertex):
+        """Returns iterator iterating over all the edges connected to given
+        vertex.
+
+        Args:
+            vertex: Edge endpoint.
+
+        Returns:
+            Iterator iterating over all the edges connecting given vertex.
+            Iterator returns (edge id, connected vertex) tuples where edge id
+            can be used to index MultiUndirected.edges.
+        """
+        return iter(self._neighbors[vertex].items())
+
+    def __getitem__(self, item):
+        return self._neighbors[item]
+
+    def degree(self, vertex):
+        """Returns degree of given vertex.
+
+        Args:
+            vertex: Vertex who's degree is queried.
+
+        Returns:
+            Vertex degree, note that every loop is considered as degree of 2.
+        """
+        return len(self._neighbors[vertex]) + self._loops.get(vertex, 0)
+
+    def __eq__(self, other):
+        return isinstance(other, MultiUndirected) and \
+               self.vertices == other.vertices and \
+               dict(self.edges.items()) == dict(other.edges.items()) and \
+               all(self.endpoints(e) == other.endpoints(e) for e in self.edges)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __copy__(self):
+        other = MultiUndirected()
+        for vertex, properties in self.vertices.items():
+            other.insert_vertex(vertex, **properties)
+
+        # Copy the lists directly so that edge ids stay the same
+        # pylint: disable=protected-access
+        table = other.edges
+        table._source = list(self.edges._source)
+        table._dest = list(self.edges._dest)
+        table._properties = [p if p is None else dict(p)
+                             for p in self.edges._properties]
+        table._free = list(self.edges._free)
+        # pylint: enable=protected-access
+
+        for edge in table:
+            x, y = table.endpoints(edge)
+            other._neighbors[x][edge] = y
+            other._neighbors[y][edge] = x
+
+        other._loops.update(self._loops)
+        return other
+
+    copy = __copy__
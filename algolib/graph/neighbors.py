@@ -0,0 +1,26 @@
+"""Helpers for algorithms that treat any graph as a simple undirected one."""
+
+
+def neighbor_set(graph, vertex):
+    """Returns neighbors of a vertex ignoring edge directions, loops and
+    parallel edges.
+
+    Args:
+        graph: Graph or a view of it, may be a multigraph.
+        vertex: Vertex whose neighbors to return.
+
+    Returns:
+        Set of vertices connected to given vertex, never contains the vertex
+        itself.
+    """
+    if graph.multigraph:
+        result = set(graph[vertex].values())
+        if graph.directed:
+            result.update(graph.incoming[vertex].values())
+    else:
+        result = set(graph[vertex])
+        if graph.directed:
+            result.update(graph.incoming[vertex])
+
+    result.discard(vertex)
+    return result
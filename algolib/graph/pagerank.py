@@ -0,0 +1,212 @@
+"""PageRank with power iteration. Before iterating the graph is converted to a
+compressed sparse row (CSR) index where vertices are integers and incoming
+edges of every vertex are stored as a slice of a single array. Iteration stops
+when the L1 change between iterations drops below given tolerance. In case
+NumPy is installed the updates are vectorized, otherwise pure Python is used.
+Works on directed and undirected graphs and on multigraphs where parallel
+edges increase the weight of the link.
+
+Time complexity: O(V + E) per iteration
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/PageRank
+"""
+from array import array
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def __sources(graph, vertex):
+    # Vertices having an edge to given vertex, parallel edges are repeated
+    if graph.directed:
+        row = graph.incoming[vertex]
+    else:
+        row = graph[vertex]
+
+    return row.values() if graph.multigraph else row
+
+
+def __csr_index(graph):
+    # Returns tuple (vertices, offsets, sources, out degree) where incoming
+    # edges of vertex i are sources[offsets[i]:offsets[i + 1]]
+    vertices = list(graph.vertices)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    offsets = array('l', [0])
+    sources = array('l')
+    out_degree = array('l', [0]) * len(vertices)
+
+    for vertex in vertices:
+        for other in __sources(graph, vertex):
+            i = index[other]
+            sources.append(i)
+            out_degree[i] += 1
+        offsets.append(len(sources))
+
+    return vertices, offsets, sources, out_degree
+
+
+def __teleport(graph, vertices, personalization):
+    # Probability distribution of random jumps
+    if personalization is None:
+        return [1.0 / len(vertices)] * len(vertices)
+
+    for vertex, weight in personalization.items():
+        if vertex not in graph.vertices:
+            raise ValueError('Personalization vertex {} is not in the graph'
+                             .format(vertex))
+        if weight < 0:
+            raise ValueError('Personalization weight must be non-negative')
+
+    total = float(sum(personalization.values()))
+    if total <= 0:
+        raise ValueError('Personalization must have positive total weight')
+
+    return [personalization.get(vertex, 0) / total for vertex in vertices]
+
+
+def __iterate_python(index, damping, teleport, max_iterations):
+    _, offsets, sources, out_degree = index
+    n = len(teleport)
+    dangling = [i for i in range(n) if not out_degree[i]]
+    inverse = [1.0 / d if d else 0.0 for d in out_degree]
+    rank = list(teleport)
+
+    for _ in range(max_iterations):
+        contribution = [r * inv for r, inv in zip(rank, inverse)]
+        get = contribution.__getitem__
+        lost = damping * sum(rank[i] for i in dangling) + 1 - damping
+        new = [damping * sum(map(get, sources[offsets[i]:offsets[i + 1]])) +
+               lost * teleport[i] for i in range(n)]
+        delta = sum(abs(x - y) for x, y in zip(new, rank))
+        rank = new
+        yield rank, delta
+
+
+def __iterate_numpy(index, damping, teleport, max_iterations):
+    _, offsets, sources, out_degree = index
+    n = len(teleport)
+    sources = numpy.asarray(sources)
+    dest = numpy.repeat(numpy.arange(n), numpy.diff(numpy.asarray(offsets)))
+    out_degree = numpy.asarray(out_degree)
+    dangling = out_degree == 0
+    inverse = numpy.zeros(n)
+    inverse[~dangling] = 1.0 / out_degree[~dangling]
+    teleport = numpy.array(teleport)
+    rank = teleport.copy()
+
+    for _ in range(max_iterations):
+        contribution = (rank * inverse)[sources]
+        lost = damping * rank[dangling].sum() + 1 - damping
+        new = damping * numpy.bincount(dest, weights=contribution,
+                                       minlength=n) + lost * teleport
+        delta = numpy.abs(new - rank).sum()
+        rank = new
+        yield rank.tolist(), delta
+
+
+def __iterate(graph, damping, personalization, max_iterations, use_numpy):
+    # Generator returning (vertices, ranks, delta) after every iteration
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError('NumPy is not installed')
+
+    index = __csr_index(graph)
+    vertices = index[0]
+    if not vertices:
+        return
+
+    teleport = __teleport(graph, vertices, personalization)
+    if use_numpy:
+        iterations = __iterate_numpy(index, damping, teleport, max_iterations)
+    else:
+        iterations = __iterate_python(index, damping, teleport, max_iterations)
+
+    for rank, delta in iterations:
+        yield vertices, rank, delta
+
+
+def pagerank(graph, damping=0.85, personalization=None, tolerance=1e-6,
+             max_iterations=100, use_numpy=None):
+    """Calculates PageRank of every vertex in a graph.
+
+    Args:
+        graph: Directed or undirected graph.
+        damping: Optional probability of following a link instead of jumping
+            to a random vertex.
+        personalization: Optional {vertex: weight} dictionary that gives the
+            probability of jumping to a vertex, vertices not in the dictionary
+            have weight 0. If not given every vertex has equal probability.
+        tolerance: Optional error tolerance, iteration stops when L1 norm of
+            the change is less than number of vertices * tolerance.
+        max_iterations: Optional maximum number of iterations.
+        use_numpy: Optional boolean telling if NumPy should be used, by
+            default it's used if available.
+
+    Returns:
+        Dictionary where keys are vertices and values are ranks that sum up
+        to 1.
+
+    Raises:
+        ValueError: In case personalization has vertices not in the graph,
+            negative weights or no positive weights.
+        ImportError: In case use_numpy is True and NumPy isn't installed.
+    """
+    vertices, rank = [], []
+    limit = len(graph.vertices) * tolerance
+    for vertices, rank, delta in __iterate(graph, damping, personalization,
+                                           max_iterations, use_numpy):
+        if delta < limit:
+            break
+
+    return dict(zip(vertices, rank))
+
+
+def pagerank_top(graph, k, damping=0.85, personalization=None,
+                 tolerance=1e-6, max_iterations=100, use_numpy=None):
+    """Finds k vertices with highest PageRank. Iteration stops as soon as
+    the remaining error can't change which vertices are in the result.
+
+    Args:
+        graph: Directed or undirected graph.
+        k: Number of vertices to return.
+        damping: Optional probability of following a link instead of jumping
+            to a random vertex.
+        personalization: Optional {vertex: weight} dictionary, see pagerank.
+        tolerance: Optional error tolerance, see pagerank.
+        max_iterations: Optional maximum number of iterations.
+        use_numpy: Optional boolean telling if NumPy should be used, by
+            default it's used if available.
+
+    Returns:
+        List of (vertex, rank) tuples in descending rank order.
+
+    Raises:
+        ValueError: In case k is less than 1 or personalization is invalid,
+            see pagerank.
+        ImportError: In case use_numpy is True and NumPy isn't installed.
+    """
+    if k < 1:
+        raise ValueError('k must be at least 1')
+
+    vertices, rank = [], []
+    limit = len(graph.vertices) * tolerance
+    for vertices, rank, delta in __iterate(graph, damping, personalization,
+                                           max_iterations, use_numpy):
+        if delta < limit:
+            break
+
+        # Distance to final result in L1 norm is bounded by
+        # delta * damping / (1 - damping), check if the gap between k:th and
+        # k + 1:th rank is larger than that
+        if k < len(rank):
+            top = heapq.nlargest(k + 1, rank)
+            if top[-2] - top[-1] > 2 * delta * damping / (1 - damping):
+                break
+
+    top = heapq.nlargest(k, range(len(rank)), key=rank.__getitem__)
+    return [(vertices[i], rank[i]) for i in top]
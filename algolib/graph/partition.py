@@ -0,0 +1,258 @@
+"""Multilevel graph partitioning to balanced parts with few crossing edges.
+Graph is first coarsened by repeatedly contracting heavy edge matchings where
+every vertex is matched with the unmatched neighbor it has the heaviest edge
+to. Coarsest graph is partitioned by growing parts one at a time, always adding
+the vertex with most weight connecting it to the part. Partition is then
+projected back level by level and refined on every level by greedily moving
+boundary vertices to the part they have most weight connecting to as long as
+balance constraint allows it.
+
+Edge directions are ignored, parallel edges are combined and edges without
+weight property have weight 1. Every vertex has weight 1.
+
+Time complexity: O(E log V)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Graph_partition
+"""
+from random import Random
+from algolib.graph.view import induced_subgraph
+from algolib.priority_queue import PriorityQueue
+
+
+def __adjacency(graph, weight):
+    # Returns tuple (vertices, adjacency) where adjacency is a list of
+    # {neighbor index: weight} dictionaries without loops
+    vertices = list(graph.vertices)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    adjacency = [{} for _ in vertices]
+    endpoints = graph.endpoints if graph.multigraph else tuple
+
+    for edge, properties in graph.edges.items():
+        x, y = endpoints(edge)
+        if x != y:
+            w = properties.get(weight, 1) if weight is not None else 1
+            i = index[x]
+            j = index[y]
+            adjacency[i][j] = adjacency[i].get(j, 0) + w
+            adjacency[j][i] = adjacency[j].get(i, 0) + w
+
+    return vertices, adjacency
+
+
+def __coarsen(adjacency, weights, rng):
+    # Contracts heavy edge matching, returns tuple (coarse adjacency,
+    # coarse vertex weights, coarse vertex of every vertex)
+    n = len(adjacency)
+    match = [None] * n
+    order = list(range(n))
+    rng.shuffle(order)
+
+    coarse = [None] * n
+    count = 0
+    for i in order:
+        if match[i] is not None:
+            continue
+        best = i
+        best_weight = 0
+        for j, w in adjacency[i].items():
+            if match[j] is None and w > best_weight:
+                best = j
+                best_weight = w
+        match[i] = best
+        match[best] = i
+        coarse[i] = coarse[best] = count
+        count += 1
+
+    coarse_adjacency = [{} for _ in range(count)]
+    coarse_weights = [0] * count
+    for i, row in enumerate(adjacency):
+        ci = coarse[i]
+        coarse_weights[ci] += weights[i]
+        target = coarse_adjacency[ci]
+        for j, w in row.items():
+            cj = coarse[j]
+            if ci != cj:
+                target[cj] = target.get(cj, 0) + w
+
+    return coarse_adjacency, coarse_weights, coarse
+
+
+def __grow(adjacency, weights, parts, rng):
+    # Initial partition by growing parts one by one
+    n = len(adjacency)
+    target = float(sum(weights)) / parts
+    part = [parts - 1] * n
+    unassigned = set(range(n))
+
+    # New parts are started from random vertices, assigned ones are skipped
+    seeds = list(range(n))
+    rng.shuffle(seeds)
+
+    for p in range(parts - 1):
+        size = 0
+        # Frontier is prioritized by negative connection to the part
+        queue = PriorityQueue()
+        connection = {}
+        while size < target and unassigned:
+            if not queue:
+                vertex = seeds.pop()
+                while vertex not in unassigned:
+                    vertex = seeds.pop()
+            else:
+                _, vertex = queue.pop()
+                del connection[vertex]
+
+            unassigned.remove(vertex)
+            part[vertex] = p
+            size += weights[vertex]
+
+            for other, w in adjacency[vertex].items():
+                if other in unassigned:
+                    if other in connection:
+                        connection[other] += w
+                        queue.change_priority(-connection[other], other)
+                    else:
+                        connection[other] = w
+                        queue.push(-w, other)
+
+    return part
+
+
+def __refine(adjacency, weights, part, parts, max_weight, rng, passes=8):
+    # Greedily moves vertices to improve cut while keeping balance, vertices
+    # in overweight parts are moved even if cut gets worse
+    part_weights = [0] * parts
+    for i, p in enumerate(part):
+        part_weights[p] += weights[i]
+
+    order = list(range(len(adjacency)))
+    for _ in range(passes):
+        rng.shuffle(order)
+        moved = False
+        for i in order:
+            own = part[i]
+            w = weights[i]
+            connection = {}
+            for j, weight in adjacency[i].items():
+                connection[part[j]] = connection.get(part[j], 0) + weight
+
+            overweight = part_weights[own] > max_weight
+            candidates = range(parts) if overweight else connection
+            best = None
+            best_gain = None
+            for p in candidates:
+                if p == own or part_weights[p] + w > max_weight:
+                    continue
+                gain = connection.get(p, 0) - connection.get(own, 0)
+                if gain > 0 or overweight or \
+                        (gain == 0 and part_weights[p] + w < part_weights[own]):
+                    if best is None or gain > best_gain:
+                        best = p
+                        best_gain = gain
+
+            if best is not None:
+                part[i] = best
+                part_weights[own] -= w
+                part_weights[best] += w
+                moved = True
+
+        if not moved:
+            break
+
+
+def partition(graph, parts, weight='weight', imbalance=0.03, seed=None):
+    """Splits vertices of a graph to balanced parts so that weight of edges
+    crossing the parts is minimized.
+
+    Args:
+        graph: Graph, edge directions are ignored.
+        parts: Number of parts.
+        weight: Optional name of the edge weight property, None to treat all
+            edges equally.
+        imbalance: Optional allowed imbalance, maximum part size is
+            (1 + imbalance) times the average part size rounded up.
+        seed: Optional seed for random number generator.
+
+    Returns:
+        Dictionary where keys are vertices and values are part numbers
+        from 0 to parts - 1.
+
+    Raises:
+        ValueError: In case number of parts is less than 1.
+    """
+    if parts < 1:
+        raise ValueError('Number of parts must be at least 1')
+
+    vertices, adjacency = __adjacency(graph, weight)
+    if parts == 1 or not vertices:
+        return dict.fromkeys(vertices, 0)
+
+    rng = Random(seed)
+    weights = [1] * len(vertices)
+    max_weight = int(-(-len(vertices) * (1 + imbalance) // parts))
+
+    # Coarsen until graph is small or matching doesn't shrink it enough
+    levels = []
+    while len(adjacency) > 20 * parts:
+        coarse_adjacency, coarse_weights, coarse = \
+            __coarsen(adjacency, weights, rng)
+        if len(coarse_adjacency) > 0.9 * len(adjacency):
+            break
+        levels.append((adjacency, weights, coarse))
+        adjacency, weights = coarse_adjacency, coarse_weights
+
+    part = __grow(adjacency, weights, parts, rng)
+    __refine(adjacency, weights, part, parts, max_weight, rng)
+
+    while levels:
+        adjacency, weights, coarse = levels.pop()
+        part = [part[c] for c in coarse]
+        __refine(adjacency, weights, part, parts, max_weight, rng)
+
+    return dict(zip(vertices, part))
+
+
+def part_subgraphs(graph, assignment, parts=None):
+    """Returns views of the graph induced by every part.
+
+    Args:
+        graph: Graph.
+        assignment: Dictionary where keys are vertices and values are
+            part numbers, see partition.
+        parts: Optional number of parts, by default largest part number + 1.
+
+    Returns:
+        List of GraphView objects, one for each part.
+    """
+    if parts is None:
+        parts = max(assignment.values()) + 1 if assignment else 0
+
+    members = [[] for _ in range(parts)]
+    for vertex, p in assignment.items():
+        members[p].append(vertex)
+
+    return [induced_subgraph(graph, m) for m in members]
+
+
+def edge_cut(graph, assignment, weight='weight'):
+    """Calculates total weight of edges crossing parts.
+
+    Args:
+        graph: Graph.
+        assignment: Dictionary where keys are vertices and values are
+            part numbers, see partition.
+        weight: Optional name of the edge weight property, None to treat all
+            edges equally.
+
+    Returns:
+        Total weight of edges whose endpoints are in different parts.
+    """
+    endpoints = graph.endpoints if graph.multigraph else tuple
+    result = 0
+    for edge, properties in graph.edges.items():
+        x, y = endpoints(edge)
+        if assignment[x] != assignment[y]:
+            result += properties.get(weight, 1) if weight is not None else 1
+
+    return result
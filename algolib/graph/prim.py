@@ -3,10 +3,11 @@ graph. Time complexity: O(E log V).
 
 For more information see https://en.wikipedia.org/wiki/Prim%27s_algorithm.
 """
+from algolib.graph.stats import phase
 from algolib.priority_queue import PriorityQueue
 
 
-def prim(graph, queue_constructor=PriorityQueue):
+def prim(graph, queue_constructor=PriorityQueue, stats=None):
     """Finds minimum spanning tree from undirected weighted graph.
 
     Args:
@@ -21,6 +22,7 @@ def prim(graph, queue_constructor=PriorityQueue):
                 will change the priority of existing key.
             - Returned object must evaluate True in boolean context in case it
                 contains items and False if it's empty.
+        stats: Optional Stats object to fill.
 
     Returns:
         List of edges in minimum spanning tree.
@@ -28,19 +30,34 @@ def prim(graph, queue_constructor=PriorityQueue):
     if not graph.vertices:
         return []
 
+    neighbors = graph.__getitem__
+    if stats is not None:
+        queue_constructor = stats.queue(queue_constructor)
+        neighbors = stats.count_edges(neighbors, settle=True)
+
     # Edges of result MST
     edges = []
 
-    # Store vertices not yet in the tree to a dict
-    # {vertex: [distance, closest vertex in the tree]}
-    distances = {vertex: [float('inf'), None] for vertex in graph.vertices}
+    with phase(stats, 'initialize'):
+        # Store vertices not yet in the tree to a dict
+        # {vertex: [distance, closest vertex in the tree]}
+        distances = {vertex: [float('inf'), None]
+                     for vertex in graph.vertices}
+
+        # Store vertex, distance pairs to min priority_queue prioritized by
+        # distance and mark one of the vertices as start vertex
+        queue = queue_constructor((float('inf'), vertex)
+                                  for vertex in graph.vertices)
+        queue.change_priority(0, next(iter(graph.vertices)))
 
-    # Store vertex, distance pairs to min priority_queue prioritized by distance
-    # and mark one of the vertices as start vertex
-    queue = queue_constructor((float('inf'), vertex)
-                              for vertex in graph.vertices)
-    queue.change_priority(0, next(iter(graph.vertices)))
+    with phase(stats, 'search'):
+        __grow(graph, queue, distances, edges, neighbors)
+
+    return edges
 
+
+def __grow(graph, queue, distances, edges, neighbors):
+    # Add vertices to the tree in order of distance
     while queue:
         weight, vertex = queue.pop()
 
@@ -56,11 +73,9 @@ def prim(graph, queue_constructor=PriorityQueue):
             edges.append([parent, vertex])
 
         # Update distance to all the neighboring vertices if required
-        for other in graph[vertex]:
+        for other in neighbors(vertex):
             weight = graph[vertex][other]['weight']
 
             if weight < distances.get(other, (-float('inf'), None))[0]:
                 distances[other] = (weight, vertex)
                 queue.change_priority(weight, other)
-
-    return edges
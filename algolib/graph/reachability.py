@@ -0,0 +1,174 @@
+"""Reachability index for directed acyclic graphs. Vertices are numbered in
+topological order and labeled with intervals from depth-first search over
+the graph. Every vertex gets pre-order and post-order numbers from the search
+tree and the lowest post-order number of the vertices it can reach. Query is
+answered from the labels alone in most cases:
+
+- vertex can't reach vertices earlier in topological order
+- vertex can reach its descendants in the search tree, which is the case if
+  its pre-order and post-order interval contains the interval of the other
+- vertex can't reach vertex whose post-order number is outside the range
+  from its lowest reachable post-order number to its own post-order number
+
+Remaining queries are answered by depth-first search from the source which
+skips vertices whose labels show they can't reach the destination.
+
+Time complexity:
+- creation: O(V + E)
+- query: O(1) when answered from the labels, O(V + E) worst case
+
+Memory usage: O(V + E)
+
+For more information see:
+https://en.wikipedia.org/wiki/Reachability
+"""
+from array import array
+
+
+def _successors(graph, vertex):
+    return graph[vertex].values() if graph.multigraph else graph[vertex]
+
+
+class ReachabilityIndex(object):
+    """Index answering if a vertex can be reached from another one.
+
+    Attributes:
+        _position: {vertex: topological number} dictionary.
+        _successors: List of lists where _successors[i] contains topological
+            numbers of successors of vertex with topological number i.
+        _pre: Array of pre-order numbers indexed by topological number.
+        _post: Array of post-order numbers indexed by topological number.
+        _low: Array where _low[i] is the lowest post-order number of vertices
+            reachable from vertex with topological number i.
+    """
+    def __init__(self, graph):
+        """Initializer, builds the index.
+
+        Args:
+            graph: Directed acyclic graph or a view of it.
+
+        Raises:
+            ValueError: In case graph contains a cycle.
+        """
+        vertices = list(graph.vertices)
+        n = len(vertices)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        successors = [[index[other] for other in _successors(graph, vertex)]
+                      for vertex in vertices]
+
+        # Topological order with Kahn's algorithm
+        degree = [0] * n
+        for row in successors:
+            for j in row:
+                degree[j] += 1
+        order = [i for i in range(n) if not degree[i]]
+        for i in order:
+            for j in successors[i]:
+                degree[j] -= 1
+                if not degree[j]:
+                    order.append(j)
+        if len(order) < n:
+            raise ValueError('Graph contains a cycle')
+
+        rank = [0] * n
+        for i, vertex in enumerate(order):
+            rank[vertex] = i
+        self._position = {vertex: rank[i] for i, vertex in enumerate(vertices)}
+        self._successors = [[rank[j] for j in successors[vertex]]
+                            for vertex in order]
+        self.__label(n)
+
+    def __label(self, n):
+        # Assigns pre-order and post-order numbers with iterative depth-first
+        # search and the lowest reachable post-order numbers
+        successors = self._successors
+        self._pre = pre = array('l', [-1]) * n
+        self._post = post = array('l', [-1]) * n
+        counter = 0
+        finished = 0
+        for root in range(n):
+            if pre[root] != -1:
+                continue
+            pre[root] = counter
+            counter += 1
+            stack = [(root, iter(successors[root]))]
+            while stack:
+                vertex, it = stack[-1]
+                for other in it:
+                    if pre[other] == -1:
+                        pre[other] = counter
+                        counter += 1
+                        stack.append((other, iter(successors[other])))
+                        break
+                else:
+                    stack.pop()
+                    post[vertex] = finished
+                    finished += 1
+
+        # Successors come later in topological order
+        self._low = low = array('l', post)
+        for i in range(n - 1, -1, -1):
+            for j in successors[i]:
+                if low[j] < low[i]:
+                    low[i] = low[j]
+
+    def __search(self, i, j):
+        # Depth-first search from i to j skipping vertices that can't reach j
+        successors = self._successors
+        post = self._post
+        low = self._low
+        target_post = post[j]
+        target_low = low[j]
+        visited = {i}
+        stack = [i]
+        while stack:
+            for k in successors[stack.pop()]:
+                if k == j:
+                    return True
+                if k < j and k not in visited and \
+                        low[k] <= target_low and target_post <= post[k]:
+                    visited.add(k)
+                    stack.append(k)
+
+        return False
+
+    def __reachable(self, i, j):
+        if i == j:
+            return True
+        if i > j:
+            return False
+
+        post = self._post
+        if not self._low[i] <= self._low[j] or not post[j] <= post[i]:
+            return False
+        if self._pre[i] <= self._pre[j] and post[j] <= post[i]:
+            return True
+
+        return self.__search(i, j)
+
+    def reachable(self, source, dest):
+        """Returns boolean value telling if dest can be reached from source.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            True if there's a path from source to dest, False if not. Every
+            vertex is reachable from itself.
+        """
+        return self.__reachable(self._position[source],
+                                self._position[dest])
+
+    def reachable_many(self, pairs):
+        """Answers multiple reachability queries.
+
+        Args:
+            pairs: Iterable of (source, dest) tuples.
+
+        Returns:
+            List of boolean values, see reachable.
+        """
+        position = self._position
+        return [self.__reachable(position[source], position[dest])
+                for source, dest in pairs]
@@ -0,0 +1,186 @@
+"""Opt-in instrumentation for graph algorithms. Traversals, shortest path,
+minimum spanning tree and flow algorithms accept an optional Stats object that
+they fill with counters and time spent in each phase. Counting is done by
+wrapping edge iterators and priority queues only when Stats object is given so
+algorithms run unmodified code paths when instrumentation is disabled.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+
+@contextmanager
+def _no_phase():
+    yield
+
+
+def phase(stats, name):
+    """Returns context manager that measures time spent in given phase.
+
+    Args:
+        stats: Stats object or None.
+        name: Phase name.
+
+    Returns:
+        Context manager, does nothing if stats is None.
+    """
+    return _no_phase() if stats is None else stats.phase(name)
+
+
+class Stats(object):
+    """Counters filled in by graph algorithms. Same object can be passed to
+    multiple calls in which case counters are accumulated.
+
+    Attributes:
+        vertices_settled: Number of vertices processed, popped from the queue
+            or settled.
+        edges_scanned: Number of edges examined.
+        edges_relaxed: Number of edges that improved distance or key of
+            a vertex.
+        pushes: Number of priority queue push calls.
+        pops: Number of priority queue pop calls.
+        priority_changes: Number of priority queue change_priority calls.
+        peak_frontier: Maximum number of discovered but unprocessed vertices,
+            with priority queues keys with infinite priority are not counted.
+        iterations: Number of algorithm specific iterations, for example
+            augmenting paths found by edmonds_karp.
+        times: {phase name: seconds} dictionary.
+    """
+    def __init__(self):
+        """Initializer, initializes all counters to zero."""
+        self.vertices_settled = 0
+        self.edges_scanned = 0
+        self.edges_relaxed = 0
+        self.pushes = 0
+        self.pops = 0
+        self.priority_changes = 0
+        self.peak_frontier = 0
+        self.iterations = 0
+        self.times = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager that adds time spent within it to given phase.
+
+        Args:
+            name: Phase name.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] += perf_counter() - start
+
+    def frontier(self, size):
+        """Updates peak frontier size.
+
+        Args:
+            size: Current frontier size.
+        """
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def count_edges(self, edges_from, settle=False):
+        """Wraps edge iterator function so that returned items are counted
+        as scanned edges.
+
+        Args:
+            edges_from: Function that takes vertex as argument and returns
+                iterable of edges.
+            settle: If True every iteration is also counted as a settled
+                vertex.
+
+        Returns:
+            Function with same signature.
+        """
+        def wrapper(*args):
+            if settle:
+                self.vertices_settled += 1
+            for item in edges_from(*args):
+                self.edges_scanned += 1
+                yield item
+
+        return wrapper
+
+    def queue(self, queue_constructor):
+        """Wraps priority queue constructor so that queue operations are
+        counted. Priority changes after the first pop are also counted as
+        relaxed edges since that's when dijkstra and prim relax them.
+
+        Args:
+            queue_constructor: Priority queue constructor, see dijkstra.
+
+        Returns:
+            Constructor with same signature that returns counting queue.
+        """
+        return lambda it=tuple(): _CountingQueue(self, queue_constructor, it)
+
+    def as_dict(self):
+        """Returns counters as a dictionary.
+
+        Returns:
+            Dictionary where keys are attribute names.
+        """
+        result = dict(vars(self))
+        result['times'] = dict(self.times)
+        return result
+
+
+class _CountingQueue(object):
+    """Priority queue proxy that counts operations.
+
+    Attributes:
+        _stats: Stats object.
+        _queue: Underlying priority queue.
+        _active: Set of keys in queue with finite priority.
+        _popped: True if pop has been called.
+    """
+    def __init__(self, stats, queue_constructor, it):
+        items = list(it)
+        self._stats = stats
+        self._queue = queue_constructor(items)
+        self._active = {key for priority, key in items
+                        if priority != float('inf')}
+        self._popped = False
+        stats.frontier(len(self._active))
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __bool__(self):
+        return bool(self._queue)
+
+    __nonzero__ = __bool__
+
+    def __update(self, priority, key):
+        if priority != float('inf'):
+            self._active.add(key)
+        else:
+            self._active.discard(key)
+        self._stats.frontier(len(self._active))
+
+    def push(self, priority, key):
+        """See PriorityQueue.push."""
+        self._stats.pushes += 1
+        self._queue.push(priority, key)
+        self.__update(priority, key)
+
+    def pop(self):
+        """See PriorityQueue.pop."""
+        self._stats.pops += 1
+        self._popped = True
+        priority, key = self._queue.pop()
+        self._active.discard(key)
+        return priority, key
+
+    def min(self):
+        """See PriorityQueue.min."""
+        return self._queue.min()
+
+    def change_priority(self, priority, key):
+        """See PriorityQueue.change_priority."""
+        self._stats.priority_changes += 1
+        if self._popped:
+            self._stats.edges_relaxed += 1
+        self._queue.change_priority(priority, key)
+        self.__update(priority, key)
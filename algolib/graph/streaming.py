@@ -0,0 +1,132 @@
+"""Algorithms that process a stream of edges without building a graph. Edges
+are read from an iterable once and only O(V) memory is used, except for the
+minimum spanning forest which additionally keeps one chunk of edges in memory.
+
+Minimum spanning forest is found with semi-streaming Kruskal's algorithm:
+edges are read in chunks, every chunk is sorted and merged with the current
+forest which is also sorted by weight, and Kruskal's algorithm is run over the
+merged edges. Edges dropped from a chunk are the heaviest edge of some cycle so
+they can't be part of the minimum spanning forest.
+
+Time complexity:
+- components: O(E log V)
+- minimum spanning forest: O(E log C + E / C * V log V) where C is chunk size
+- degree statistics: O(E + V)
+"""
+from collections import Counter
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+from algolib.disjoint_set import DisjointSet
+
+
+def stream_components(edges, vertices=()):
+    """Finds connected components from a stream of edges.
+
+    Args:
+        edges: Iterable of edges where every edge is a tuple starting with
+            two vertices, edge directions are ignored.
+        vertices: Optional iterable of vertices, can be used to include
+            vertices that aren't part of any edge.
+
+    Returns:
+        List of components where each component is a set of vertices.
+    """
+    components = DisjointSet(vertices)
+    for edge in edges:
+        x, y = edge[0], edge[1]
+        components.add(x)
+        components.add(y)
+        components.union(x, y)
+
+    result = {}
+    for vertex in components:
+        result.setdefault(components.find(vertex), set()).add(vertex)
+
+    return list(result.values())
+
+
+def __kruskal(edges):
+    # Kruskal's algorithm over edges sorted by weight
+    components = DisjointSet(())
+    result = []
+    for edge in edges:
+        x, y, _ = edge
+        components.add(x)
+        components.add(y)
+        if not components.same_component(x, y):
+            components.union(x, y)
+            result.append(edge)
+
+    return result
+
+
+def stream_kruskal(edges, chunk_size=100000):
+    """Finds minimum spanning forest from a stream of undirected weighted
+    edges.
+
+    Args:
+        edges: Iterable of (x, y, weight) tuples.
+        chunk_size: Optional number of edges to read to memory at once.
+
+    Returns:
+        List of (x, y, weight) tuples in the minimum spanning forest ordered
+        by weight.
+    """
+    weight = itemgetter(2)
+    forest = []
+    it = iter(edges)
+
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return forest
+
+        chunk.sort(key=weight)
+        forest = __kruskal(merge(forest, chunk, key=weight))
+
+
+def degree_stats(edges, directed=False):
+    """Calculates degree statistics from a stream of edges.
+
+    Args:
+        edges: Iterable of edges where every edge is a tuple starting with
+            two vertices.
+        directed: Optional boolean telling if edges are directed, with
+            undirected edges loops add two to the degree.
+
+    Returns:
+        Dictionary with following keys:
+        - vertices: Number of vertices that are part of some edge.
+        - edges: Number of edges.
+        - min_degree: Minimum degree, 0 if there are no edges.
+        - max_degree: Maximum degree, 0 if there are no edges.
+        - mean_degree: Average degree, 0 if there are no edges.
+        - histogram: {degree: number of vertices} dictionary.
+        With directed edges degree is sum of in- and outdegree and following
+        keys are also included:
+        - max_in_degree: Maximum indegree.
+        - max_out_degree: Maximum outdegree.
+    """
+    out_degree = Counter()
+    in_degree = Counter()
+    count = 0
+    for edge in edges:
+        out_degree[edge[0]] += 1
+        in_degree[edge[1]] += 1
+        count += 1
+
+    degree = out_degree + in_degree
+    result = {
+        'vertices': len(degree),
+        'edges': count,
+        'min_degree': min(degree.values()) if degree else 0,
+        'max_degree': max(degree.values()) if degree else 0,
+        'mean_degree': 2.0 * count / len(degree) if degree else 0,
+        'histogram': dict(Counter(degree.values()))
+    }
+    if directed:
+        result['max_in_degree'] = max(in_degree.values()) if degree else 0
+        result['max_out_degree'] = max(out_degree.values()) if degree else 0
+
+    return result
@@ -10,10 +10,19 @@ Time complexity of the operations:
 - insert vertex: O(1)
 - delete vertex: O(number of connected edges)
 - iterate vertices/edges: O(n)
+- snapshot: O(1)
+
+Graph supports copy-on-write snapshots the same way as Directed. Top level
+dicts are wrapped to SnapshotDicts that write changes to a private layer on
+top of the contents shared with the snapshot, and each modification copies
+adjacency dicts of the vertices it touches unless they have already been
+copied. Edge and vertex property dicts are shared so they must not be
+modified in place.
 
 Interface is loosely based on NetworkX (http://networkx.github.io/).
 """
 from collections import defaultdict
+from algolib.graph.directed import SnapshotDict
 
 
 class Undirected(object):
@@ -27,6 +36,9 @@ class Undirected(object):
         _neighbors: Three level dictionary where first level keys are vertices,
             second level keys are neighboring vertices and third level is
             edge properties. Use index operator to access edges.
+        _layered: True if any of the top level dicts is SnapshotDict.
+        _owned: Set of vertices whose adjacency dicts are not shared with
+            a snapshot, None if no adjacency dicts are shared.
     """
 
     def __init__(self):
@@ -34,6 +46,8 @@ class Undirected(object):
         self.vertices = {}
         self.edges = {}
         self._neighbors = defaultdict(dict)
+        self._layered = False
+        self._owned = None
 
     @property
     def directed(self):
@@ -44,11 +58,38 @@ class Undirected(object):
         """
         return False
 
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            Always False.
+        """
+        return False
+
     @staticmethod
     def __key(x, y):
         # Note that on Python 3 frozenset would be better option
         return tuple(sorted([x, y]))
 
+    def __own(self, *vertices):
+        # Merge top level dicts with enough changes back to plain dicts and
+        # copy shared adjacency dicts before they're modified
+        if self._layered:
+            self.vertices = SnapshotDict.settled(self.vertices)
+            self.edges = SnapshotDict.settled(self.edges)
+            self._neighbors = SnapshotDict.settled(self._neighbors)
+            self._layered = any(isinstance(x, SnapshotDict) for x in (
+                self.vertices, self.edges, self._neighbors))
+
+        if self._owned is not None:
+            for vertex in vertices:
+                if vertex not in self._owned:
+                    self._owned.add(vertex)
+                    if vertex in self._neighbors:
+                        self._neighbors[vertex] = dict(self._neighbors[vertex])
+
     def insert_vertex(self, name, **kwargs):
         """Inserts vertex to graph.
 
@@ -57,6 +98,7 @@ class Undirected(object):
             **kwargs: Optional properties, if vertex already exists then given
                 properties will be used to update existing ones.
         """
+        self.__own()
         kwargs.update(self.vertices.get(name, {}))
         self.vertices[name] = kwargs
         self._neighbors.setdefault(name, {})
@@ -68,6 +110,7 @@ class Undirected(object):
         Args:
             name: Name of the vertex.
         """
+        self.__own()
         del self.vertices[name]
 
         # Iterate over neighbors without copying
@@ -84,8 +127,10 @@ class Undirected(object):
             y: Second vertex.
             **kwargs: Optional properties for the edge
         """
-        self.vertices.setdefault(x, {})
-        self.vertices.setdefault(y, {})
+        self.__own(x, y)
+        for vertex in (x, y):
+            self.vertices.setdefault(vertex, {})
+            self._neighbors.setdefault(vertex, {})
 
         edge_key = self.__key(x, y)
         kwargs.update(self.edges.get(edge_key, {}))
@@ -100,6 +145,7 @@ class Undirected(object):
             x: First vertex.
             y: Second vertex.
         """
+        self.__own(x, y)
         del self.edges[self.__key(x, y)]
         del self._neighbors[x][y]
 
@@ -184,3 +230,24 @@ class Undirected(object):
         return copy
 
     copy = __copy__
+
+    def snapshot(self):
+        """Returns a point-in-time copy of the graph that shares the
+        underlying dicts with this graph. Both graphs write changes to top
+        level dicts to private layers and copy shared adjacency dicts when
+        they're modified so changes are not visible to the other one.
+        Snapshot must be taken by the thread modifying the graph, after that
+        the snapshot may be read concurrently by other threads.
+
+        Returns:
+            New Undirected graph.
+        """
+        other = Undirected.__new__(Undirected)
+        self.vertices, other.vertices = SnapshotDict.share(self.vertices)
+        self.edges, other.edges = SnapshotDict.share(self.edges)
+        self._neighbors, other._neighbors = SnapshotDict.share(self._neighbors)
+        other._layered = self._layered = True
+        other._owned = set()
+        self._owned = set()
+
+        return other
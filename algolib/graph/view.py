@@ -0,0 +1,481 @@
+"""Read-only views of graphs. Views don't copy the
+underlying graph, instead they filter or reverse vertices and edges on the fly
+when accessed. Views implement the same read interface as the graphs so they
+can be passed to any algorithm in this package and they can be stacked on top
+of each other. Changes made to the underlying graph are visible through the
+view.
+
+Time complexity of the operations compared to the underlying graph:
+- check if edge (x, y) exists: same
+- check degree of vertex: O(degree)
+- iterate vertices/edges: same, filtered items are skipped
+- len of vertices/edges: O(n)
+- copy: O(V + E), returns a new graph
+"""
+from collections.abc import Mapping
+from algolib.graph.directed import Directed
+from algolib.graph.undirected import Undirected
+from algolib.graph.multi_directed import MultiDirected
+from algolib.graph.multi_undirected import MultiUndirected
+
+
+def _accept_all(*_):
+    """Default filter used in case user doesn't provide one."""
+    return True
+
+
+class _FilteredDict(Mapping):
+    """Read-only dictionary that hides items rejected by a predicate.
+
+    Attributes:
+        _base: Underlying dictionary.
+        _predicate: Function predicate(key, value) that returns True if item
+            is visible.
+    """
+    def __init__(self, base, predicate):
+        self._base = base
+        self._predicate = predicate
+
+    def __getitem__(self, key):
+        value = self._base[key]
+        if not self._predicate(key, value):
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key, value in self._base.items():
+            if self._predicate(key, value):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+# Just a simple adapter
+# pylint: disable=too-few-public-methods
+class _Adjacency(object):
+    """Index operator adapter so that view.incoming[vertex] works the same way
+    as with Directed.
+
+    Attributes:
+        _row: Function row(vertex) that returns the adjacency dictionary.
+    """
+    def __init__(self, row):
+        self._row = row
+
+    def __getitem__(self, item):
+        return self._row(item)
+# pylint: enable=too-few-public-methods
+
+
+def _materialize(view):
+    """Copies vertices and edges of a view to a new graph.
+
+    Args:
+        view: Graph view.
+
+    Returns:
+        New graph of the same type as the graph under the view. Edge ids
+        of multigraphs are not preserved.
+    """
+    if view.multigraph:
+        result = MultiDirected() if view.directed else MultiUndirected()
+    else:
+        result = Directed() if view.directed else Undirected()
+
+    for vertex, properties in view.vertices.items():
+        result.insert_vertex(vertex, **properties)
+
+    if view.multigraph:
+        for edge, properties in view.edges.items():
+            result.insert_edge(*view.endpoints(edge), **properties)
+    else:
+        for vertex in view.vertices:
+            for edge, other in view.edges_from(vertex):
+                result.insert_edge(vertex, other, **view.edges[edge])
+
+    return result
+
+
+class GraphView(object):
+    """Read-only view of a graph that hides vertices and edges rejected by
+    given filters.
+
+    Attributes:
+        graph: Underlying graph.
+        vertices: Dictionary of visible vertices where keys are vertex names
+            and values are dictionary of vertex properties.
+        edges: Dictionary of visible edges, keys are same as in the underlying
+            graph and values are dictionary of edge properties.
+        incoming: Incoming edges in case underlying graph is directed, see
+            Directed.incoming.
+        _vertex_filter: Function vertex_filter(vertex) that returns True if
+            vertex is visible.
+        _edge_filter: Function edge_filter(source, dest, properties) that
+            returns True if edge is visible.
+    """
+    def __init__(self, graph, vertex_filter=None, edge_filter=None):
+        """Initializer, initializes view of given graph.
+
+        Args:
+            graph: Graph or another view.
+            vertex_filter: Optional function vertex_filter(vertex) returning
+                True if vertex is visible. Edges are visible only if both
+                of the vertices are visible.
+            edge_filter: Optional function edge_filter(source, dest, properties)
+                returning True if edge is visible. With undirected graphs the
+                function must return same result for (x, y) and (y, x).
+        """
+        self.graph = graph
+        self._vertex_filter = vertex_filter or _accept_all
+        self._edge_filter = edge_filter or _accept_all
+
+        vertex_ok = self._vertex_filter
+        edge_ok = self._edge_filter
+        endpoints = graph.endpoints if graph.multigraph else tuple
+
+        def edge_visible(edge, properties):
+            x, y = endpoints(edge)
+            return vertex_ok(x) and vertex_ok(y) and edge_ok(x, y, properties)
+
+        self.vertices = _FilteredDict(graph.vertices,
+                                      lambda vertex, _: vertex_ok(vertex))
+        self.edges = _FilteredDict(graph.edges, edge_visible)
+
+        if graph.directed:
+            self.incoming = _Adjacency(self.__incoming)
+
+    @property
+    def directed(self):
+        """Returns boolean value telling if graph is directed or not.
+
+        Returns:
+            True if underlying graph is directed, False if not.
+        """
+        return self.graph.directed
+
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            True if underlying graph is a multigraph, False if not.
+        """
+        return self.graph.multigraph
+
+    def __check(self, vertex):
+        # Hidden vertices are treated as missing
+        if not self._vertex_filter(vertex):
+            raise KeyError(vertex)
+
+    def __row(self, row, vertex, outgoing):
+        # Filter adjacency dict of given vertex, with multigraphs keys are
+        # edge ids and values are vertices
+        vertex_ok = self._vertex_filter
+        edge_ok = self._edge_filter
+
+        if self.graph.multigraph:
+            edges = self.graph.edges
+            if outgoing:
+                return _FilteredDict(row, lambda edge, other: vertex_ok(other)
+                                     and edge_ok(vertex, other, edges[edge]))
+            return _FilteredDict(row, lambda edge, other: vertex_ok(other)
+                                 and edge_ok(other, vertex, edges[edge]))
+
+        if outgoing:
+            return _FilteredDict(row, lambda other, properties:
+                                 vertex_ok(other) and
+                                 edge_ok(vertex, other, properties))
+        return _FilteredDict(row, lambda other, properties:
+                             vertex_ok(other) and
+                             edge_ok(other, vertex, properties))
+
+    def __getitem__(self, item):
+        self.__check(item)
+        return self.__row(self.graph[item], item, True)
+
+    def __incoming(self, vertex):
+        self.__check(vertex)
+        return self.__row(self.graph.incoming[vertex], vertex, False)
+
+    def endpoints(self, edge):
+        """Returns endpoints of given edge in a multigraph view.
+
+        Args:
+            edge: Edge id.
+
+        Returns:
+            Tuple of edge endpoints.
+        """
+        return self.graph.endpoints(edge)
+
+    def connected(self, x, y):
+        """Returns boolean value telling if given vertices are connected by
+        a visible edge.
+
+        Args:
+            x: First vertex.
+            y: Second vertex.
+
+        Returns:
+            True if vertices are connected by edge, False if not
+        """
+        return next(self.edges_between(x, y), None) is not None
+
+    def edges_between(self, x, y):
+        """Returns iterator iterating over visible edges between given nodes.
+
+        Args:
+            x: First vertex.
+            y: Second vertex.
+
+        Returns:
+            Iterator iterating over all the edges between given vertices.
+        """
+        if not (self._vertex_filter(x) and self._vertex_filter(y)):
+            return
+
+        for edge in self.graph.edges_between(x, y):
+            if self._edge_filter(x, y, self.graph.edges[edge]):
+                yield edge
+
+    def edges_from(self, vertex):
+        """Returns iterator iterating over all the visible edges from given
+        vertex.
+
+        Args:
+            vertex: Edge start vertex.
+
+        Returns:
+            Iterator returning (edge key, other vertex) tuples where edge key
+            can be used to index GraphView.edges.
+
+        Raises:
+            KeyError: In case vertex is hidden.
+        """
+        self.__check(vertex)
+        vertex_ok = self._vertex_filter
+        edge_ok = self._edge_filter
+        edges = self.graph.edges
+        for edge, other in self.graph.edges_from(vertex):
+            if vertex_ok(other) and edge_ok(vertex, other, edges[edge]):
+                yield edge, other
+
+    def degree(self, vertex):
+        """Returns degree of given vertex in undirected view.
+
+        Args:
+            vertex: Vertex who's degree is queried.
+
+        Returns:
+            Vertex degree, loop is considered as degree of 2.
+        """
+        return sum(2 if other == vertex else 1
+                   for _, other in self.edges_from(vertex))
+
+    def degree_in(self, vertex):
+        """Returns in degree of given vertex in directed view.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            In degree.
+        """
+        return len(self.incoming[vertex])
+
+    def degree_out(self, vertex):
+        """Returns out degree of given vertex in directed view.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            Out degree.
+        """
+        return len(self[vertex])
+
+    copy = _materialize
+
+
+class ReversedView(object):
+    """Read-only view of a directed graph where every edge is reversed.
+
+    Attributes:
+        graph: Underlying directed graph.
+        vertices: Dictionary of vertices, same as in underlying graph.
+        edges: Dictionary of reversed edges where keys are (from, to) tuples
+            and values are dictionary of edge properties.
+        incoming: Incoming edges of the reversed graph which are outgoing
+            edges of the underlying graph.
+    """
+    def __init__(self, graph):
+        """Initializer, initializes view of given graph.
+
+        Args:
+            graph: Directed graph or a view of directed graph.
+
+        Raises:
+            ValueError: In case graph is not directed or is a multigraph.
+        """
+        if not graph.directed or graph.multigraph:
+            raise ValueError('Only directed simple graphs can be reversed')
+
+        self.graph = graph
+        self.vertices = graph.vertices
+        self.edges = _ReversedEdges(graph.edges)
+        self.incoming = _Adjacency(graph.__getitem__)
+
+    @property
+    def directed(self):
+        """Returns boolean value telling if graph is directed or not.
+
+        Returns:
+            Always True.
+        """
+        return True
+
+    @property
+    def multigraph(self):
+        """Returns boolean value telling if graph may have multiple edges
+        between the same vertices.
+
+        Returns:
+            Always False.
+        """
+        return False
+
+    def __getitem__(self, item):
+        return self.graph.incoming[item]
+
+    def connected(self, source, dest):
+        """Returns boolean value telling if given vertices are connected by
+        an edge.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            True if vertices are connected by edge, False if not
+        """
+        return self.graph.connected(dest, source)
+
+    def edges_between(self, source, dest):
+        """Returns iterator iterating over edges between given nodes.
+
+        Args:
+            source: Source vertex.
+            dest: Destination vertex.
+
+        Returns:
+            Iterator iterating over all the edges between given vertices.
+        """
+        if self.graph.connected(dest, source):
+            yield (source, dest)
+
+    def edges_from(self, vertex):
+        """Returns iterator iterating over all the outgoing edges of given
+        vertex.
+
+        Args:
+            vertex: Edge start vertex.
+
+        Returns:
+            Iterator returning (edge key, destination vertex) tuples where edge
+            key can be used to index ReversedView.edges.
+        """
+        for other in self.graph.incoming[vertex]:
+            yield (vertex, other), other
+
+    def degree_in(self, vertex):
+        """Returns in degree of given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            In degree.
+        """
+        return self.graph.degree_out(vertex)
+
+    def degree_out(self, vertex):
+        """Returns out degree of given vertex.
+
+        Args:
+            vertex: Vertex.
+
+        Returns:
+            Out degree.
+        """
+        return self.graph.degree_in(vertex)
+
+    copy = _materialize
+
+
+class _ReversedEdges(Mapping):
+    """Read-only dictionary of edges where (x, y) maps to edge (y, x) of the
+    underlying dictionary.
+
+    Attributes:
+        _base: Underlying edge dictionary.
+    """
+    def __init__(self, base):
+        self._base = base
+
+    def __getitem__(self, key):
+        return self._base[(key[1], key[0])]
+
+    def __iter__(self):
+        for x, y in self._base:
+            yield (y, x)
+
+    def __len__(self):
+        return len(self._base)
+
+
+def induced_subgraph(graph, vertices):
+    """Returns a view containing given vertices and edges between them.
+
+    Args:
+        graph: Graph or another view.
+        vertices: Iterable of vertices.
+
+    Returns:
+        GraphView object.
+    """
+    vertices = frozenset(vertices)
+    return GraphView(graph, vertex_filter=vertices.__contains__)
+
+
+def edge_subgraph(graph, predicate):
+    """Returns a view containing all the vertices and edges accepted by given
+    predicate.
+
+    Args:
+        graph: Graph or another view.
+        predicate: Function predicate(source, dest, properties) returning True
+            if edge is visible. With undirected graphs the function must
+            return same result for (x, y) and (y, x).
+
+    Returns:
+        GraphView object.
+    """
+    return GraphView(graph, edge_filter=predicate)
+
+
+def reversed_graph(graph):
+    """Returns a view of directed graph where every edge is reversed.
+
+    Args:
+        graph: Directed graph or a view of directed graph, multigraphs are
+            not supported.
+
+    Returns:
+        ReversedView object.
+
+    Raises:
+        ValueError: In case graph is not directed or is a multigraph.
+    """
+    return ReversedView(graph)
@@ -2,3 +2,12 @@
 
 from algolib.priority_queue.priority_queue import PriorityQueue
 from algolib.priority_queue.bucket_queue import BucketQueue
+from algolib.priority_queue.integer_bucket_queue import IntegerBucketQueue
+from algolib.priority_queue.dary_heap import DaryHeap
+from algolib.priority_queue.radix_heap import RadixHeap
+from algolib.priority_queue.dial_queue import DialQueue
+from algolib.priority_queue.pairing_heap import PairingHeap
+from algolib.priority_queue.fibonacci_heap import FibonacciHeap
+from algolib.priority_queue.synchronized_queue import SynchronizedQueue
+from algolib.priority_queue.async_queue import AsyncQueue
+from algolib.priority_queue.min_max_heap import MinMaxHeap
@@ -0,0 +1,103 @@
+"""Priority queue front-end for asyncio. Pop is a coroutine that waits until
+an item is available. Waiting coroutines are woken up in the order they
+started waiting. Any priority queue implementing the same interface as
+PriorityQueue can be used underneath. Like other asyncio primitives the queue
+is not thread-safe and must be used from a single event loop.
+
+Time complexity of the operations is the same as with the underlying queue.
+"""
+import asyncio
+from collections import deque
+from algolib.priority_queue.priority_queue import PriorityQueue
+
+
+class AsyncQueue(object):
+    """Priority queue with awaitable pop.
+
+    Attributes:
+        __queue: Underlying priority queue.
+        __waiters: Deque of futures waiting for items.
+    """
+    def __init__(self, it=tuple(), queue_constructor=PriorityQueue):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+            queue_constructor: Optional constructor of the underlying queue.
+        """
+        self.__queue = queue_constructor(it)
+        self.__waiters = deque()
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def __wake_next(self):
+        while self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue and wakes up one coroutine
+        waiting for an item.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+        """
+        self.__queue.push(priority, key)
+        self.__wake_next()
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        return self.__queue.min()
+
+    def pop_nowait(self):
+        """Pops minimum item off the priority queue without waiting.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+
+        Raises:
+            asyncio.QueueEmpty: In case queue is empty.
+        """
+        if not len(self.__queue):
+            raise asyncio.QueueEmpty
+
+        return self.__queue.pop()
+
+    async def pop(self):
+        """Pops minimum item off the priority queue, waits until there's an
+        item available.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        while not len(self.__queue):
+            waiter = asyncio.get_running_loop().create_future()
+            self.__waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                # Pass wake up call to next waiter if this one was cancelled
+                # after it was woken up
+                waiter.cancel()
+                if len(self.__queue) and not waiter.cancelled():
+                    self.__wake_next()
+                raise
+
+        return self.__queue.pop()
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        self.__queue.change_priority(priority, key)
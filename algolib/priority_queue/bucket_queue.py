@@ -8,6 +8,8 @@ Time complexity of the operations where k is number of unique priorities:
 - change priority: O(1) if there are multiple keys with both original and new
   priority, O(log k) if not
 - query min: O(1)
+- remove: O(1) if there are other keys with same priority, O(log k) if not
+- contains, get priority: O(1)
 """
 from collections import defaultdict
 import heapq
@@ -43,6 +45,9 @@ class BucketQueue(object):
     def __len__(self):
         return len(self.__keys)
 
+    def __contains__(self, key):
+        return key in self.__keys
+
     def __swap(self, x, y):
         self.__position[self.__heap[x]] = y
         self.__position[self.__heap[y]] = x
@@ -138,3 +143,47 @@ class BucketQueue(object):
 
         if not old_bucket:
             self.__remove_bucket(old_priority)
+
+    def get_priority(self, key):
+        """Returns priority of a key.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        return self.__keys[key]
+
+    def remove(self, key):
+        """Removes key from the queue.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority of the removed key.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        priority = self.__keys.pop(key)
+        bucket = self.__buckets[priority]
+        bucket.discard(key)
+
+        if not bucket:
+            self.__remove_bucket(priority)
+
+        return priority
+
+    def discard(self, key):
+        """Removes key from the queue if it's present.
+
+        Args:
+            key: Item key.
+        """
+        if key in self.__keys:
+            self.remove(key)
@@ -0,0 +1,204 @@
+"""Priority queue implemented as d-ary heap. Implements same interface as
+PriorityQueue. Priorities and keys are stored in two parallel lists instead of
+a list of pairs and a dict maps keys to list indexes. Items are moved by
+shifting a hole instead of swapping so every level costs one write to each list
+and to the dict. With larger d the heap has fewer levels which makes push and
+change_priority faster while pop needs to compare more children per level.
+Unlike with PriorityQueue keys with same priority are never compared so they
+don't need to be orderable.
+
+Time complexity of the operations:
+- creation: O(n)
+- push: O(log_d n)
+- pop: O(d log_d n)
+- change priority value: O(log_d n) when decreased, O(d log_d n) when
+  increased
+- query min: O(1)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/D-ary_heap
+"""
+
+
+class DaryHeap(object):
+    """Priority queue that stores priority, key pairs in d-ary heap.
+
+    Attributes:
+        __d: Number of children every node has.
+        __priorities: List of priorities in heap order.
+        __keys: List of keys where __keys[i] has priority __priorities[i].
+        __position: {key: index} dictionary.
+    """
+    def __init__(self, it=tuple(), d=4):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+            d: Optional number of children every node has, at least 2.
+
+        Raises:
+            ValueError: In case d is less than 2.
+        """
+        if d < 2:
+            raise ValueError('d must be at least 2')
+
+        self.__d = d
+        self.__priorities = []
+        self.__keys = []
+        for priority, key in it:
+            self.__priorities.append(priority)
+            self.__keys.append(key)
+        self.__position = {key: i for i, key in enumerate(self.__keys)}
+
+        for index in range((len(self.__keys) - 2) // d, -1, -1):
+            self.__sift_down(index)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __sift_up(self, index):
+        # Moves item at index towards the root until heap property holds
+        priorities = self.__priorities
+        keys = self.__keys
+        position = self.__position
+        d = self.__d
+        priority = priorities[index]
+        key = keys[index]
+
+        while index:
+            parent = (index - 1) // d
+            parent_priority = priorities[parent]
+            if parent_priority <= priority:
+                break
+            priorities[index] = parent_priority
+            keys[index] = keys[parent]
+            position[keys[index]] = index
+            index = parent
+
+        priorities[index] = priority
+        keys[index] = key
+        position[key] = index
+
+    def __sift_down(self, index):
+        # Moves item at index towards the leaves until heap property holds
+        priorities = self.__priorities
+        keys = self.__keys
+        position = self.__position
+        d = self.__d
+        size = len(priorities)
+        priority = priorities[index]
+        key = keys[index]
+
+        while True:
+            first = index * d + 1
+            if first >= size:
+                break
+
+            child = first
+            child_priority = priorities[first]
+            for i in range(first + 1, min(first + d, size)):
+                if priorities[i] < child_priority:
+                    child = i
+                    child_priority = priorities[i]
+
+            if priority <= child_priority:
+                break
+            priorities[index] = child_priority
+            keys[index] = keys[child]
+            position[keys[index]] = index
+            index = child
+
+        priorities[index] = priority
+        keys[index] = key
+        position[key] = index
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+        """
+        self.__priorities.append(priority)
+        self.__keys.append(key)
+        self.__sift_up(len(self.__keys) - 1)
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        return self.__priorities[0], self.__keys[0]
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        priorities = self.__priorities
+        keys = self.__keys
+        priority = priorities[0]
+        key = keys[0]
+        del self.__position[key]
+
+        last_priority = priorities.pop()
+        last_key = keys.pop()
+        if keys:
+            priorities[0] = last_priority
+            keys[0] = last_key
+            self.__sift_down(0)
+
+        return priority, key
+
+    def push_pop(self, priority, key):
+        """Same as push() followed by pop(), just more efficient.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        if not self or priority <= self.__priorities[0]:
+            return priority, key
+
+        return self.replace(priority, key)
+
+    def replace(self, priority, key):
+        """Same as pop() followed by push(), just more efficient.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        result_priority = self.__priorities[0]
+        result_key = self.__keys[0]
+        del self.__position[result_key]
+
+        self.__priorities[0] = priority
+        self.__keys[0] = key
+        self.__sift_down(0)
+
+        return result_priority, result_key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        index = self.__position[key]
+        current = self.__priorities[index]
+        self.__priorities[index] = priority
+
+        if priority > current:
+            self.__sift_down(index)
+        else:
+            self.__sift_up(index)
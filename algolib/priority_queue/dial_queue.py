@@ -0,0 +1,186 @@
+"""Priority queue for integer priorities that stores keys to circular array of
+buckets, also known as Dial's algorithm when used with Dijkstra's algorithm.
+Difference between any two finite priorities in the queue can't exceed the
+span which is the case with Dijkstra's algorithm when span is the maximum edge
+weight. Queue keeps track of lower and upper bound of the finite priorities
+and scans buckets starting from the lower bound. Upper bound isn't lowered
+when items are removed so before a priority is rejected the bounds are
+recomputed from the buckets, the bounds are reset when there are no finite
+items. Buckets are OrderedDicts so keys with same priority
+are returned in insertion order. Items with infinite priority are kept in
+a separate bucket and returned only after all the finite items. Implements same
+interface as PriorityQueue except for the above restriction.
+
+Time complexity of the operations where C is the span:
+- creation: O(n + C)
+- push: O(1), O(C) when the bounds are recomputed
+- pop: O(C)
+- change priority value: O(1), O(C) when the bounds are recomputed
+- query min: O(C)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Bucket_queue
+"""
+from collections import OrderedDict
+
+INF = float('inf')
+
+
+class DialQueue(object):
+    """Priority queue that stores priority, key pairs in circular array of
+    buckets.
+
+    Attributes:
+        __span: Maximum difference between two finite priorities.
+        __buckets: List of span + 1 OrderedDicts where keys with priority p are
+            stored in {key: priority} dictionary __buckets[p % (span + 1)].
+        __infinite: OrderedDict containing items with infinite priority.
+        __low: Lower bound of finite priorities in the queue.
+        __high: Upper bound of finite priorities in the queue.
+        __finite: Number of items with finite priority.
+        __position: {key: bucket} dictionary.
+    """
+    def __init__(self, it=tuple(), span=255):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs where
+                priority is integer or float('inf').
+            span: Optional maximum difference between two finite priorities
+                in the queue.
+        """
+        self.__span = span
+        self.__buckets = [OrderedDict() for _ in range(span + 1)]
+        self.__infinite = OrderedDict()
+        self.__low = self.__high = None
+        self.__finite = 0
+        self.__position = {}
+
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__position)
+
+    def __bucket(self, priority, moving=None):
+        # Returns bucket for given priority, moves the window if needed,
+        # moving is key that is about to be removed from its bucket
+        if priority == INF:
+            return self.__infinite
+
+        if not self.__finite:
+            self.__low = self.__high = priority
+        else:
+            low = min(self.__low, priority)
+            high = max(self.__high, priority)
+            if high - low > self.__span:
+                low, high = self.__tighten(moving)
+                low = min(low, priority)
+                high = max(high, priority)
+                if high - low > self.__span:
+                    raise ValueError('Priority {} is out of span'
+                                     .format(priority))
+            self.__low = low
+            self.__high = high
+
+        self.__finite += 1
+        return self.__buckets[priority % (self.__span + 1)]
+
+    def __tighten(self, moving):
+        # Returns the bounds computed from the buckets, finite items all
+        # reside within span from the lower bound
+        buckets = self.__buckets
+        size = self.__span + 1
+
+        def empty(index):
+            bucket = buckets[index % size]
+            return not bucket or len(bucket) == 1 and moving in bucket
+
+        low = self.__low
+        while empty(low):
+            low += 1
+        high = low + self.__span
+        while empty(high):
+            high -= 1
+
+        return low, high
+
+    def __settle(self):
+        # Advances lower bound to the minimum, returns bucket
+        # containing minimum items
+        if not self.__finite:
+            return self.__infinite
+
+        buckets = self.__buckets
+        size = self.__span + 1
+        while True:
+            bucket = buckets[self.__low % size]
+            if bucket:
+                return bucket
+            self.__low += 1
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Integer priority or float('inf'), difference to other
+                finite priorities in the queue can't exceed span.
+            key: Item key, must be unique and hashable.
+
+        Raises:
+            ValueError: In case priority is out of span.
+        """
+        bucket = self.__bucket(priority)
+        bucket[key] = priority
+        self.__position[key] = bucket
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        bucket = self.__settle()
+        if not bucket:
+            raise IndexError('min from empty queue')
+        key, priority = next(iter(bucket.items()))
+        return priority, key
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        bucket = self.__settle()
+        if not bucket:
+            raise IndexError('pop from empty queue')
+        key, priority = bucket.popitem(last=False)
+        del self.__position[key]
+        if bucket is not self.__infinite:
+            self.__finite -= 1
+
+        return priority, key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: New priority, see push.
+            key: Item key.
+
+        Raises:
+            ValueError: In case priority is out of span.
+        """
+        old_bucket = self.__position[key]
+        finite = old_bucket is not self.__infinite
+        self.__finite -= finite
+        try:
+            bucket = self.__bucket(priority, key)
+        except ValueError:
+            self.__finite += finite
+            raise
+
+        del old_bucket[key]
+        bucket[key] = priority
+        self.__position[key] = bucket
@@ -0,0 +1,240 @@
+"""Priority queue implemented as Fibonacci heap. Heap is a collection of trees
+whose roots are stored in circular doubly linked list with a pointer to the
+minimum root. Push adds a new root and popping the minimum moves its children
+to the root list and then links roots of same degree together until all the
+roots have different degree. Decreasing priority cuts the node to the root list
+and if parent had already lost a child it's cut as well. Increasing priority
+moves children of the node to the root list and resets it. Implements same
+interface as PriorityQueue, keys with same priority are never compared.
+
+Time complexity of the operations, amortized:
+- creation: O(n)
+- push: O(1)
+- pop: O(log n)
+- change priority value: O(1) when decreased, O(log n) when increased
+- query min: O(1)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Fibonacci_heap
+"""
+
+
+# Plain node without any methods
+# pylint: disable=too-few-public-methods
+class _Node(object):
+    """Node of Fibonacci heap.
+
+    Attributes:
+        priority: Priority.
+        key: Key.
+        parent: Parent node or None.
+        child: One of the children or None.
+        left: Previous node in circular list of siblings.
+        right: Next node in circular list of siblings.
+        degree: Number of children.
+        mark: True if node has lost a child since it became child itself.
+    """
+    __slots__ = ('priority', 'key', 'parent', 'child', 'left', 'right',
+                 'degree', 'mark')
+
+    def __init__(self, priority, key):
+        self.priority = priority
+        self.key = key
+        self.parent = None
+        self.child = None
+        self.left = self
+        self.right = self
+        self.degree = 0
+        self.mark = False
+# pylint: enable=too-few-public-methods
+
+
+def _splice(x, y):
+    """Joins two circular lists containing given nodes."""
+    x_right = x.right
+    y_left = y.left
+    x.right = y
+    y.left = x
+    y_left.right = x_right
+    x_right.left = y_left
+
+
+def _unlink(node):
+    """Removes node from its circular list."""
+    node.left.right = node.right
+    node.right.left = node.left
+    node.left = node.right = node
+
+
+class FibonacciHeap(object):
+    """Priority queue that stores priority, key pairs in Fibonacci heap.
+
+    Attributes:
+        __min: Root with minimum priority or None if heap is empty.
+        __position: {key: node} dictionary.
+    """
+    def __init__(self, it=tuple()):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+        """
+        self.__min = None
+        self.__position = {}
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__position)
+
+    def __add_root(self, node):
+        node.parent = None
+        node.mark = False
+        if self.__min is None:
+            self.__min = node
+        else:
+            _splice(self.__min, node)
+            if node.priority < self.__min.priority:
+                self.__min = node
+
+    def __move_children(self, node):
+        # Moves children of node to the root list
+        child = node.child
+        if child is None:
+            return
+
+        current = child
+        while True:
+            current.parent = None
+            current.mark = False
+            current = current.right
+            if current is child:
+                break
+
+        _splice(self.__min, child)
+        node.child = None
+        node.degree = 0
+
+    def __cut(self, node):
+        # Moves node to the root list, cuts also marked ancestors
+        while True:
+            parent = node.parent
+            if parent.child is node:
+                parent.child = node.right if node.right is not node else None
+            _unlink(node)
+            parent.degree -= 1
+            self.__add_root(node)
+
+            if parent.parent is None:
+                break
+            if not parent.mark:
+                parent.mark = True
+                break
+            node = parent
+
+    def __consolidate(self):
+        # Links roots until every root has different degree
+        roots = []
+        current = self.__min
+        while True:
+            roots.append(current)
+            current = current.right
+            if current is self.__min:
+                break
+
+        by_degree = []
+        for node in roots:
+            _unlink(node)
+            while node.degree < len(by_degree) and \
+                    by_degree[node.degree] is not None:
+                other = by_degree[node.degree]
+                by_degree[node.degree] = None
+                if other.priority < node.priority:
+                    node, other = other, node
+                other.parent = node
+                other.mark = False
+                if node.child is None:
+                    node.child = other
+                else:
+                    _splice(node.child, other)
+                node.degree += 1
+
+            while len(by_degree) <= node.degree:
+                by_degree.append(None)
+            by_degree[node.degree] = node
+
+        self.__min = None
+        for node in by_degree:
+            if node is not None:
+                self.__add_root(node)
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+        """
+        node = _Node(priority, key)
+        self.__position[key] = node
+        self.__add_root(node)
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        if self.__min is None:
+            raise IndexError('min from empty queue')
+        return self.__min.priority, self.__min.key
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        node = self.__min
+        if node is None:
+            raise IndexError('pop from empty queue')
+        del self.__position[node.key]
+        self.__move_children(node)
+
+        if node.right is node:
+            self.__min = None
+        else:
+            self.__min = node.right
+            _unlink(node)
+            self.__consolidate()
+
+        return node.priority, node.key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        node = self.__position[key]
+        current = node.priority
+        node.priority = priority
+
+        if priority < current:
+            if node.parent is not None and priority < node.parent.priority:
+                self.__cut(node)
+            elif priority < self.__min.priority:
+                self.__min = node
+        elif priority > current:
+            if node.parent is not None:
+                self.__cut(node)
+            self.__move_children(node)
+
+            if node is self.__min:
+                # Find new minimum from the roots
+                current = node.right
+                while current is not node:
+                    if current.priority < self.__min.priority:
+                        self.__min = current
+                    current = current.right
@@ -0,0 +1,178 @@
+"""Priority queue for small non-negative integer priorities. Keys are stored to
+a list of buckets indexed by priority and a cursor points to the lowest bucket
+that may contain keys. Cursor moves backwards when a lower priority is pushed
+and forward when buckets are empty. Buckets are OrderedDicts so keys with same
+priority are returned in insertion order. Items with infinite priority are
+kept in a separate bucket and returned only after all the finite items. List of
+buckets grows as needed so memory usage depends on the largest priority.
+Implements same interface as BucketQueue.
+
+Time complexity of the operations where C is the largest priority:
+- creation: O(n + C)
+- push: O(1)
+- pop: O(C) worst case, O(1) amortized when priorities don't decrease
+- change priority value: O(1)
+- query min: same as pop
+- remove, contains, get priority: O(1)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Bucket_queue
+"""
+from collections import OrderedDict
+
+INF = float('inf')
+
+
+class IntegerBucketQueue(object):
+    """Priority queue that stores keys to buckets indexed by priority.
+
+    Attributes:
+        __buckets: List of OrderedDicts where __buckets[p] contains keys with
+            priority p as {key: None} dictionary.
+        __infinite: OrderedDict containing keys with infinite priority.
+        __cursor: Index of the lowest bucket that may contain keys.
+        __keys: {key: priority} dictionary.
+    """
+    def __init__(self, it=tuple(), max_priority=0):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs where
+                priority is non-negative integer or float('inf').
+            max_priority: Optional expected maximum priority, buckets up to
+                it are allocated in advance.
+        """
+        self.__buckets = [OrderedDict() for _ in range(max_priority + 1)]
+        self.__infinite = OrderedDict()
+        self.__cursor = 0
+        self.__keys = {}
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __contains__(self, key):
+        return key in self.__keys
+
+    def __bucket(self, priority):
+        # Returns bucket for given priority, creates new buckets if needed
+        if priority == INF:
+            return self.__infinite
+
+        if priority < 0:
+            raise ValueError('Priority must be non-negative')
+
+        buckets = self.__buckets
+        while priority >= len(buckets):
+            buckets.append(OrderedDict())
+        if priority < self.__cursor:
+            self.__cursor = priority
+
+        return buckets[priority]
+
+    def __settle(self):
+        # Moves cursor to the lowest non-empty bucket, returns bucket
+        # containing minimum items
+        buckets = self.__buckets
+        size = len(buckets)
+        cursor = self.__cursor
+        while cursor < size and not buckets[cursor]:
+            cursor += 1
+        self.__cursor = cursor
+
+        return buckets[cursor] if cursor < size else self.__infinite
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Non-negative integer priority or float('inf').
+            key: Item key, must be unique and hashable.
+
+        Raises:
+            ValueError: In case priority is negative.
+        """
+        self.__bucket(priority)[key] = None
+        self.__keys[key] = priority
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        bucket = self.__settle()
+        if not bucket:
+            raise IndexError('min from empty queue')
+        key = next(iter(bucket))
+        return self.__keys[key], key
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        bucket = self.__settle()
+        if not bucket:
+            raise IndexError('pop from empty queue')
+        key, _ = bucket.popitem(last=False)
+        return self.__keys.pop(key), key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: New priority, see push.
+            key: Item key.
+
+        Raises:
+            ValueError: In case priority is negative.
+        """
+        bucket = self.__bucket(priority)
+        self.remove(key)
+        bucket[key] = None
+        self.__keys[key] = priority
+
+    def get_priority(self, key):
+        """Returns priority of a key.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        return self.__keys[key]
+
+    def remove(self, key):
+        """Removes key from the queue.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority of the removed key.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        priority = self.__keys.pop(key)
+        bucket = self.__infinite if priority == INF \
+            else self.__buckets[priority]
+        del bucket[key]
+
+        return priority
+
+    def discard(self, key):
+        """Removes key from the queue if it's present.
+
+        Args:
+            key: Item key.
+        """
+        if key in self.__keys:
+            self.remove(key)
@@ -0,0 +1,275 @@
+"""Double-ended priority queue implemented as min-max heap. Heap is a binary
+tree stored in a list where nodes on even levels are smaller than their
+descendants and nodes on odd levels are larger than their descendants. Minimum
+is the root and maximum is one of its children. Priorities and keys are stored
+in parallel lists with a dict mapping keys to list indexes. Optional capacity
+limits the size of the queue so that pushing to a full queue evicts the item
+with maximum priority which makes it convenient for tracking k smallest items.
+Keys with same priority are never compared.
+
+Time complexity of the operations:
+- creation: O(n log n)
+- push: O(log n)
+- pop min, pop max: O(log n)
+- change priority value, remove: O(log n)
+- query min, max: O(1)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Min-max_heap
+"""
+
+
+def _min_level(index):
+    """Returns True if index is on min level of the heap."""
+    return (index + 1).bit_length() % 2 == 1
+
+
+class MinMaxHeap(object):
+    """Priority queue that gives access to both minimum and maximum items.
+
+    Attributes:
+        capacity: Maximum number of items or None if there's no limit.
+        __priorities: List of priorities in heap order.
+        __keys: List of keys where __keys[i] has priority __priorities[i].
+        __position: {key: index} dictionary.
+    """
+    def __init__(self, it=tuple(), capacity=None):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+            capacity: Optional maximum number of items, when queue is full
+                pushing evicts item with maximum priority.
+
+        Raises:
+            ValueError: In case capacity is less than 1.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('Capacity must be at least 1')
+
+        self.capacity = capacity
+        self.__priorities = []
+        self.__keys = []
+        self.__position = {}
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __contains__(self, key):
+        return key in self.__position
+
+    def __swap(self, x, y):
+        priorities = self.__priorities
+        keys = self.__keys
+        priorities[x], priorities[y] = priorities[y], priorities[x]
+        keys[x], keys[y] = keys[y], keys[x]
+        self.__position[keys[x]] = x
+        self.__position[keys[y]] = y
+
+    def __before(self, x, y, is_min):
+        # Returns True if item at x should be above item at y on given level
+        if is_min:
+            return self.__priorities[x] < self.__priorities[y]
+        return self.__priorities[x] > self.__priorities[y]
+
+    def __bubble_up(self, index):
+        # Moves item up within levels of same kind, returns the final index
+        is_min = _min_level(index)
+        while index > 2:
+            grandparent = ((index - 1) // 2 - 1) // 2
+            if not self.__before(index, grandparent, is_min):
+                break
+            self.__swap(index, grandparent)
+            index = grandparent
+
+        return index
+
+    def __trickle_down(self, index):
+        # Moves item down until it's in order with its descendants
+        size = len(self.__priorities)
+        is_min = _min_level(index)
+
+        while True:
+            first = index * 2 + 1
+            if first >= size:
+                return
+
+            # Find extreme of children and grandchildren
+            best = first
+            for i in (first + 1, first * 2 + 1, first * 2 + 2,
+                      first * 2 + 3, first * 2 + 4):
+                if i >= size:
+                    break
+                if self.__before(i, best, is_min):
+                    best = i
+
+            if not self.__before(best, index, is_min):
+                return
+
+            self.__swap(index, best)
+            if best <= first + 1:
+                return
+
+            # Grandchild, restore order with its parent on the other level
+            parent = (best - 1) // 2
+            if self.__before(parent, best, is_min):
+                self.__swap(best, parent)
+            index = best
+
+    def __fix(self, index):
+        # Restores heap property after item at index has changed
+        if index:
+            parent = (index - 1) // 2
+            is_min = _min_level(index)
+            if self.__before(parent, index, is_min):
+                # Parent belongs below and item above, parent dominates the
+                # subtree so only it needs to trickle down
+                self.__swap(index, parent)
+                self.__bubble_up(parent)
+                self.__trickle_down(index)
+                return
+
+            if self.__bubble_up(index) != index:
+                return
+
+        self.__trickle_down(index)
+
+    def __max_index(self):
+        size = len(self.__priorities)
+        if size < 3:
+            return size - 1
+        return 1 if self.__priorities[1] >= self.__priorities[2] else 2
+
+    def __remove_at(self, index):
+        # Removes item at given index, returns (priority, key)
+        priorities = self.__priorities
+        keys = self.__keys
+        last = len(keys) - 1
+        if index != last:
+            self.__swap(index, last)
+
+        priority = priorities.pop()
+        key = keys.pop()
+        del self.__position[key]
+
+        if index != last:
+            self.__fix(index)
+
+        return priority, key
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue. If queue is full the item with
+        maximum priority is evicted.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+
+        Returns:
+            Evicted item as (priority, key) tuple, can be the pushed item.
+            None if nothing was evicted.
+        """
+        evicted = None
+        if self.capacity is not None and len(self.__keys) >= self.capacity:
+            if priority >= self.max()[0]:
+                return priority, key
+            evicted = self.pop_max()
+
+        self.__priorities.append(priority)
+        self.__keys.append(key)
+        index = len(self.__keys) - 1
+        self.__position[key] = index
+        self.__fix(index)
+
+        return evicted
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        return self.__priorities[0], self.__keys[0]
+
+    def max(self):
+        """Returns maximum item in the priority queue.
+
+        Returns:
+            Maximum item as (priority, key) tuple.
+        """
+        index = self.__max_index()
+        if index < 0:
+            raise IndexError('max from empty queue')
+        return self.__priorities[index], self.__keys[index]
+
+    def pop_min(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        if not self.__keys:
+            raise IndexError('pop from empty queue')
+        return self.__remove_at(0)
+
+    pop = pop_min
+
+    def pop_max(self):
+        """Pops maximum item off the priority queue.
+
+        Returns:
+            Maximum item as (priority, key) tuple.
+        """
+        if not self.__keys:
+            raise IndexError('pop from empty queue')
+        return self.__remove_at(self.__max_index())
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        index = self.__position[key]
+        self.__priorities[index] = priority
+        self.__fix(index)
+
+    def get_priority(self, key):
+        """Returns priority of a key.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        return self.__priorities[self.__position[key]]
+
+    def remove(self, key):
+        """Removes key from the queue.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority of the removed key.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        return self.__remove_at(self.__position[key])[0]
+
+    def discard(self, key):
+        """Removes key from the queue if it's present.
+
+        Args:
+            key: Item key.
+        """
+        if key in self.__position:
+            self.remove(key)
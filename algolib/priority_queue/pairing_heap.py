@@ -0,0 +1,183 @@
+"""Priority queue implemented as pairing heap. Heap is a tree of nodes where
+every node has lower or equal priority than its children. Children are stored
+as linked list so two heaps are melded in O(1) by making the root with higher
+priority the leftmost child of the other one. When the root is popped its
+children are melded in pairs from left to right and then the results from
+right to left. Decreasing priority cuts the subtree of the node and melds it
+with the root. Implements same interface as PriorityQueue, keys with same
+priority are never compared.
+
+Time complexity of the operations, amortized:
+- creation: O(n)
+- push: O(1)
+- pop: O(log n)
+- change priority value: o(log n) when decreased, O(log n) when increased
+- query min: O(1)
+
+For more information see Wikipedia:
+https://en.wikipedia.org/wiki/Pairing_heap
+"""
+
+
+# Plain node without any methods
+# pylint: disable=too-few-public-methods
+class _Node(object):
+    """Node of pairing heap.
+
+    Attributes:
+        priority: Priority.
+        key: Key.
+        child: Leftmost child or None.
+        sibling: Next sibling to the right or None.
+        prev: Previous sibling or parent if node is the leftmost child, None
+            if node is root.
+    """
+    __slots__ = ('priority', 'key', 'child', 'sibling', 'prev')
+
+    def __init__(self, priority, key):
+        self.priority = priority
+        self.key = key
+        self.child = None
+        self.sibling = None
+        self.prev = None
+# pylint: enable=too-few-public-methods
+
+
+def _meld(x, y):
+    """Melds two root nodes and returns the new root."""
+    if y.priority < x.priority:
+        x, y = y, x
+
+    child = x.child
+    y.sibling = child
+    if child is not None:
+        child.prev = y
+    y.prev = x
+    x.child = y
+
+    return x
+
+
+def _meld_children(node):
+    """Melds children of a node with two pass method and returns the root,
+    None if node doesn't have any children."""
+    pairs = []
+    current = node.child
+    while current is not None:
+        first = current
+        second = current.sibling
+        if second is None:
+            current = None
+        else:
+            current = second.sibling
+            second.sibling = second.prev = None
+            first = _meld(first, second)
+        first.sibling = first.prev = None
+        pairs.append(first)
+
+    node.child = None
+    if not pairs:
+        return None
+
+    result = pairs.pop()
+    while pairs:
+        result = _meld(pairs.pop(), result)
+
+    return result
+
+
+class PairingHeap(object):
+    """Priority queue that stores priority, key pairs in pairing heap.
+
+    Attributes:
+        __root: Root node or None if heap is empty.
+        __position: {key: node} dictionary.
+    """
+    def __init__(self, it=tuple()):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+        """
+        self.__root = None
+        self.__position = {}
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__position)
+
+    def __cut(self, node):
+        # Detaches subtree of non-root node
+        prev = node.prev
+        if prev.child is node:
+            prev.child = node.sibling
+        else:
+            prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.sibling = node.prev = None
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+        """
+        node = _Node(priority, key)
+        self.__position[key] = node
+        self.__root = node if self.__root is None \
+            else _meld(self.__root, node)
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        if self.__root is None:
+            raise IndexError('min from empty queue')
+        return self.__root.priority, self.__root.key
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        root = self.__root
+        if root is None:
+            raise IndexError('pop from empty queue')
+        del self.__position[root.key]
+        self.__root = _meld_children(root)
+
+        return root.priority, root.key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        node = self.__position[key]
+        current = node.priority
+        node.priority = priority
+
+        if priority < current:
+            if node is not self.__root:
+                self.__cut(node)
+                self.__root = _meld(self.__root, node)
+        elif priority > current:
+            # Remove node, meld its children and then insert it back
+            if node is self.__root:
+                rest = _meld_children(node)
+            else:
+                self.__cut(node)
+                rest = self.__root
+                children = _meld_children(node)
+                if children is not None:
+                    rest = _meld(rest, children)
+
+            self.__root = node if rest is None else _meld(rest, node)
@@ -3,14 +3,51 @@ kind of  interface as heapq with added change_priority method. Elements are
 stored as priority, key pairs in a list representation of heap with added dict
 mapping keys to list indexes. Note that keys must be unique and hashable.
 
+In lazy mode removed items are not taken out of the heap immediately, instead
+their key is replaced with a tombstone that is discarded when it reaches the
+top of the heap. When more than half of the heap consists of tombstones the
+heap is compacted in one go.
+
 Time complexity of the operations:
 - creation: O(n)
 - push: O(log n)
 - pop: O(log n)
 - change priority value: O(log n)
 - query min: O(1)
+- push k items: O(k log n) or O(n + k) if k is large compared to n
+- pop k items: O(k log n)
+- query k smallest: O(k log k)
+- merge: O(n + m) where m is the size of other queue
+- remove: O(log n), amortized O(1) in lazy mode
+- contains, get priority: O(1)
 """
-from heapq import heapify
+from heapq import heapify, heappop, heappush
+
+
+class _Tombstone(object):
+    """Key of removed item in lazy mode. Tombstone never equals to any key
+    and is less than any key so with equal priorities it's found first."""
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return self is other
+
+    def __ne__(self, other):
+        return self is not other
+
+    def __lt__(self, other):
+        return self is not other
+
+    def __le__(self, _other):
+        return True
+
+    def __gt__(self, _other):
+        return False
+
+    def __ge__(self, other):
+        return self is other
+
+    __hash__ = object.__hash__
 
 
 class PriorityQueue(object):
@@ -18,21 +55,30 @@ class PriorityQueue(object):
     priority queue operations
 
     Attributes:
-        __position: Key: index mapping of items.
+        __position: Key: index mapping of items, includes tombstones.
         __heap: [priority, key] pairs in heapified list.
+        __lazy: True if removed items are replaced with tombstones.
+        __tombstones: Number of tombstones in the heap.
     """
-    def __init__(self, it=tuple()):
+    def __init__(self, it=tuple(), lazy=False):
         """Initializes new object, takes optional iterable as argument.
 
         Args:
             it: Optional iterable containing priority, key pairs.
+            lazy: Optional boolean telling if removed items are only marked
+                as removed and compacted in bulk.
         """
         self.__heap = [list(x) for x in it]
         heapify(self.__heap)
         self.__position = {key: i for i, (_, key) in enumerate(self.__heap)}
+        self.__lazy = lazy
+        self.__tombstones = 0
 
     def __len__(self):
-        return len(self.__heap)
+        return len(self.__heap) - self.__tombstones
+
+    def __contains__(self, key):
+        return key in self.__position
 
     def __swap(self, x, y):
         self.__position[self.__heap[x][1]] = y
@@ -42,7 +88,8 @@ class PriorityQueue(object):
     def __bubble_down(self, index):
         while True:
             min_index = index
-            for i in range(index * 2 + 1, min(len(self), index * 2 + 3)):
+            for i in range(index * 2 + 1,
+                           min(len(self.__heap), index * 2 + 3)):
                 if self.__heap[i] < self.__heap[min_index]:
                     min_index = i
 
@@ -72,12 +119,38 @@ class PriorityQueue(object):
         self.__heap.append([priority, key])
         self.__bubble_up(index)
 
+    def push_many(self, it):
+        """Pushes multiple items to priority queue. In case there are many
+        items compared to the size of the queue they are appended to the heap
+        which is then heapified.
+
+        Args:
+            it: Iterable of priority, key pairs where keys must be unique and
+                hashable.
+        """
+        items = [list(x) for x in it]
+        if len(items) * 4 < len(self.__heap):
+            for priority, key in items:
+                self.push(priority, key)
+            return
+
+        self.__heap.extend(items)
+        self.__rebuild()
+
+    def __rebuild(self):
+        # Heapifies the list and updates positions
+        heapify(self.__heap)
+        self.__position = {key: i for i, (_, key) in enumerate(self.__heap)}
+
     def min(self):
         """Returns minimum item in the priority queue.
 
         Returns:
             Minimum item as (priority, key) tuple.
         """
+        if self.__tombstones:
+            self.__purge()
+
         return tuple(self.__heap[0])
 
     def pop(self):
@@ -86,15 +159,54 @@ class PriorityQueue(object):
         Returns:
             Minimum item as (priority, key) tuple.
         """
-        priority, key = self.__heap[0]
-        self.__swap(0, len(self.__heap) - 1)
-        del self.__position[key]
-        del self.__heap[-1]
+        if self.__tombstones:
+            self.__purge()
 
-        if self:
-            self.__bubble_down(0)
+        return self.__remove_at(0)
 
-        return priority, key
+    def pop_many(self, k):
+        """Pops k minimum items off the priority queue.
+
+        Args:
+            k: Number of items to pop.
+
+        Returns:
+            List of at most k (priority, key) tuples in priority order.
+        """
+        return [self.pop() for _ in range(min(k, len(self)))]
+
+    def nsmallest(self, k):
+        """Returns k minimum items without removing them. Heap is traversed
+        from the root with an auxiliary heap so only the returned items and
+        their children are visited.
+
+        Args:
+            k: Number of items to return.
+
+        Returns:
+            List of at most k (priority, key) tuples in priority order.
+        """
+        heap = self.__heap
+        result = []
+        candidates = [(heap[0], 0)] if heap and k > 0 else []
+        while candidates and len(result) < k:
+            item, index = heappop(candidates)
+            if not isinstance(item[1], _Tombstone):
+                result.append(tuple(item))
+            for child in range(index * 2 + 1, min(len(heap), index * 2 + 3)):
+                heappush(candidates, (heap[child], child))
+
+        return result
+
+    def merge(self, other):
+        """Adds all the items from another priority queue to this one, other
+        queue is not modified.
+
+        Args:
+            other: PriorityQueue whose keys are not present in this queue.
+        """
+        self.push_many(item for item in other.__heap
+                       if not isinstance(item[1], _Tombstone))
 
     def push_pop(self, priority, key):
         """Same as push() followed by pop(), just more efficient.
@@ -106,6 +218,9 @@ class PriorityQueue(object):
         Returns:
             Minimum item as (priority, key) tuple.
         """
+        if self.__tombstones:
+            self.__purge()
+
         if not self or priority <= self.__heap[0][0]:
             return priority, key
 
@@ -128,6 +243,9 @@ class PriorityQueue(object):
         Returns:
             Minimum item as (priority, key) tuple.
         """
+        if self.__tombstones:
+            self.__purge()
+
         result_priority, result_key = self.__heap[0]
         del self.__position[result_key]
 
@@ -152,3 +270,85 @@ class PriorityQueue(object):
             self.__bubble_down(index)
         else:
             self.__bubble_up(index)
+
+    def __remove_at(self, index):
+        # Removes item at given index from heap, returns (priority, key)
+        last = len(self.__heap) - 1
+        if index != last:
+            self.__swap(index, last)
+        priority, key = self.__heap.pop()
+        del self.__position[key]
+
+        if index != last:
+            if index and self.__heap[index] < self.__heap[(index - 1) // 2]:
+                self.__bubble_up(index)
+            else:
+                self.__bubble_down(index)
+
+        return priority, key
+
+    def __purge(self):
+        # Removes tombstones from the top of the heap
+        heap = self.__heap
+        while heap and isinstance(heap[0][1], _Tombstone):
+            self.__remove_at(0)
+            self.__tombstones -= 1
+
+    def __compact(self):
+        # Removes all the tombstones
+        self.__heap = [item for item in self.__heap
+                       if not isinstance(item[1], _Tombstone)]
+        self.__tombstones = 0
+        self.__rebuild()
+
+    def get_priority(self, key):
+        """Returns priority of a key.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        return self.__heap[self.__position[key]][0]
+
+    def remove(self, key):
+        """Removes key from the queue.
+
+        Args:
+            key: Item key.
+
+        Returns:
+            Priority of the removed key.
+
+        Raises:
+            KeyError: In case key is not in the queue.
+        """
+        index = self.__position[key]
+        if not self.__lazy:
+            return self.__remove_at(index)[0]
+
+        # Replace key with a tombstone, tombstone takes over the position
+        item = self.__heap[index]
+        tombstone = _Tombstone()
+        item[1] = tombstone
+        del self.__position[key]
+        self.__position[tombstone] = index
+        self.__tombstones += 1
+
+        if self.__tombstones * 2 > len(self.__heap):
+            self.__compact()
+
+        return item[0]
+
+    def discard(self, key):
+        """Removes key from the queue if it's present.
+
+        Args:
+            key: Item key.
+        """
+        if key in self.__position:
+            self.remove(key)
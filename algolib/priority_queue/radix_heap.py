@@ -0,0 +1,149 @@
+"""Monotone priority queue for non-negative integer priorities implemented as
+radix heap. Popped priorities must never decrease which makes it suitable for
+Dijkstra's algorithm with integer weights. Keys are stored to buckets based on
+the highest bit where their priority differs from the last popped priority.
+When bucket 0 runs empty the lowest non-empty bucket is redistributed to lower
+buckets, every key can move down at most log C times where C is the largest
+priority. Items with infinite priority are kept in a separate bucket and
+returned only after all the finite items. Implements same interface as
+PriorityQueue except that priority can't be lower than the last popped one.
+
+Time complexity of the operations, amortized:
+- creation: O(n)
+- push: O(1)
+- pop: O(log C)
+- change priority value: O(1)
+- query min: O(log C + size of the lowest non-empty bucket)
+
+For more information see:
+https://en.wikipedia.org/wiki/Radix_heap
+"""
+from collections import OrderedDict
+
+INF = float('inf')
+
+
+class RadixHeap(object):
+    """Radix heap that stores priority, key pairs.
+
+    Attributes:
+        __last: Last popped priority or lower bound of all priorities.
+        __buckets: List of OrderedDicts where __buckets[i] contains
+            {key: priority} items whose priority differs from __last at bit
+            i - 1 and not in any higher bit.
+        __infinite: OrderedDict containing items with infinite priority.
+        __position: {key: bucket} dictionary.
+    """
+    def __init__(self, it=tuple()):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs where
+                priority is non-negative integer or float('inf').
+        """
+        self.__last = 0
+        self.__buckets = [OrderedDict()]
+        self.__infinite = OrderedDict()
+        self.__position = {}
+        for priority, key in it:
+            self.push(priority, key)
+
+    def __len__(self):
+        return len(self.__position)
+
+    def __bucket(self, priority):
+        # Returns bucket for given priority, creates new buckets if needed
+        if priority == INF:
+            return self.__infinite
+
+        if priority < self.__last:
+            raise ValueError('Priority {} is less than last popped {}'
+                             .format(priority, self.__last))
+
+        index = (priority ^ self.__last).bit_length()
+        buckets = self.__buckets
+        while index >= len(buckets):
+            buckets.append(OrderedDict())
+
+        return buckets[index]
+
+    def __settle(self):
+        # Makes sure that bucket 0 contains minimum items if there are any
+        # finite items, returns bucket containing minimum items
+        buckets = self.__buckets
+        if buckets[0]:
+            return buckets[0]
+
+        bucket = next((b for b in buckets if b), None)
+        if bucket is None:
+            return self.__infinite
+
+        self.__last = min(bucket.values())
+        for key, priority in bucket.items():
+            target = self.__bucket(priority)
+            target[key] = priority
+            self.__position[key] = target
+        bucket.clear()
+
+        return buckets[0]
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue.
+
+        Args:
+            priority: Non-negative integer priority not less than last
+                popped priority or float('inf').
+            key: Item key, must be unique and hashable.
+
+        Raises:
+            ValueError: In case priority is less than last popped priority.
+        """
+        bucket = self.__bucket(priority)
+        bucket[key] = priority
+        self.__position[key] = bucket
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        # Buckets are not redistributed since that would raise the lower
+        # bound above the last popped priority
+        buckets = self.__buckets
+        bucket = next((b for b in buckets if b), self.__infinite)
+        if not bucket:
+            raise IndexError('min from empty queue')
+        if bucket is buckets[0] or bucket is self.__infinite:
+            key, priority = next(iter(bucket.items()))
+        else:
+            key, priority = min(bucket.items(), key=lambda item: item[1])
+        return priority, key
+
+    def pop(self):
+        """Pops minimum item off the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        bucket = self.__settle()
+        if not bucket:
+            raise IndexError('pop from empty queue')
+        key, priority = bucket.popitem(last=False)
+        del self.__position[key]
+        return priority, key
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: New priority, see push.
+            key: Item key.
+
+        Raises:
+            ValueError: In case priority is less than last popped priority.
+        """
+        bucket = self.__bucket(priority)
+        del self.__position[key][key]
+        bucket[key] = priority
+        self.__position[key] = bucket
@@ -0,0 +1,91 @@
+"""Thread-safe front-end for priority queues. Every operation is done while
+holding a lock and pop can block until an item is available or timeout
+expires. Any priority queue implementing the same interface as PriorityQueue
+can be used underneath.
+
+Time complexity of the operations is the same as with the underlying queue.
+"""
+from queue import Empty
+from threading import Condition
+from algolib.priority_queue.priority_queue import PriorityQueue
+
+
+class SynchronizedQueue(object):
+    """Priority queue that can be shared between threads.
+
+    Attributes:
+        __queue: Underlying priority queue.
+        __condition: Condition used to lock the queue and to wait for items.
+    """
+    def __init__(self, it=tuple(), queue_constructor=PriorityQueue):
+        """Initializes new object, takes optional iterable as argument.
+
+        Args:
+            it: Optional iterable containing priority, key pairs.
+            queue_constructor: Optional constructor of the underlying queue.
+        """
+        self.__queue = queue_constructor(it)
+        self.__condition = Condition()
+
+    def __len__(self):
+        with self.__condition:
+            return len(self.__queue)
+
+    def push(self, priority, key):
+        """Pushes new item to priority queue and wakes up one thread waiting
+        for an item.
+
+        Args:
+            priority: Priority.
+            key: Item key, must be unique and hashable.
+        """
+        with self.__condition:
+            self.__queue.push(priority, key)
+            self.__condition.notify()
+
+    def min(self):
+        """Returns minimum item in the priority queue.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+        """
+        with self.__condition:
+            return self.__queue.min()
+
+    def pop(self, block=True, timeout=None):
+        """Pops minimum item off the priority queue.
+
+        Args:
+            block: Optional boolean telling if call blocks until there's an
+                item available.
+            timeout: Optional maximum number of seconds to block, None to
+                block without a limit.
+
+        Returns:
+            Minimum item as (priority, key) tuple.
+
+        Raises:
+            queue.Empty: In case queue is empty and block is False or there
+                was no item available within timeout.
+        """
+        with self.__condition:
+            if block:
+                available = self.__condition.wait_for(
+                    lambda: len(self.__queue), timeout)
+            else:
+                available = len(self.__queue)
+
+            if not available:
+                raise Empty
+
+            return self.__queue.pop()
+
+    def change_priority(self, priority, key):
+        """Changes priority of a key.
+
+        Args:
+            priority: Priority.
+            key: Item key.
+        """
+        with self.__condition:
+            self.__queue.change_priority(priority, key)
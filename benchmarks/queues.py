@@ -0,0 +1,413 @@
+"""Benchmarks priority queue implementations by replaying operation traces.
+Traces are recorded from dijkstra and prim running on generated graphs or
+generated directly for workloads that don't come from the graph algorithms:
+
+- dijkstra on a grid, a road like network with jittered vertices and
+  occasional diagonals, a power-law graph grown by preferential attachment
+  and a complete graph
+- prim on a grid with unique edge weights
+- timer wheel where timers are scheduled, cancelled before they expire and
+  popped as the clock advances
+- scheduler with only a few distinct priorities and lots of changes
+
+Every trace is replayed against each queue implementation. Results contain
+operations per second for the whole trace, average cost of every operation
+type, bytes of memory per element at peak queue size and whether the popped
+priorities matched the recorded ones. Implementations that can't run a trace,
+for example RadixHeap on non-monotone priorities or queues without remove on
+the timer wheel, are reported with the error instead. Results are printed as
+JSON so they can be stored and compared between revisions.
+
+Run from repository root: python benchmarks/queues.py --help
+"""
+import argparse
+from functools import partial
+import json
+import math
+import os
+import platform
+import sys
+import tracemalloc
+from random import Random
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..')))
+from algolib.graph import Undirected, dijkstra, prim
+from algolib.priority_queue import PriorityQueue, BucketQueue, \
+    IntegerBucketQueue, DaryHeap, RadixHeap, DialQueue, PairingHeap, \
+    FibonacciHeap, MinMaxHeap
+
+INF = float('inf')
+
+# Lazy PriorityQueue is included to compare eager and lazy removal
+QUEUES = [(queue.__name__, queue) for queue in
+          [PriorityQueue, BucketQueue, IntegerBucketQueue, DaryHeap, RadixHeap,
+           DialQueue, PairingHeap, FibonacciHeap, MinMaxHeap]] + \
+    [('PriorityQueue(lazy=True)', partial(PriorityQueue, lazy=True))]
+
+PUSH, POP, CHANGE, REMOVE, MIN = range(5)
+OPERATION_NAMES = ['push', 'pop', 'change_priority', 'remove', 'min']
+
+
+class Trace(object):
+    """Recorded sequence of queue operations.
+
+    Attributes:
+        initial: List of priority, key pairs given to the constructor.
+        operations: List of (operation, priority, key) tuples.
+        popped: List of priorities returned by pop in order.
+    """
+    def __init__(self, initial=()):
+        self.initial = list(initial)
+        self.operations = []
+        self.popped = []
+
+    def counts(self):
+        """Returns {operation name: count} dictionary."""
+        counts = dict.fromkeys(OPERATION_NAMES, 0)
+        counts['initial'] = len(self.initial)
+        for operation, _, _ in self.operations:
+            counts[OPERATION_NAMES[operation]] += 1
+
+        return {name: count for name, count in counts.items() if count}
+
+
+class Recorder(object):
+    """Queue that records the operations to a trace and forwards them to
+    PriorityQueue.
+
+    Attributes:
+        trace: Trace where operations are recorded.
+        queue: Underlying PriorityQueue.
+    """
+    def __init__(self, it=tuple()):
+        self.trace = Trace(it)
+        self.queue = PriorityQueue(self.trace.initial)
+
+    def __len__(self):
+        return len(self.queue)
+
+    def push(self, priority, key):
+        self.trace.operations.append((PUSH, priority, key))
+        self.queue.push(priority, key)
+
+    def pop(self):
+        self.trace.operations.append((POP, None, None))
+        item = self.queue.pop()
+        self.trace.popped.append(item[0])
+        return item
+
+    def change_priority(self, priority, key):
+        self.trace.operations.append((CHANGE, priority, key))
+        self.queue.change_priority(priority, key)
+
+    def min(self):
+        self.trace.operations.append((MIN, None, None))
+        return self.queue.min()
+
+
+def record(algorithm, *args):
+    """Runs algorithm with Recorder as queue constructor, returns the trace."""
+    recorders = []
+
+    def constructor(it):
+        recorders.append(Recorder(it))
+        return recorders[-1]
+
+    algorithm(*args, queue_constructor=constructor)
+    return recorders[0].trace
+
+
+def grid(size, rng, weights=None):
+    """Returns size x size grid with random integer weights from 1 to 100 or
+    from given list."""
+    graph = Undirected()
+    for x in range(size):
+        for y in range(size):
+            for other in ((x + 1, y), (x, y + 1)):
+                if other[0] < size and other[1] < size:
+                    weight = weights.pop() if weights else rng.randint(1, 100)
+                    graph.insert_edge((x, y), other, weight=weight)
+
+    return graph
+
+
+def road(size, rng):
+    """Returns road like network, vertices are jittered grid points connected
+    to nearby points with integer weights proportional to distance."""
+    points = {(x, y): (x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3))
+              for x in range(size) for y in range(size)}
+    graph = Undirected()
+    for (x, y), point in points.items():
+        graph.insert_vertex((x, y))
+        for dx, dy, probability in ((1, 0, 0.9), (0, 1, 0.9), (1, 1, 0.1)):
+            other = (x + dx, y + dy)
+            if other in points and rng.random() < probability:
+                distance = math.hypot(point[0] - points[other][0],
+                                      point[1] - points[other][1])
+                graph.insert_edge((x, y), other,
+                                  weight=max(1, int(distance * 50)))
+
+    return graph
+
+
+def power_law(vertices, rng, degree=3):
+    """Returns power-law graph grown by preferential attachment where every
+    new vertex is connected to given number of existing vertices."""
+    graph = Undirected()
+    targets = list(range(degree))
+    repeated = []
+    for vertex in range(degree, vertices):
+        for target in set(targets):
+            graph.insert_edge(vertex, target, weight=rng.randint(1, 100))
+        repeated.extend(targets)
+        repeated.extend([vertex] * degree)
+        targets = [rng.choice(repeated) for _ in range(degree)]
+
+    return graph
+
+
+def dense(vertices, rng):
+    """Returns complete graph with random integer weights from 1 to 100."""
+    graph = Undirected()
+    for x in range(vertices):
+        for y in range(x):
+            graph.insert_edge(x, y, weight=rng.randint(1, 100))
+
+    return graph
+
+
+def timer_wheel(timers, rng, cancel=0.3, max_delay=200):
+    """Returns trace where timers are scheduled with integer delays, part of
+    them cancelled before they expire and the expired ones popped as the
+    clock advances tick by tick."""
+    trace = Trace()
+    operations = trace.operations
+    deadlines = {}
+    now = 0
+    key = 0
+    while key < timers or deadlines:
+        for _ in range(rng.randint(0, 4) if key < timers else 0):
+            deadlines[key] = now + rng.randint(1, max_delay)
+            operations.append((PUSH, deadlines[key], key))
+            key += 1
+        if deadlines and rng.random() < cancel:
+            cancelled = rng.choice(list(deadlines))
+            operations.append((REMOVE, None, cancelled))
+            del deadlines[cancelled]
+
+        now += 1
+        for expired in sorted(deadlines.values()):
+            if expired > now:
+                break
+            operations.append((POP, None, None))
+            trace.popped.append(expired)
+        deadlines = {k: d for k, d in deadlines.items() if d > now}
+
+    return trace
+
+
+def duplicates(items, rng, priorities=8, batch=1000):
+    """Returns trace where batches of items with only a few distinct
+    priorities are pushed, half of them get their priority changed and then
+    the batch is drained."""
+    trace = Trace()
+    operations = trace.operations
+    for start in range(0, items, batch):
+        keys = range(start, min(start + batch, items))
+        current = {}
+        for key in keys:
+            current[key] = rng.randrange(priorities)
+            operations.append((PUSH, current[key], key))
+        for key in rng.sample(keys, len(keys) // 2):
+            current[key] = rng.randrange(priorities)
+            operations.append((CHANGE, current[key], key))
+        for priority in sorted(current.values()):
+            operations.append((POP, None, None))
+            trace.popped.append(priority)
+
+    return trace
+
+
+def prim_grid(side, rng):
+    """Returns trace of prim on a grid with unique edge weights so that
+    the trace doesn't depend on the order of equal priorities."""
+    weights = list(range(1, 2 * side * (side - 1) + 1))
+    rng.shuffle(weights)
+    return record(prim, grid(side, rng, weights))
+
+
+WORKLOADS = {
+    'dijkstra_grid': lambda side, rng: record(dijkstra, grid(side, rng),
+                                              (0, 0)),
+    'dijkstra_road': lambda side, rng: record(dijkstra, road(side, rng),
+                                              (0, 0)),
+    'dijkstra_power_law': lambda side, rng: record(
+        dijkstra, power_law(side * side, rng), 0),
+    'dijkstra_dense': lambda side, rng: record(dijkstra,
+                                               dense(2 * side, rng), 0),
+    'prim_grid': prim_grid,
+    'timer_wheel': lambda side, rng: timer_wheel(side * side, rng),
+    'duplicates': lambda side, rng: duplicates(side * side, rng)
+}
+
+
+def replay(trace, constructor, popped=None):
+    """Replays trace against queue created with constructor. If popped list
+    is given priorities returned by pop are appended to it."""
+    queue = constructor(trace.initial)
+    push = queue.push
+    pop = queue.pop
+    change = queue.change_priority
+    remove = getattr(queue, 'remove', None)
+    for operation, priority, key in trace.operations:
+        if operation == PUSH:
+            push(priority, key)
+        elif operation == POP:
+            item = pop()
+            if popped is not None:
+                popped.append(item[0])
+        elif operation == CHANGE:
+            change(priority, key)
+        elif operation == REMOVE:
+            remove(key)
+        else:
+            queue.min()
+
+
+def profile(trace, constructor):
+    """Replays trace timing every operation, returns {operation name:
+    average nanoseconds} dictionary."""
+    queue = constructor(trace.initial)
+    methods = [queue.push, queue.pop, queue.change_priority,
+               getattr(queue, 'remove', None), queue.min]
+    totals = [0.0] * len(methods)
+    counts = [0] * len(methods)
+
+    # Timer overhead is subtracted from every measurement
+    overhead = INF
+    for _ in range(1000):
+        start = perf_counter()
+        overhead = min(overhead, perf_counter() - start)
+
+    for operation, priority, key in trace.operations:
+        method = methods[operation]
+        if operation in (POP, MIN):
+            start = perf_counter()
+            method()
+        elif operation == REMOVE:
+            start = perf_counter()
+            method(key)
+        else:
+            start = perf_counter()
+            method(priority, key)
+        totals[operation] += perf_counter() - start - overhead
+        counts[operation] += 1
+
+    return {OPERATION_NAMES[i]: round(max(total, 0) / counts[i] * 1e9, 1)
+            for i, total in enumerate(totals) if counts[i]}
+
+
+def peak_size(trace):
+    """Returns the maximum number of items in the queue during the trace."""
+    size = peak = len(trace.initial)
+    for operation, _, _ in trace.operations:
+        if operation == PUSH:
+            size += 1
+        elif operation in (POP, REMOVE):
+            size -= 1
+        peak = max(peak, size)
+
+    return peak
+
+
+def memory(trace, constructor):
+    """Replays trace with tracemalloc, returns peak bytes per element."""
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        replay(trace, constructor)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return round(peak / max(peak_size(trace), 1), 1)
+
+
+def benchmark(trace, constructor, repeat):
+    """Returns results of a queue implementation on trace as dictionary."""
+    if any(operation == REMOVE for operation, _, _ in trace.operations) \
+            and not hasattr(constructor(), 'remove'):
+        return {'error': 'remove not supported'}
+
+    try:
+        popped = []
+        replay(trace, constructor, popped)
+    except (ValueError, TypeError, KeyError, IndexError) as error:
+        return {'error': '{}: {}'.format(type(error).__name__, error)}
+
+    best = INF
+    for _ in range(repeat):
+        start = perf_counter()
+        replay(trace, constructor)
+        best = min(best, perf_counter() - start)
+
+    operations = len(trace.initial) + len(trace.operations)
+    return {
+        'seconds': round(best, 6),
+        'ops_per_sec': round(operations / best),
+        'ns_per_op': profile(trace, constructor),
+        'bytes_per_element': memory(trace, constructor),
+        'correct': popped == trace.popped
+    }
+
+
+def main(argv=None):
+    names = [name for name, _ in QUEUES]
+    parser = argparse.ArgumentParser(
+        description='Benchmarks priority queues by replaying workloads.')
+    parser.add_argument('--workload', action='append',
+                        choices=sorted(WORKLOADS),
+                        help='workload to run, can be repeated, default all')
+    parser.add_argument('--queue', action='append', choices=names,
+                        help='queue to benchmark, can be repeated, default '
+                        'all')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiplier for workload sizes, default 1.0')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timed runs, best is reported')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed for the random workloads')
+    parser.add_argument('--output', help='file to write JSON results to, '
+                        'default standard output')
+    args = parser.parse_args(argv)
+
+    queues = [(name, queue) for name, queue in QUEUES
+              if not args.queue or name in args.queue]
+    results = {
+        'python': platform.python_version(),
+        'scale': args.scale,
+        'seed': args.seed,
+        'workloads': {}
+    }
+    side = max(2, int(100 * math.sqrt(args.scale)))
+    for workload in sorted(args.workload or WORKLOADS):
+        trace = WORKLOADS[workload](side, Random(args.seed))
+        results['workloads'][workload] = {
+            'operations': trace.counts(),
+            'queues': {name: benchmark(trace, queue, args.repeat)
+                       for name, queue in queues}
+        }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,3 +3,4 @@ import sys
 
 sys.path.insert(0, os.path.abspath('../..'))
 from algolib.disjoint_set import DisjointSet
+from algolib.disjoint_set import IntDisjointSet
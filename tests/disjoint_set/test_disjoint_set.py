@@ -7,6 +7,16 @@ class TestDisjointSet(TestCase):
     def test_len(self):
         self.assertEqual(8, len(DisjointSet(range(8))))
 
+    def test_add(self):
+        ds = DisjointSet(range(2))
+        ds.union(0, 1)
+        ds.add(1)
+        ds.add(2)
+        self.assertEqual(3, len(ds))
+        self.assertEqual([0, 1, 2], sorted(ds))
+        self.assertTrue(ds.same_component(0, 1))
+        self.assertFalse(ds.same_component(1, 2))
+
     def test_find(self):
         ds = DisjointSet(range(8))
         window = 1
@@ -20,11 +30,26 @@ class TestDisjointSet(TestCase):
             for i in range(window - 1, 8, window):
                 ds.union(i - i % window, i)
 
+    def test_union_returns_merged(self):
+        ds = DisjointSet(range(3))
+        self.assertTrue(ds.union(0, 1))
+        self.assertFalse(ds.union(1, 0))
+        self.assertTrue(ds.union(2, 1))
+
+    def test_find_long_chain(self):
+        ds = DisjointSet(range(10000))
+        for i in range(9999):
+            ds._parent[i] = i + 1
+        self.assertEqual(9999, ds.find(0))
+        self.assertEqual([2, 4, 6], [ds._parent[i] for i in range(0, 6, 2)])
+        self.assertEqual([2, 4, 6], [ds._parent[i] for i in range(1, 7, 2)])
+        self.assertEqual(9999, ds.find(1))
+
     def test_union_updates_size(self):
         ds = DisjointSet(range(12))
         for i in range(12):
             ds.union(0, i)
-            self.assertEqual(i + 1, max(ds._items[j][1] for j in range(i + 1)))
+            self.assertEqual(i + 1, max(ds._size[j] for j in range(i + 1)))
 
     def test_union_limits_height(self):
         ds = DisjointSet(range(8))
@@ -37,9 +62,9 @@ class TestDisjointSet(TestCase):
         max_height = 0
         for i in range(8):
             height = 1
-            while ds._items[i][0] != i:
+            while ds._parent[i] != i:
                 height += 1
-                i = ds._items[i][0]
+                i = ds._parent[i]
             max_height = max(max_height, height)
 
         self.assertLessEqual(int(ceil(log(8, 2))), max_height)
@@ -0,0 +1,45 @@
+from random import Random
+from unittest import TestCase
+from .context import DisjointSet, IntDisjointSet
+
+
+class TestIntDisjointSet(TestCase):
+    def test_len(self):
+        self.assertEqual(8, len(IntDisjointSet(8)))
+        self.assertEqual(0, len(IntDisjointSet(0)))
+        self.assertRaises(ValueError, IntDisjointSet, -1)
+
+    def test_iter(self):
+        self.assertEqual([0, 1, 2], list(IntDisjointSet(3)))
+
+    def test_union(self):
+        ds = IntDisjointSet(4)
+        self.assertTrue(ds.union(0, 1))
+        self.assertTrue(ds.union(3, 2))
+        self.assertFalse(ds.union(1, 0))
+        self.assertTrue(ds.same_component(0, 1))
+        self.assertFalse(ds.same_component(1, 2))
+        self.assertTrue(ds.union(0, 3))
+        self.assertEqual(1, len({ds.find(i) for i in range(4)}))
+        self.assertEqual(4, ds._size[ds.find(0)])
+
+    def test_find_long_chain(self):
+        ds = IntDisjointSet(10000)
+        for i in range(9999):
+            ds._parent[i] = i + 1
+        self.assertEqual(9999, ds.find(0))
+        self.assertEqual([2, 4, 6], [ds._parent[i] for i in range(0, 6, 2)])
+        self.assertEqual([2, 4, 6], [ds._parent[i] for i in range(1, 7, 2)])
+
+    def test_random(self):
+        rng = Random(0)
+        ds = IntDisjointSet(200)
+        expected = DisjointSet(range(200))
+        for _ in range(300):
+            x = rng.randrange(200)
+            y = rng.randrange(200)
+            self.assertEqual(expected.union(x, y), ds.union(x, y))
+            x = rng.randrange(200)
+            y = rng.randrange(200)
+            self.assertEqual(expected.same_component(x, y),
+                             ds.same_component(x, y))
@@ -6,7 +6,7 @@ from algolib.graph import Undirected
 from algolib.graph import Directed
 from algolib.graph import DFS
 from algolib.graph import BFS
-from algolib.graph import bipartite
+from algolib.graph import bipartite, bipartition, odd_cycle
 from algolib.graph import top_sort
 from algolib.graph import cut_edges, cut_vertices
 from algolib.graph import strong_components
@@ -15,3 +15,21 @@ from algolib.graph import kruskal
 from algolib.graph import dijkstra, dijkstra_path
 from algolib.graph import floyd
 from algolib.graph import edmonds_karp
+from algolib.graph import GraphView, ReversedView
+from algolib.graph import induced_subgraph, edge_subgraph, reversed_graph
+from algolib.graph import MultiDirected
+from algolib.graph import MultiUndirected
+from algolib.graph import pagerank, pagerank_top
+from algolib.graph import triangles, clustering, global_clustering
+from algolib.graph import core_number, k_core
+from algolib.graph import DistanceOracle
+from algolib.graph import ContractionHierarchy
+from algolib.graph import Stats
+from algolib.graph import k_shortest_paths
+from algolib.graph import DynamicShortestPaths
+from algolib.graph import label_propagation, louvain, modularity
+from algolib.graph import partition, part_subgraphs, edge_cut
+from algolib.graph import stream_components, stream_kruskal, degree_stats
+from algolib.graph import ReachabilityIndex
+from algolib.graph.neighbors import neighbor_set
+from algolib.graph.directed import SnapshotDict
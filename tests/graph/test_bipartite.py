@@ -1,5 +1,6 @@
 import unittest
-from .context import Undirected, bipartite
+from .context import Undirected, Directed, MultiUndirected, MultiDirected, \
+    bipartite, bipartition, odd_cycle
 
 EDGES = [
     [8, 4],
@@ -33,3 +34,73 @@ class TestBipartite(unittest.TestCase):
             for x, y in case:
                 copy.insert_edge(x, y)
             self.assertEqual(expected, bipartite(copy), str(case) + ' fails')
+
+    def test_bipartite_ignores_direction(self):
+        graph = Directed()
+        graph.insert_edge(0, 1)
+        graph.insert_edge(2, 1)
+        graph.insert_edge(2, 3)
+        self.assertTrue(bipartite(graph))
+
+        graph.insert_edge(3, 1)
+        self.assertFalse(bipartite(graph))
+
+    def test_bipartition(self):
+        graph = Undirected()
+        for x, y in EDGES:
+            graph.insert_edge(x, y)
+        graph.insert_vertex(10)
+
+        first, second = bipartition(graph)
+        self.assertEqual(set(graph.vertices), first | second)
+        self.assertFalse(first & second)
+        for x, y in graph.edges:
+            if x != y:
+                self.assertNotEqual(x in first, y in first)
+
+    def test_bipartition_not_bipartite(self):
+        graph = Undirected()
+        for x, y in EDGES:
+            graph.insert_edge(x, y)
+        graph.insert_edge(3, 5)
+
+        self.assertIsNone(bipartition(graph))
+
+    def test_odd_cycle(self):
+        graph = Undirected()
+        for x, y in EDGES:
+            graph.insert_edge(x, y)
+
+        self.assertIsNone(odd_cycle(graph))
+
+        for case, expected in CASES:
+            copy = graph.copy()
+            for x, y in case:
+                copy.insert_edge(x, y)
+
+            cycle = odd_cycle(copy)
+            if expected:
+                self.assertIsNone(cycle)
+                continue
+
+            self.assertEqual(1, len(cycle) % 2, str(case) + ' fails')
+            self.assertEqual(len(cycle), len(set(cycle)))
+            for i, vertex in enumerate(cycle):
+                self.assertTrue(copy.connected(cycle[i - 1], vertex))
+
+    def test_multigraph(self):
+        for cls in (MultiUndirected, MultiDirected):
+            graph = cls()
+            graph.insert_edge('a', 'b')
+            graph.insert_edge('b', 'a')
+            graph.insert_edge('b', 'c')
+            graph.insert_edge('c', 'c')
+            self.assertEqual(({'a', 'c'}, {'b'}), bipartition(graph))
+
+            graph.insert_edge('c', 'a')
+            self.assertFalse(bipartite(graph))
+            cycle = odd_cycle(graph)
+            self.assertEqual(['a', 'b', 'c'], sorted(cycle))
+            for i, vertex in enumerate(cycle):
+                self.assertTrue(graph.connected(cycle[i - 1], vertex) or
+                                graph.connected(vertex, cycle[i - 1]))
@@ -0,0 +1,93 @@
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, MultiUndirected, \
+    label_propagation, louvain, modularity
+
+
+def cliques(cls=Undirected, count=4, size=6, seed=0):
+    # Cliques connected to a ring with single edges
+    rng = Random(seed)
+    graph = cls()
+    for c in range(count):
+        members = range(c * size, (c + 1) * size)
+        for x in members:
+            for y in members:
+                if x < y:
+                    graph.insert_edge(x, y)
+        graph.insert_edge(c * size + rng.randrange(size),
+                          ((c + 1) % count) * size + rng.randrange(size))
+
+    return graph
+
+
+def expected(count=4, size=6):
+    return sorted(set(range(c * size, (c + 1) * size)) for c in range(count))
+
+
+class TestCommunity(TestCase):
+    def test_louvain(self):
+        for cls in [Undirected, Directed, MultiUndirected]:
+            for seed in range(5):
+                result = louvain(cliques(cls), seed=seed)
+                self.assertEqual(expected(), sorted(result, key=min))
+
+    def test_louvain_resolution(self):
+        graph = cliques()
+        result = louvain(graph, resolution=0.01, seed=0)
+        self.assertEqual(1, len(result))
+
+    def test_louvain_weight(self):
+        # Heavy edges between vertex pairs dominate
+        graph = Undirected()
+        for x in range(8):
+            graph.insert_edge(x, (x + 1) % 8, weight=10 if x % 2 else 1)
+        result = louvain(graph, seed=0)
+        self.assertEqual([{1, 2}, {3, 4}, {5, 6}, {7, 0}],
+                         sorted(result, key=lambda c: min(c - {0}) or 8))
+        self.assertEqual(1, len(louvain(graph, weight=None, resolution=0.1,
+                                        seed=0)))
+
+    def test_label_propagation(self):
+        for seed in range(5):
+            result = label_propagation(cliques(), seed=seed)
+            self.assertEqual(expected(), sorted(result, key=min))
+
+    def test_label_propagation_seed(self):
+        graph = cliques(count=10, size=4, seed=1)
+        self.assertEqual(label_propagation(graph, seed=3),
+                         label_propagation(graph, seed=3))
+
+    def test_label_propagation_processes(self):
+        graph = cliques(count=6)
+        result = label_propagation(graph, seed=0, processes=2)
+        self.assertEqual(expected(count=6), sorted(result, key=min))
+
+    def test_isolated(self):
+        graph = Undirected()
+        graph.insert_vertex(0)
+        graph.insert_edge(1, 2)
+        self.assertEqual([{0}, {1, 2}],
+                         sorted(louvain(graph), key=min))
+        self.assertEqual([{0}, {1, 2}],
+                         sorted(label_propagation(graph), key=min))
+        self.assertEqual([], louvain(Undirected()))
+
+    def test_modularity(self):
+        graph = cliques()
+        single = [set(graph.vertices)]
+        self.assertAlmostEqual(0, modularity(graph, single))
+        self.assertGreater(modularity(graph, expected()), 0.6)
+        self.assertLess(modularity(graph, [{v} for v in graph.vertices]), 0)
+        self.assertEqual(0, modularity(Undirected(), []))
+
+        graph = Undirected()
+        graph.insert_edge(0, 1)
+        graph.insert_edge(2, 3)
+        self.assertAlmostEqual(0.5, modularity(graph, [{0, 1}, {2, 3}]))
+
+        rng = Random(0)
+        graph = Undirected()
+        for _ in range(300):
+            graph.insert_edge(rng.randrange(60), rng.randrange(60))
+        result = louvain(graph, seed=0)
+        self.assertGreater(modularity(graph, result), 0.2)
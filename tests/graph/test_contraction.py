@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, MultiDirected, \
+    ContractionHierarchy, dijkstra, dijkstra_path
+
+
+def random_graph(cls, seed, vertices=80, edges=250):
+    rng = Random(seed)
+    graph = cls()
+    for i in range(vertices):
+        graph.insert_vertex(i)
+    for _ in range(edges):
+        graph.insert_edge(rng.randrange(vertices), rng.randrange(vertices),
+                          weight=rng.randint(0, 20))
+
+    return graph
+
+
+def grid(size):
+    graph = Undirected()
+    for x in range(size):
+        for y in range(size):
+            if x + 1 < size:
+                graph.insert_edge((x, y), (x + 1, y), weight=1 + (x * y) % 3)
+            if y + 1 < size:
+                graph.insert_edge((x, y), (x, y + 1), weight=1 + (x + y) % 2)
+
+    return graph
+
+
+class TestContractionHierarchy(TestCase):
+    def check(self, graph, hierarchy, sources):
+        for source in sources:
+            expected = dijkstra(graph, source)
+            for target in graph.vertices:
+                distance = expected[target][0]
+                self.assertEqual(distance, hierarchy.distance(source, target))
+
+                result = hierarchy.shortest_path(source, target)
+                path = dijkstra_path(result, source, target)
+                if distance == float('inf'):
+                    self.assertIsNone(path)
+                    continue
+
+                self.assertEqual(source, path[0])
+                self.assertEqual(target, path[-1])
+                self.assertEqual(distance, result[target][0])
+                self.assertEqual(distance,
+                                 sum(min(graph.edges[e]['weight']
+                                         for e in graph.edges_between(x, y))
+                                     for x, y in zip(path, path[1:])))
+
+    def test_random_graphs(self):
+        for seed in range(3):
+            for cls in [Undirected, Directed]:
+                graph = random_graph(cls, seed)
+                hierarchy = ContractionHierarchy(graph)
+                self.check(graph, hierarchy, range(0, 80, 19))
+
+    def test_grid(self):
+        graph = grid(8)
+        hierarchy = ContractionHierarchy(graph, settle_limit=5)
+        self.assertEqual(64, len(hierarchy.rank))
+        self.check(graph, hierarchy, [(0, 0), (3, 4), (7, 7)])
+
+    def test_multigraph(self):
+        graph = random_graph(MultiDirected, 0, edges=300)
+        self.check(graph, ContractionHierarchy(graph), range(0, 80, 13))
+
+    def test_save_and_load(self):
+        graph = random_graph(Directed, 5)
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'hierarchy')
+            ContractionHierarchy(graph).save(path)
+            self.check(graph, ContractionHierarchy.load(path), [0, 1, 2])
+        finally:
+            shutil.rmtree(directory)
@@ -1,6 +1,7 @@
 import unittest
-from .context import Directed
+from .context import Directed, SnapshotDict
 from collections import Counter
+from random import Random
 
 EDGES = [
     [0, 1],
@@ -181,3 +182,126 @@ class TestDirected(unittest.TestCase):
 
         # Check that we've written the test right
         self.assertEqual(self.g, other)
+
+    def test_snapshot(self):
+        snapshot = self.g.snapshot()
+        self.assertEqual(self.g, snapshot)
+        self.assertIs(self.g[1], snapshot[1])
+
+        self.g.insert_edge(4, 5)
+
+        # Rows that weren't touched are still shared
+        self.assertIs(self.g[3], snapshot[3])
+
+        self.g.remove_edge(1, 3)
+        self.g.remove_vertex(2)
+        self.assertEqual(self.initialize_graph(), snapshot)
+        self.assertEqual({1, 3, 4}, set(snapshot[1]))
+        self.assertEqual({0, 1, 2}, set(snapshot.incoming[1]))
+        self.assertNotIn(5, snapshot.vertices)
+
+        expected = self.initialize_graph()
+        expected.insert_edge(4, 5)
+        expected.remove_edge(1, 3)
+        expected.remove_vertex(2)
+        self.assertEqual(expected, self.g)
+        self.assertEqual({1, 4}, set(self.g[1]))
+        self.assertEqual({0, 1}, set(self.g.incoming[1]))
+
+    def test_snapshot_edge_to_new_target(self):
+        graph = Directed()
+        graph.insert_edge('a', 'b')
+        snapshot = graph.snapshot()
+        graph.insert_edge('c', 'b')
+        self.assertEqual({'a'}, set(snapshot.incoming['b']))
+        self.assertEqual(1, snapshot.degree_in('b'))
+        self.assertEqual({'a', 'c'}, set(graph.incoming['b']))
+
+    def test_snapshot_read_doesnt_insert(self):
+        snapshot = self.g.snapshot()
+        self.assertEqual({}, snapshot[5])
+        self.assertEqual([], list(snapshot.edges_from(5)))
+        self.assertEqual(0, snapshot.degree_in(5))
+        self.assertEqual(0, snapshot.degree_out(5))
+        self.assertNotIn(5, self.g._outgoing)
+        self.assertNotIn(5, self.g.incoming)
+        self.assertEqual({}, snapshot.incoming[5])
+        self.assertEqual({}, self.g.incoming[5])
+
+    def test_snapshot_write_doesnt_copy(self):
+        graph = Directed()
+        for i in range(1000):
+            graph.insert_edge(i, i + 1)
+        snapshot = graph.snapshot()
+        graph.insert_edge(0, 2)
+        graph.remove_vertex(500)
+
+        # Changes go on top of the dicts shared with the snapshot
+        self.assertIsInstance(graph.edges, SnapshotDict)
+        self.assertEqual(3, graph.edges._changes)
+        self.assertIs(graph.edges._layers[0], snapshot.edges._layers[0])
+        self.assertEqual(1000, len(snapshot.edges))
+        self.assertEqual(999, len(graph.edges))
+        self.assertNotIn(500, graph.vertices)
+        self.assertEqual({0, 1}, set(graph.incoming[2]))
+        self.assertEqual({1}, set(snapshot.incoming[2]))
+
+        # Once there are enough changes dicts are merged back to plain ones
+        for i in range(1000):
+            graph.insert_edge(i, i + 3)
+        self.assertNotIsInstance(graph.edges, SnapshotDict)
+        self.assertEqual(1000, len(snapshot.edges))
+
+    def test_snapshot_random(self):
+        rng = Random(0)
+        graph = Directed()
+        expected = []
+        for _ in range(200):
+            for _ in range(rng.randint(0, 30)):
+                x, y = rng.randrange(40), rng.randrange(40)
+                if graph.connected(x, y):
+                    graph.remove_edge(x, y)
+                elif rng.random() < 0.1 and x in graph.vertices:
+                    graph.remove_vertex(x)
+                else:
+                    graph.insert_edge(x, y, weight=rng.random())
+            expected.append((graph.snapshot(), graph.copy()))
+
+        for snapshot, copy in expected:
+            self.assertEqual(copy, snapshot)
+            for vertex in copy.vertices:
+                self.assertEqual(copy[vertex], snapshot[vertex])
+                self.assertEqual(copy.incoming[vertex],
+                                 snapshot.incoming[vertex])
+
+    def test_snapshot_dict(self):
+        rng = Random(0)
+        mapping, other = SnapshotDict.share({})
+        dicts = [(other, {})]
+        expected = {}
+        for _ in range(2000):
+            key = rng.randrange(50)
+            if key in expected and rng.random() < 0.3:
+                self.assertEqual(expected.pop(key), mapping.pop(key))
+            else:
+                expected[key] = mapping[key] = rng.random()
+            if rng.random() < 0.05:
+                mapping, other = SnapshotDict.share(mapping)
+                dicts.append((other, dict(expected)))
+            mapping = SnapshotDict.settled(mapping)
+
+        dicts.append((mapping, expected))
+        for mapping, expected in dicts:
+            self.assertEqual(len(expected), len(mapping))
+            self.assertEqual(expected, dict(mapping.items()))
+            self.assertEqual(sorted(expected), sorted(mapping))
+
+    def test_snapshot_can_be_modified(self):
+        snapshot = self.g.snapshot()
+        second = snapshot.snapshot()
+        snapshot.insert_edge(4, 0)
+        self.assertEqual(self.initialize_graph(), self.g)
+        self.assertEqual(self.initialize_graph(), second)
+        self.assertTrue(snapshot.connected(4, 0))
+        self.assertEqual(2, snapshot.degree_in(0))
+        self.assertEqual(1, self.g.degree_in(0))
@@ -0,0 +1,124 @@
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, MultiDirected, \
+    DynamicShortestPaths, dijkstra
+
+EDGES = [
+    [0, 1, 5],
+    [0, 2, 12],
+    [0, 3, 7],
+    [1, 3, 9],
+    [1, 4, 7],
+    [2, 3, 4],
+    [2, 5, 7],
+    [3, 4, 4],
+    [3, 5, 3],
+    [4, 5, 2],
+    [4, 6, 5],
+    [5, 6, 2]
+]
+
+
+def create(cls, edges):
+    graph = cls()
+    for x, y, w in edges:
+        graph.insert_edge(x, y, weight=w)
+
+    return graph
+
+
+def random_graph(cls, rng, vertices=40, edges=120):
+    graph = cls()
+    for v in range(vertices):
+        graph.insert_vertex(v)
+    for _ in range(edges):
+        graph.insert_edge(rng.randrange(vertices), rng.randrange(vertices),
+                          weight=rng.randint(0, 10))
+
+    return graph
+
+
+class TestDynamicShortestPaths(TestCase):
+    def check(self, sssp):
+        graph = sssp.graph
+        expected = dijkstra(graph, sssp.source)
+        for vertex, (distance, parent) in sssp.result.items():
+            self.assertEqual(expected[vertex][0], distance)
+            if parent is not None:
+                self.assertEqual(
+                    distance,
+                    sssp.result[parent][0] + graph[parent][vertex]['weight'])
+                self.assertIn(vertex, sssp._children[parent])
+
+        for parent, children in sssp._children.items():
+            for child in children:
+                self.assertEqual(parent, sssp.result[child][1])
+
+    def test_path(self):
+        graph = create(Undirected, EDGES)
+        sssp = DynamicShortestPaths(graph, 0)
+        self.assertEqual([0, 3, 5, 6], sssp.path(6))
+        self.assertEqual(12, sssp.distance(6))
+
+        sssp.update_weight(0, 1, 0)
+        self.assertEqual([0, 1, 4, 5, 6], sssp.path(6))
+        self.assertEqual(11, sssp.distance(6))
+        self.check(sssp)
+
+        sssp.update_weight(3, 5, 10)
+        self.assertEqual([0, 1, 4, 5, 6], sssp.path(6))
+        self.assertEqual(9, sssp.distance(5))
+        self.check(sssp)
+
+        sssp.update_weight(4, 5, 20)
+        self.assertEqual([0, 1, 4, 6], sssp.path(6))
+        self.assertEqual([0, 1, 4, 6, 5], sssp.path(5))
+        self.check(sssp)
+
+    def test_given_result(self):
+        graph = create(Directed, EDGES)
+        result = dijkstra(graph, 0)
+        sssp = DynamicShortestPaths(graph, 0, result)
+        sssp.update_weight(0, 3, 100)
+        self.assertEqual(7, result[3][0])
+        self.assertEqual(14, sssp.distance(3))
+        self.check(sssp)
+
+    def test_unreachable(self):
+        graph = create(Directed, EDGES)
+        sssp = DynamicShortestPaths(graph, 5)
+        self.assertIsNone(sssp.path(0))
+        sssp.update_weight(5, 6, 1)
+        self.assertEqual(1, sssp.distance(6))
+        self.assertEqual(float('inf'), sssp.distance(0))
+
+    def test_errors(self):
+        graph = create(Directed, EDGES)
+        sssp = DynamicShortestPaths(graph, 0)
+        self.assertRaises(ValueError, sssp.update_weight, 0, 1, -1)
+        self.assertRaises(KeyError, sssp.update_weight, 1, 0, 1)
+        self.assertRaises(ValueError, DynamicShortestPaths, MultiDirected(), 0)
+
+    def test_snapshot(self):
+        for cls in [Undirected, Directed]:
+            graph = create(cls, EDGES)
+            graph.insert_edge(0, 1, name='a')
+            snapshot = graph.snapshot()
+            sssp = DynamicShortestPaths(graph, 0)
+            sssp.update_weight(0, 1, 2)
+            self.assertEqual({'weight': 5, 'name': 'a'}, snapshot[0][1])
+            self.assertEqual({'weight': 2, 'name': 'a'}, graph[0][1])
+            self.assertEqual(2, sssp.distance(1))
+            self.check(sssp)
+
+    def test_random(self):
+        rng = Random(0)
+        for cls in [Undirected, Directed]:
+            for _ in range(5):
+                graph = random_graph(cls, rng)
+                sssp = DynamicShortestPaths(graph, 0)
+                edges = list(graph.edges)
+                for _ in range(50):
+                    x, y = rng.choice(edges)
+                    sssp.update_weight(x, y, rng.randint(0, 10))
+                    self.check(sssp)
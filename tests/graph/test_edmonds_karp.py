@@ -86,3 +86,18 @@ class TestEdmondsKarp(TestCase):
                 graph.insert_edge(x, y, capacity=c)
             result_graph, flow = edmonds_karp(graph, case['from'], case['to'])
             self.assertEqual(case['expected'], flow)
+
+    def test_keeps_properties(self):
+        graph = Directed()
+        graph.insert_edge(0, 1, capacity=3, name='a')
+        graph.insert_edge(1, 2, capacity=2, name='b')
+        graph.insert_edge(2, 1, capacity=1, name='c')
+        result, flow = edmonds_karp(graph, 0, 2)
+        self.assertEqual(2, flow)
+        self.assertEqual({'name': 'a', 'flow': 2, 'capacity': 1},
+                         result.edges[(0, 1)])
+        self.assertEqual({'name': 'b', 'flow': 2, 'capacity': 0},
+                         result.edges[(1, 2)])
+        self.assertEqual({'capacity': 3, 'name': 'a'}, graph.edges[(0, 1)])
+        self.assertEqual({'capacity': 2, 'name': 'b'}, graph.edges[(1, 2)])
+        self.assertEqual({'capacity': 1, 'name': 'c'}, graph.edges[(2, 1)])
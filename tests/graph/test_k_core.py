@@ -0,0 +1,49 @@
+from unittest import TestCase
+from .context import Undirected, Directed, core_number, k_core
+
+#   0 - 1
+#   | X |
+#   2 - 3 - 4 - 6
+#        \ /
+#         5   7
+EDGES = [
+    [0, 1],
+    [0, 2],
+    [0, 3],
+    [1, 2],
+    [1, 3],
+    [2, 3],
+    [3, 4],
+    [3, 5],
+    [4, 5],
+    [4, 6],
+    [6, 6]
+]
+
+
+class TestKCore(TestCase):
+    def test_core_number(self):
+        for cls in [Undirected, Directed]:
+            graph = cls()
+            for x, y in EDGES:
+                graph.insert_edge(x, y)
+            graph.insert_vertex(7)
+
+            self.assertEqual({0: 3, 1: 3, 2: 3, 3: 3, 4: 2, 5: 2, 6: 1, 7: 0},
+                             core_number(graph))
+
+    def test_core_number_empty(self):
+        self.assertEqual({}, core_number(Undirected()))
+
+    def test_k_core(self):
+        graph = Undirected()
+        for x, y in EDGES:
+            graph.insert_edge(x, y)
+
+        self.assertEqual({0, 1, 2, 3}, set(k_core(graph, 3).vertices))
+        self.assertEqual({0, 1, 2, 3, 4, 5}, set(k_core(graph, 2).vertices))
+        self.assertEqual(set(), set(k_core(graph, 4).vertices))
+
+        view = k_core(graph, 2)
+        for vertex in view.vertices:
+            self.assertLessEqual(2, len(view[vertex]))
@@ -0,0 +1,108 @@
+from itertools import islice
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, MultiDirected, k_shortest_paths
+
+EDGES = [
+    ['C', 'D', 3],
+    ['C', 'E', 2],
+    ['D', 'F', 4],
+    ['E', 'D', 1],
+    ['E', 'F', 2],
+    ['E', 'G', 3],
+    ['F', 'G', 2],
+    ['F', 'H', 1],
+    ['G', 'H', 2]
+]
+
+
+def create(cls, edges):
+    graph = cls()
+    for x, y, w in edges:
+        graph.insert_edge(x, y, weight=w)
+
+    return graph
+
+
+def random_graph(cls, seed, vertices=9, edges=24):
+    rng = Random(seed)
+    graph = cls()
+    for v in range(vertices):
+        graph.insert_vertex(v)
+    for _ in range(edges):
+        x, y = rng.randrange(vertices), rng.randrange(vertices)
+        if x != y:
+            graph.insert_edge(x, y, weight=rng.randint(0, 5))
+
+    return graph
+
+
+def all_paths(graph, source, target):
+    # Brute force enumeration of simple paths
+    result = []
+
+    def visit(path, distance):
+        vertex = path[-1]
+        if vertex == target:
+            result.append((distance, list(path)))
+            return
+        for other, properties in graph[vertex].items():
+            if other not in path:
+                path.append(other)
+                visit(path, distance + properties['weight'])
+                path.pop()
+
+    visit([source], 0)
+    return sorted(result)
+
+
+def path_distance(graph, path):
+    return sum(graph[x][y]['weight'] for x, y in zip(path, path[1:]))
+
+
+class TestKShortestPaths(TestCase):
+    def test_directed(self):
+        graph = create(Directed, EDGES)
+        result = list(islice(k_shortest_paths(graph, 'C', 'H'), 3))
+        self.assertEqual([
+            (5, ['C', 'E', 'F', 'H']),
+            (7, ['C', 'E', 'G', 'H']),
+            (8, ['C', 'D', 'F', 'H'])
+        ], result[:1] + sorted(result[1:]))
+
+    def test_not_modified(self):
+        graph = create(Directed, EDGES)
+        edges = dict(graph.edges)
+        list(k_shortest_paths(graph, 'C', 'H'))
+        self.assertEqual(edges, graph.edges)
+
+    def test_unreachable(self):
+        graph = create(Directed, EDGES)
+        self.assertEqual([], list(k_shortest_paths(graph, 'H', 'C')))
+
+    def test_same_vertex(self):
+        graph = create(Directed, EDGES)
+        self.assertEqual([(0, ['C'])], list(k_shortest_paths(graph, 'C', 'C')))
+
+    def test_multigraph(self):
+        graph = MultiDirected()
+        graph.insert_edge('a', 'b', weight=1)
+        self.assertRaises(ValueError, k_shortest_paths, graph, 'a', 'b')
+
+    def test_lazy(self):
+        graph = create(Undirected, EDGES)
+        paths = k_shortest_paths(graph, 'C', 'H')
+        self.assertEqual((5, ['C', 'E', 'F', 'H']), next(paths))
+
+    def test_random(self):
+        for cls in [Undirected, Directed]:
+            for seed in range(20):
+                graph = random_graph(cls, seed)
+                expected = all_paths(graph, 0, 1)
+                result = list(k_shortest_paths(graph, 0, 1))
+                self.assertEqual([d for d, _ in expected],
+                                 [d for d, _ in result])
+                self.assertEqual(sorted(p for _, p in expected),
+                                 sorted(p for _, p in result))
+                for distance, path in result:
+                    self.assertEqual(distance, path_distance(graph, path))
@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, DistanceOracle, dijkstra
+
+
+def random_graph(cls, seed=0, vertices=60, edges=200):
+    rng = Random(seed)
+    graph = cls()
+    for _ in range(edges):
+        graph.insert_edge(rng.randrange(vertices), rng.randrange(vertices),
+                          weight=rng.randint(1, 10))
+    graph.insert_vertex(vertices)
+
+    return graph
+
+
+class TestDistanceOracle(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check_bounds(self, graph, oracle):
+        for source in graph.vertices:
+            distances = dijkstra(graph, source)
+            for dest in graph.vertices:
+                lower, upper = oracle.bounds(source, dest)
+                self.assertLessEqual(lower, distances[dest][0])
+                self.assertGreaterEqual(upper, distances[dest][0])
+
+    def test_bounds(self):
+        for cls in [Undirected, Directed]:
+            graph = random_graph(cls)
+            oracle = DistanceOracle(graph, 4)
+            self.assertEqual(4, len(set(oracle.landmarks)))
+            self.check_bounds(graph, oracle)
+
+    def test_exact_for_landmarks(self):
+        graph = random_graph(Directed)
+        oracle = DistanceOracle(graph, 0, landmarks=[3, 7])
+        self.assertEqual([3, 7], oracle.landmarks)
+
+        distances = dijkstra(graph, 3)
+        for vertex in graph.vertices:
+            self.assertEqual(distances[vertex][0],
+                             oracle.lower_bound(3, vertex))
+            self.assertEqual(distances[vertex][0],
+                             oracle.upper_bound(3, vertex))
+
+    def test_unreachable(self):
+        graph = random_graph(Undirected)
+        oracle = DistanceOracle(graph, 2)
+        self.assertEqual(float('inf'), oracle.lower_bound(0, 60))
+        self.assertEqual(float('inf'), oracle.upper_bound(0, 60))
+        self.assertEqual((0, 0), oracle.bounds(60, 60))
+
+    def test_save_and_load(self):
+        for cls in [Undirected, Directed]:
+            graph = random_graph(cls, seed=1)
+            oracle = DistanceOracle(graph, 3)
+            path = os.path.join(self.directory, 'oracle')
+            oracle.save(path)
+            loaded = DistanceOracle.load(path)
+
+            self.assertEqual(oracle.landmarks, loaded.landmarks)
+            for source in range(0, 60, 7):
+                for dest in range(60):
+                    self.assertEqual(oracle.bounds(source, dest),
+                                     loaded.bounds(source, dest))
@@ -0,0 +1,107 @@
+import unittest
+from .context import MultiDirected, BFS, DFS, dijkstra, dijkstra_path, \
+    edmonds_karp, induced_subgraph
+
+EDGES = [
+    [0, 1],
+    [0, 1],
+    [0, 2],
+    [1, 1],
+    [1, 3],
+    [1, 3],
+    [2, 1],
+    [3, 0]
+]
+
+
+class TestMultiDirected(unittest.TestCase):
+    def setUp(self):
+        self.g = MultiDirected()
+        self.ids = [self.g.insert_edge(x, y, index=i)
+                    for i, (x, y) in enumerate(EDGES)]
+
+    def test_insert_edge_returns_unique_ids(self):
+        self.assertEqual(list(range(len(EDGES))), self.ids)
+        self.assertEqual(len(EDGES), len(self.g.edges))
+        for i, (x, y) in enumerate(EDGES):
+            self.assertEqual((x, y), self.g.endpoints(i))
+            self.assertEqual({'index': i}, self.g.edges[i])
+
+    def test_parallel_edges(self):
+        self.assertEqual([0, 1], list(self.g.edges_between(0, 1)))
+        self.assertTrue(self.g.connected(0, 1))
+        self.assertFalse(self.g.connected(1, 0))
+        self.assertEqual(3, self.g.degree_out(0))
+        self.assertEqual(4, self.g.degree_in(1))
+        self.assertEqual([(0, 1), (1, 1), (2, 2)],
+                         list(self.g.edges_from(0)))
+
+    def test_remove_edge(self):
+        self.g.remove_edge(0)
+        self.assertEqual([1], list(self.g.edges_between(0, 1)))
+        self.assertNotIn(0, self.g.edges)
+        self.assertEqual(len(EDGES) - 1, len(self.g.edges))
+        self.assertEqual(3, self.g.degree_in(1))
+
+        with self.assertRaises(KeyError):
+            self.g.remove_edge(0)
+
+        # Removed ids are reused
+        self.assertEqual(0, self.g.insert_edge(3, 2))
+        self.assertEqual((3, 2), self.g.endpoints(0))
+
+    def test_remove_vertex(self):
+        self.g.remove_vertex(1)
+        self.assertNotIn(1, self.g.vertices)
+        self.assertEqual({2, 7}, set(self.g.edges))
+        self.assertEqual(0, self.g.degree_out(2))
+
+    def test_copy(self):
+        self.g.remove_edge(3)
+        other = self.g.copy()
+        self.assertEqual(self.g, other)
+        self.assertEqual(3, other.insert_edge(1, 1))
+
+        other = self.g.copy()
+        other.edges[0]['index'] = -1
+        self.assertNotEqual(self.g, other)
+
+    def test_traversals(self):
+        bfs = BFS(self.g)
+        bfs.execute(0)
+        self.assertEqual(1, bfs[3].parent)
+
+        dfs = DFS(self.g)
+        dfs.execute(2)
+        self.assertEqual(3, dfs[0].parent)
+
+    def test_dijkstra_uses_lightest_parallel_edge(self):
+        graph = MultiDirected()
+        graph.insert_edge(0, 1, weight=5)
+        graph.insert_edge(0, 1, weight=1)
+        graph.insert_edge(1, 2, weight=1)
+        graph.insert_edge(0, 2, weight=3)
+
+        result = dijkstra(graph, 0)
+        self.assertEqual(2, result[2][0])
+        self.assertEqual([0, 1, 2], dijkstra_path(result, 0, 2))
+
+    def test_edmonds_karp_sums_parallel_edges(self):
+        graph = MultiDirected()
+        graph.insert_edge(0, 1, capacity=2)
+        graph.insert_edge(0, 1, capacity=3)
+        graph.insert_edge(1, 2, capacity=10)
+        graph.insert_edge(2, 1, capacity=1)
+
+        result, flow = edmonds_karp(graph, 0, 2)
+        self.assertEqual(5, flow)
+        self.assertEqual(5, result[0][1]['flow'])
+
+    def test_view(self):
+        view = induced_subgraph(self.g, [0, 1])
+        self.assertEqual({0, 1, 3}, set(view.edges))
+        self.assertEqual({0, 1}, set(view[0]))
+        self.assertEqual({0, 1, 3}, set(view.incoming[1]))
+        copy = view.copy()
+        self.assertEqual(3, len(copy.edges))
+        self.assertEqual(2, len(list(copy.edges_between(0, 1))))
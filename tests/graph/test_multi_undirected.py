@@ -0,0 +1,70 @@
+import unittest
+from .context import MultiUndirected, BFS, dijkstra, edmonds_karp
+
+EDGES = [
+    [8, 4],
+    [4, 1],
+    [4, 1],
+    [1, 0],
+    [1, 3],
+    [0, 2],
+    [2, 2],
+    [2, 2],
+    [2, 6]
+]
+
+
+class TestMultiUndirected(unittest.TestCase):
+    def setUp(self):
+        self.g = MultiUndirected()
+        for i, (x, y) in enumerate(EDGES):
+            self.g.insert_edge(x, y, index=i)
+
+    def test_parallel_edges(self):
+        self.assertEqual([1, 2], list(self.g.edges_between(4, 1)))
+        self.assertEqual([1, 2], list(self.g.edges_between(1, 4)))
+        self.assertTrue(self.g.connected(1, 4))
+        self.assertFalse(self.g.connected(1, 2))
+        self.assertEqual(3, self.g.degree(4))
+        self.assertEqual({(1, 4), (2, 4), (3, 0), (4, 3)},
+                         set(self.g.edges_from(1)))
+
+    def test_loops(self):
+        self.assertEqual(6, self.g.degree(2))
+        self.assertEqual([6, 7], list(self.g.edges_between(2, 2)))
+        self.g.remove_edge(6)
+        self.assertEqual(4, self.g.degree(2))
+        self.g.remove_edge(7)
+        self.assertEqual(2, self.g.degree(2))
+
+    def test_remove_edge(self):
+        self.g.remove_edge(1)
+        self.assertEqual([2], list(self.g.edges_between(1, 4)))
+        self.assertEqual(2, self.g.degree(4))
+        self.assertEqual(len(EDGES) - 1, len(self.g.edges))
+
+    def test_remove_vertex(self):
+        self.g.remove_vertex(2)
+        self.assertNotIn(2, self.g.vertices)
+        self.assertEqual({0, 1, 2, 3, 4}, set(self.g.edges))
+        self.assertEqual(1, self.g.degree(0))
+        self.assertEqual(0, self.g.degree(6))
+
+    def test_copy(self):
+        other = self.g.copy()
+        self.assertEqual(self.g, other)
+        self.assertEqual(6, other.degree(2))
+        other.remove_edge(6)
+        self.assertNotEqual(self.g, other)
+
+    def test_algorithms(self):
+        bfs = BFS(self.g)
+        bfs.execute(8)
+        self.assertEqual(2, bfs[6].parent)
+
+        graph = MultiUndirected()
+        graph.insert_edge(0, 1, weight=3, capacity=1)
+        graph.insert_edge(1, 0, weight=2, capacity=2)
+        graph.insert_edge(1, 2, weight=1, capacity=4)
+        self.assertEqual(3, dijkstra(graph, 0)[2][0])
+        self.assertEqual(3, edmonds_karp(graph, 2, 0)[1])
@@ -0,0 +1,17 @@
+from unittest import TestCase
+from .context import Undirected, Directed, MultiUndirected, MultiDirected, \
+    neighbor_set
+
+
+class TestNeighborSet(TestCase):
+    def test_neighbor_set(self):
+        for cls in (Undirected, Directed, MultiUndirected, MultiDirected):
+            graph = cls()
+            graph.insert_edge(0, 1)
+            graph.insert_edge(1, 0)
+            graph.insert_edge(2, 0)
+            graph.insert_edge(0, 0)
+            graph.insert_vertex(3)
+            self.assertEqual({1, 2}, neighbor_set(graph, 0))
+            self.assertEqual({0}, neighbor_set(graph, 2))
+            self.assertEqual(set(), neighbor_set(graph, 3))
@@ -0,0 +1,165 @@
+from importlib import import_module
+from random import Random
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from .context import Directed, Undirected, MultiDirected, pagerank, \
+    pagerank_top
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+EDGES = [
+    ['a', 'b'],
+    ['a', 'c'],
+    ['b', 'c'],
+    ['c', 'a'],
+    ['d', 'c']
+]
+
+# Ranks calculated with damping 0.85, vertex 'e' is dangling
+EXPECTED = {
+    'a': 0.3591,
+    'b': 0.1887,
+    'c': 0.3799,
+    'd': 0.0361,
+    'e': 0.0361
+}
+
+
+def build(cls=Directed):
+    graph = cls()
+    for x, y in EDGES:
+        graph.insert_edge(x, y)
+    graph.insert_vertex('e')
+
+    return graph
+
+
+def reference(graph, damping=0.85, teleport=None, iterations=200):
+    # Straightforward power iteration to compare against
+    vertices = list(graph.vertices)
+    n = len(vertices)
+    teleport = teleport or {v: 1.0 / n for v in vertices}
+    rank = {v: 1.0 / n for v in vertices}
+    for _ in range(iterations):
+        lost = sum(rank[v] for v in vertices if not graph.degree_out(v))
+        new = {v: (1 - damping + damping * lost) * teleport.get(v, 0)
+               for v in vertices}
+        for (x, y) in graph.edges:
+            new[y] += damping * rank[x] / graph.degree_out(x)
+        rank = new
+
+    return rank
+
+
+class TestPageRank(TestCase):
+    def assert_ranks(self, expected, result, places=4):
+        self.assertEqual(set(expected), set(result))
+        for vertex in expected:
+            self.assertAlmostEqual(expected[vertex], result[vertex], places)
+
+    def test_pagerank(self):
+        result = pagerank(build(), use_numpy=False)
+        self.assert_ranks(EXPECTED, result)
+        self.assertAlmostEqual(1, sum(result.values()))
+
+    @skipIf(numpy is None, 'NumPy not installed')
+    def test_pagerank_numpy(self):
+        self.assert_ranks(EXPECTED, pagerank(build(), use_numpy=True))
+
+    def test_matches_reference(self):
+        graph = Directed()
+        for i in range(50):
+            for j in (i * 7 % 50, i * 13 % 50, (i + 1) % 50):
+                graph.insert_edge(i, j)
+
+        for damping in [0.5, 0.85]:
+            self.assert_ranks(reference(graph, damping),
+                              pagerank(graph, damping, tolerance=1e-10,
+                                       use_numpy=False), 8)
+
+    def test_personalized(self):
+        graph = build()
+        teleport = {'d': 1.0}
+        result = pagerank(graph, personalization={'d': 3},
+                          tolerance=1e-10, use_numpy=False)
+        self.assert_ranks(reference(graph, teleport=teleport), result, 8)
+        self.assertGreater(result['d'], result['e'])
+
+        with self.assertRaises(ValueError):
+            pagerank(graph, personalization={'d': 0})
+        with self.assertRaises(ValueError):
+            pagerank(graph, personalization={'d': 1, 'x': 1})
+        with self.assertRaises(ValueError):
+            pagerank(graph, personalization={'d': 2, 'a': -1})
+
+    def test_undirected(self):
+        graph = build(Undirected)
+        result = pagerank(graph, use_numpy=False)
+        self.assertAlmostEqual(1, sum(result.values()))
+        self.assertAlmostEqual(result['a'], result['b'], 4)
+        self.assertEqual('c', max(result, key=result.get))
+
+    def test_multigraph(self):
+        graph = build(MultiDirected)
+        graph.insert_edge('a', 'b')
+        result = pagerank(graph, use_numpy=False)
+        self.assertAlmostEqual(1, sum(result.values()))
+        self.assertGreater(result['b'], EXPECTED['b'])
+
+    def test_empty(self):
+        self.assertEqual({}, pagerank(Directed()))
+        self.assertEqual([], pagerank_top(Directed(), 3))
+
+    def test_max_iterations(self):
+        result = pagerank(build(), max_iterations=1, use_numpy=False)
+        self.assertNotAlmostEqual(EXPECTED['a'], result['a'], 4)
+
+    def test_pagerank_top(self):
+        graph = build()
+        self.assertEqual(['c', 'a'],
+                         [v for v, _ in pagerank_top(graph, 2,
+                                                     use_numpy=False)])
+        self.assertEqual(['c', 'a', 'b'],
+                         [v for v, _ in pagerank_top(graph, 3,
+                                                     use_numpy=False)])
+        self.assertEqual(5, len(pagerank_top(graph, 10, use_numpy=False)))
+
+    def test_pagerank_top_invalid_k(self):
+        self.assertRaises(ValueError, pagerank_top, build(), 0)
+        self.assertRaises(ValueError, pagerank_top, build(), -1)
+
+    def test_numpy_missing(self):
+        module = import_module('algolib.graph.pagerank')
+        with patch.object(module, 'numpy', None):
+            self.assertRaises(ImportError, pagerank, build(), use_numpy=True)
+            self.assertRaises(ImportError, pagerank_top, build(), 2,
+                              use_numpy=True)
+            self.assert_ranks(EXPECTED, pagerank(build()))
+
+    @skipIf(numpy is None, 'NumPy not installed')
+    def test_numpy_matches_python(self):
+        rng = Random(0)
+        for cls in (Directed, Undirected, MultiDirected):
+            graph = cls()
+            for v in range(50):
+                graph.insert_vertex(v)
+            for _ in range(150):
+                graph.insert_edge(rng.randrange(50), rng.randrange(50))
+            personalization = {v: rng.random() for v in range(0, 50, 3)}
+
+            for weights in (None, personalization):
+                expected = pagerank(graph, personalization=weights,
+                                    use_numpy=False)
+                self.assert_ranks(expected,
+                                  pagerank(graph, personalization=weights,
+                                           use_numpy=True), 10)
+                self.assertEqual(
+                    [v for v, _ in pagerank_top(graph, 5,
+                                                personalization=weights,
+                                                use_numpy=False)],
+                    [v for v, _ in pagerank_top(graph, 5,
+                                                personalization=weights,
+                                                use_numpy=True)])
@@ -0,0 +1,89 @@
+from collections import Counter
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, partition, part_subgraphs, \
+    edge_cut
+
+
+def grid(cls=Undirected, size=20):
+    graph = cls()
+    for x in range(size):
+        for y in range(size):
+            if x + 1 < size:
+                graph.insert_edge((x, y), (x + 1, y))
+            if y + 1 < size:
+                graph.insert_edge((x, y), (x, y + 1))
+
+    return graph
+
+
+class TestPartition(TestCase):
+    def check_balance(self, graph, assignment, parts, imbalance=0.03):
+        self.assertEqual(set(graph.vertices), set(assignment))
+        sizes = Counter(assignment.values())
+        self.assertTrue(set(sizes) <= set(range(parts)))
+        limit = -(-len(graph.vertices) * (1 + imbalance) // parts)
+        self.assertLessEqual(max(sizes.values()), limit)
+
+    def test_grid(self):
+        for cls in [Undirected, Directed]:
+            graph = grid(cls)
+            for parts in [2, 4, 8]:
+                assignment = partition(graph, parts, seed=0)
+                self.check_balance(graph, assignment, parts)
+                self.assertLess(edge_cut(graph, assignment), 40 * parts)
+
+    def test_cliques(self):
+        # Ring of cliques is cut along the ring edges
+        graph = Undirected()
+        for c in range(4):
+            for x in range(10):
+                for y in range(x):
+                    graph.insert_edge(c * 10 + x, c * 10 + y, weight=5)
+            graph.insert_edge(c * 10, (c + 1) % 4 * 10 + 1, weight=1)
+
+        assignment = partition(graph, 4, seed=1)
+        self.check_balance(graph, assignment, 4)
+        self.assertEqual(4, edge_cut(graph, assignment))
+        self.assertEqual(4, len(set(assignment.values())))
+
+    def test_random(self):
+        rng = Random(0)
+        graph = Undirected()
+        for v in range(300):
+            graph.insert_vertex(v)
+        for _ in range(900):
+            graph.insert_edge(rng.randrange(300), rng.randrange(300),
+                              weight=rng.randint(1, 5))
+        assignment = partition(graph, 3, imbalance=0.1, seed=0)
+        self.check_balance(graph, assignment, 3, 0.1)
+        self.assertEqual(assignment, partition(graph, 3, imbalance=0.1,
+                                               seed=0))
+
+    def test_isolated(self):
+        graph = Undirected()
+        for v in range(20000):
+            graph.insert_vertex(v)
+        assignment = partition(graph, 4, seed=0)
+        self.assertEqual([5000] * 4, sorted(Counter(assignment.values())
+                                            .values()))
+
+    def test_trivial(self):
+        graph = grid(size=3)
+        self.assertEqual(dict.fromkeys(graph.vertices, 0),
+                         partition(graph, 1))
+        self.assertEqual({}, partition(Undirected(), 3))
+        self.assertRaises(ValueError, partition, graph, 0)
+
+    def test_part_subgraphs(self):
+        graph = grid(size=6)
+        assignment = partition(graph, 2, seed=0)
+        views = part_subgraphs(graph, assignment)
+        self.assertEqual(2, len(views))
+        for p, view in enumerate(views):
+            self.assertEqual({v for v, x in assignment.items() if x == p},
+                             set(view.vertices))
+
+        inside = sum(len(view.edges) for view in views)
+        self.assertEqual(len(graph.edges),
+                         inside + edge_cut(graph, assignment))
@@ -0,0 +1,87 @@
+from random import Random
+from unittest import TestCase
+from .context import Directed, MultiDirected, BFS, ReachabilityIndex, \
+    induced_subgraph
+
+
+def random_dag(cls=Directed, seed=0, vertices=60, edges=150):
+    rng = Random(seed)
+    graph = cls()
+    for v in range(vertices):
+        graph.insert_vertex(v)
+    for _ in range(edges):
+        x, y = sorted(rng.sample(range(vertices), 2))
+        graph.insert_edge(y, x)
+
+    return graph
+
+
+def reachable_set(graph, source):
+    bfs = BFS(graph)
+    bfs.execute(source)
+    return {v for v in graph.vertices if bfs[v].state == BFS.PROCESSED}
+
+
+class TestReachabilityIndex(TestCase):
+    def check(self, graph):
+        index = ReachabilityIndex(graph)
+        for source in graph.vertices:
+            expected = reachable_set(graph, source)
+            for dest in graph.vertices:
+                self.assertEqual(dest in expected,
+                                 index.reachable(source, dest))
+
+        return index
+
+    def test_random(self):
+        for seed in range(5):
+            self.check(random_dag(seed=seed))
+
+    def test_multigraph(self):
+        graph = random_dag(MultiDirected, edges=100)
+        graph.insert_edge(10, 5)
+        graph.insert_edge(10, 5)
+        self.check(graph)
+
+    def test_view(self):
+        self.check(induced_subgraph(random_dag(), range(0, 60, 2)))
+
+    def test_long_path(self):
+        graph = Directed()
+        for x in range(5000):
+            graph.insert_edge(x, x + 1)
+        index = ReachabilityIndex(graph)
+        self.assertTrue(index.reachable(0, 5000))
+        self.assertFalse(index.reachable(5000, 0))
+
+    def test_star(self):
+        graph = Directed()
+        for x in range(1, 3000):
+            graph.insert_edge(0, x)
+        graph.insert_edge(1, 2)
+        index = ReachabilityIndex(graph)
+        self.assertTrue(index.reachable(0, 2999))
+        self.assertTrue(index.reachable(1, 2))
+        self.assertFalse(index.reachable(2, 1))
+        self.assertFalse(index.reachable(3, 4))
+
+    def test_dense(self):
+        for seed in range(5):
+            self.check(random_dag(seed=seed, vertices=30, edges=200))
+
+    def test_reachable_many(self):
+        graph = random_dag(seed=1)
+        index = ReachabilityIndex(graph)
+        pairs = [(x, y) for x in range(0, 60, 7) for y in range(0, 60, 5)]
+        self.assertEqual([index.reachable(x, y) for x, y in pairs],
+                         index.reachable_many(iter(pairs)))
+
+    def test_cycle(self):
+        graph = random_dag()
+        graph.insert_edge(0, 59)
+        graph.insert_edge(59, 0)
+        self.assertRaises(ValueError, ReachabilityIndex, graph)
+
+    def test_missing_vertex(self):
+        index = ReachabilityIndex(random_dag())
+        self.assertRaises(KeyError, index.reachable, 0, 100)
@@ -0,0 +1,123 @@
+from unittest import TestCase
+from .context import Undirected, Directed, Stats, BFS, DFS, dijkstra, prim, \
+    kruskal, edmonds_karp
+from algolib.priority_queue import PriorityQueue
+
+EDGES = [
+    [0, 1, 5],
+    [0, 2, 12],
+    [0, 3, 7],
+    [1, 3, 9],
+    [1, 4, 7],
+    [2, 3, 4],
+    [2, 5, 7],
+    [3, 4, 4],
+    [3, 5, 3],
+    [4, 5, 2],
+    [4, 6, 5],
+    [5, 6, 2]
+]
+
+
+def create(cls, edges):
+    graph = cls()
+    for x, y, w in edges:
+        graph.insert_edge(x, y, weight=w, capacity=w)
+
+    return graph
+
+
+class TestStats(TestCase):
+    def test_as_dict(self):
+        stats = Stats()
+        with stats.phase('foo'):
+            pass
+        stats.frontier(3)
+        stats.frontier(2)
+        result = stats.as_dict()
+        self.assertEqual(3, result['peak_frontier'])
+        self.assertEqual(0, result['pops'])
+        self.assertEqual(['foo'], list(result['times']))
+        self.assertGreaterEqual(result['times']['foo'], 0)
+
+    def test_bfs(self):
+        graph = create(Undirected, EDGES)
+        stats = Stats()
+        BFS(graph, stats=stats).execute(0)
+        self.assertEqual(7, stats.vertices_settled)
+        self.assertEqual(2 * len(EDGES), stats.edges_scanned)
+        self.assertGreater(stats.peak_frontier, 1)
+
+    def test_bfs_frontier(self):
+        graph = create(Undirected, [[0, x, 1] for x in range(1, 6)])
+        stats = Stats()
+        BFS(graph, stats=stats).execute(0)
+        self.assertEqual(6, stats.vertices_settled)
+        self.assertEqual(5, stats.peak_frontier)
+
+    def test_dfs(self):
+        graph = create(Directed, [[x, x + 1, 1] for x in range(5)])
+        stats = Stats()
+        DFS(graph, stats=stats).execute(0)
+        self.assertEqual(6, stats.vertices_settled)
+        self.assertEqual(5, stats.edges_scanned)
+        self.assertEqual(6, stats.peak_frontier)
+
+    def test_dijkstra(self):
+        graph = create(Undirected, EDGES)
+        stats = Stats()
+        expected = dijkstra(graph, 0)
+        self.assertEqual(expected, dijkstra(graph, 0, stats=stats))
+        self.assertEqual(7, stats.vertices_settled)
+        self.assertEqual(7, stats.pops)
+        self.assertEqual(2 * len(EDGES), stats.edges_scanned)
+        self.assertEqual(stats.edges_relaxed + 1, stats.priority_changes)
+        self.assertGreaterEqual(stats.edges_relaxed, 6)
+        self.assertEqual({'initialize', 'search'}, set(stats.times))
+
+    def test_dijkstra_accumulate(self):
+        graph = create(Undirected, EDGES)
+        stats = Stats()
+        dijkstra(graph, 0, stats=stats)
+        dijkstra(graph, 0, stats=stats)
+        self.assertEqual(14, stats.vertices_settled)
+
+    def test_queue(self):
+        stats = Stats()
+        queue = stats.queue(PriorityQueue)([(float('inf'), 1), (2, 2)])
+        queue.push(1, 3)
+        queue.change_priority(0, 1)
+        self.assertEqual(3, len(queue))
+        self.assertEqual((0, 1), queue.min())
+        self.assertEqual((0, 1), queue.pop())
+        self.assertEqual(1, stats.pushes)
+        self.assertEqual(1, stats.pops)
+        self.assertEqual(1, stats.priority_changes)
+        self.assertEqual(3, stats.peak_frontier)
+
+    def test_prim(self):
+        graph = create(Undirected, EDGES)
+        stats = Stats()
+        self.assertEqual(prim(graph), prim(graph, stats=stats))
+        self.assertEqual(7, stats.vertices_settled)
+        self.assertEqual(7, stats.pops)
+        self.assertEqual(2 * len(EDGES), stats.edges_scanned)
+        self.assertEqual(stats.edges_relaxed + 1, stats.priority_changes)
+        self.assertGreaterEqual(stats.edges_relaxed, 6)
+
+    def test_kruskal(self):
+        graph = create(Undirected, EDGES)
+        stats = Stats()
+        self.assertEqual(kruskal(graph), kruskal(graph, stats=stats))
+        self.assertEqual(len(EDGES), stats.edges_scanned)
+        self.assertEqual(6, stats.edges_relaxed)
+        self.assertEqual({'sort', 'search'}, set(stats.times))
+
+    def test_edmonds_karp(self):
+        graph = create(Directed, EDGES)
+        stats = Stats()
+        _, flow = edmonds_karp(graph, 0, 6, stats=stats)
+        self.assertEqual(edmonds_karp(graph, 0, 6)[1], flow)
+        self.assertGreater(stats.iterations, 0)
+        self.assertEqual({'initialize', 'search'}, set(stats.times))
+        self.assertGreater(stats.vertices_settled, stats.iterations)
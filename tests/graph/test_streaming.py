@@ -0,0 +1,65 @@
+from random import Random
+from unittest import TestCase
+from .context import Undirected, kruskal, stream_components, \
+    stream_kruskal, degree_stats
+
+
+def random_edges(seed, vertices=50, edges=200):
+    rng = Random(seed)
+    return [(rng.randrange(vertices), rng.randrange(vertices),
+             rng.randint(1, 100)) for _ in range(edges)]
+
+
+class TestStreaming(TestCase):
+    def test_components(self):
+        edges = [(0, 1), (1, 2), (3, 4), (5, 5)]
+        result = stream_components(iter(edges), vertices=[6])
+        self.assertEqual([{0, 1, 2}, {3, 4}, {5}, {6}],
+                         sorted(result, key=min))
+
+    def test_kruskal(self):
+        for seed in range(10):
+            edges = random_edges(seed)
+
+            # Keep lightest of parallel edges so that graph matches stream
+            graph = Undirected()
+            for x, y, w in edges:
+                if x != y and (not graph.connected(x, y) or
+                               graph[x][y]['weight'] > w):
+                    if graph.connected(x, y):
+                        graph.remove_edge(x, y)
+                    graph.insert_edge(x, y, weight=w)
+
+            vertices = len({v for x, y, _ in edges for v in (x, y)})
+            expected = sum(graph[x][y]['weight'] for x, y in kruskal(graph))
+            for chunk_size in [1, 7, 1000]:
+                result = stream_kruskal(iter(edges), chunk_size)
+                self.assertEqual(expected, sum(w for _, _, w in result))
+                self.assertEqual(vertices - len(stream_components(edges)),
+                                 len(result))
+                self.assertEqual(sorted(w for _, _, w in result),
+                                 [w for _, _, w in result])
+
+    def test_kruskal_empty(self):
+        self.assertEqual([], stream_kruskal([]))
+
+    def test_degree_stats(self):
+        edges = [(0, 1), (0, 2), (0, 3), (1, 2)]
+        self.assertEqual({
+            'vertices': 4,
+            'edges': 4,
+            'min_degree': 1,
+            'max_degree': 3,
+            'mean_degree': 2.0,
+            'histogram': {3: 1, 2: 2, 1: 1}
+        }, degree_stats(iter(edges)))
+
+        result = degree_stats(edges, directed=True)
+        self.assertEqual(3, result['max_out_degree'])
+        self.assertEqual(2, result['max_in_degree'])
+
+    def test_degree_stats_empty(self):
+        result = degree_stats([], directed=True)
+        self.assertEqual(0, result['vertices'])
+        self.assertEqual(0, result['max_degree'])
+        self.assertEqual(0, result['max_in_degree'])
@@ -0,0 +1,77 @@
+from itertools import combinations
+from random import Random
+from unittest import TestCase
+from .context import Undirected, Directed, MultiUndirected, triangles, \
+    clustering, global_clustering
+
+#   0 - 1
+#   | X |
+#   2 - 3 - 4
+#        \ /
+#         5   6
+EDGES = [
+    [0, 1],
+    [0, 2],
+    [0, 3],
+    [1, 2],
+    [1, 3],
+    [2, 3],
+    [3, 4],
+    [3, 5],
+    [4, 5]
+]
+
+
+def build(cls=Undirected, edges=EDGES):
+    graph = cls()
+    for x, y in edges:
+        graph.insert_edge(x, y)
+    graph.insert_vertex(6)
+
+    return graph
+
+
+def brute_force(graph):
+    result = {v: 0 for v in graph.vertices}
+    for x, y, z in combinations(graph.vertices, 3):
+        if graph.connected(x, y) and graph.connected(y, z) and \
+                graph.connected(x, z):
+            for v in (x, y, z):
+                result[v] += 1
+
+    return result
+
+
+class TestTriangles(TestCase):
+    def test_triangles(self):
+        self.assertEqual({0: 3, 1: 3, 2: 3, 3: 4, 4: 1, 5: 1, 6: 0},
+                         triangles(build()))
+
+    def test_random(self):
+        rng = Random(0)
+        graph = Undirected()
+        for _ in range(300):
+            graph.insert_edge(rng.randrange(40), rng.randrange(40))
+
+        self.assertEqual(brute_force(graph), triangles(graph))
+        self.assertEqual(brute_force(graph), triangles(graph, processes=2))
+
+    def test_ignores_loops_direction_and_parallel_edges(self):
+        expected = triangles(build())
+        graph = build(MultiUndirected, EDGES + [[0, 1], [3, 3]])
+        self.assertEqual(expected, triangles(graph))
+        graph = build(Directed, [[y, x] if x % 2 else [x, y]
+                                 for x, y in EDGES])
+        self.assertEqual(expected, triangles(graph))
+
+    def test_clustering(self):
+        result = clustering(build())
+        self.assertEqual(1, result[0])
+        self.assertAlmostEqual(0.4, result[3])
+        self.assertEqual(1, result[4])
+        self.assertEqual(0, result[6])
+
+    def test_global_clustering(self):
+        # 5 triangles, 3 * 3 + 10 + 2 * 1 = 21 triples
+        self.assertAlmostEqual(15.0 / 21, global_clustering(build()))
+        self.assertEqual(0, global_clustering(Undirected()))
@@ -1,5 +1,5 @@
 import unittest
-from .context import Undirected
+from .context import Undirected, SnapshotDict
 from collections import Counter
 
 EDGES = [
@@ -181,3 +181,55 @@ class TestUndirected(unittest.TestCase):
 
         # Check that we've written the test right
         self.assertEqual(self.g, other)
+
+    def test_snapshot(self):
+        snapshot = self.g.snapshot()
+        self.assertEqual(self.g, snapshot)
+
+        self.g.insert_edge(8, 9)
+        self.g.remove_edge(1, 3)
+        self.g.remove_vertex(2)
+        self.assertEqual(self.initialize_graph(), snapshot)
+        self.assertEqual({0, 3, 4, 5}, set(snapshot[1]))
+        self.assertEqual(2, snapshot.degree(7))
+
+        # Rows that weren't touched are still shared
+        self.assertIs(self.g[5], snapshot[5])
+
+        expected = self.initialize_graph()
+        expected.insert_edge(8, 9)
+        expected.remove_edge(1, 3)
+        expected.remove_vertex(2)
+        self.assertEqual(expected, self.g)
+        self.assertEqual(1, self.g.degree(7))
+
+    def test_snapshot_read_doesnt_insert(self):
+        snapshot = self.g.snapshot()
+        self.assertEqual({}, snapshot[9])
+        self.assertEqual([], list(snapshot.edges_from(9)))
+        self.assertEqual(0, snapshot.degree(9))
+        self.assertNotIn(9, self.g._neighbors)
+
+    def test_snapshot_write_doesnt_copy(self):
+        graph = Undirected()
+        for i in range(1000):
+            graph.insert_edge(i, i + 1)
+        snapshot = graph.snapshot()
+        graph.insert_edge(0, 2)
+        graph.remove_vertex(500)
+
+        self.assertIsInstance(graph._neighbors, SnapshotDict)
+        self.assertIs(graph.edges._layers[0], snapshot.edges._layers[0])
+        self.assertEqual(1000, len(snapshot.edges))
+        self.assertEqual(999, len(graph.edges))
+        self.assertEqual({0, 1, 3}, set(graph[2]))
+        self.assertEqual({1, 3}, set(snapshot[2]))
+
+    def test_snapshot_can_be_modified(self):
+        snapshot = self.g.snapshot()
+        second = snapshot.snapshot()
+        snapshot.insert_edge(5, 6)
+        self.assertEqual(self.initialize_graph(), self.g)
+        self.assertEqual(self.initialize_graph(), second)
+        self.assertTrue(snapshot.connected(6, 5))
+        self.assertFalse(self.g.connected(6, 5))
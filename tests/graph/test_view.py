@@ -0,0 +1,141 @@
+from unittest import TestCase
+from .context import Undirected, Directed, GraphView, BFS, dijkstra, \
+    dijkstra_path, kruskal, prim, floyd, strong_components, top_sort, \
+    edmonds_karp, induced_subgraph, edge_subgraph, reversed_graph
+
+EDGES = [
+    [0, 1, 5],
+    [0, 2, 12],
+    [0, 3, 7],
+    [1, 3, 9],
+    [1, 4, 7],
+    [2, 3, 4],
+    [2, 5, 7],
+    [3, 4, 4],
+    [3, 5, 3],
+    [4, 5, 2],
+    [4, 6, 5],
+    [5, 6, 2]
+]
+
+
+def build(cls, edges=EDGES):
+    graph = cls()
+    for x, y, w in edges:
+        graph.insert_edge(x, y, weight=w, capacity=w)
+
+    return graph
+
+
+class TestGraphView(TestCase):
+    def test_induced_subgraph(self):
+        for cls in [Undirected, Directed]:
+            graph = build(cls)
+            view = induced_subgraph(graph, [0, 1, 3, 4])
+            expected = build(cls, [e for e in EDGES if e[0] in {0, 1, 3, 4}
+                                   and e[1] in {0, 1, 3, 4}])
+
+            self.assertEqual(cls is Directed, view.directed)
+            self.assertEqual(set(expected.vertices), set(view.vertices))
+            self.assertEqual(set(expected.edges), set(view.edges))
+            self.assertEqual(len(expected.edges), len(view.edges))
+            self.assertEqual(expected, view.copy())
+            self.assertNotIn(2, view[0])
+            self.assertIn(1, view[0])
+            self.assertTrue(view.connected(0, 1))
+            self.assertFalse(view.connected(0, 2))
+            self.assertEqual([], list(view.edges_between(0, 2)))
+
+    def test_induced_subgraph_degree(self):
+        view = induced_subgraph(build(Undirected), [0, 1, 3])
+        self.assertEqual(2, view.degree(0))
+        view = induced_subgraph(build(Directed), [0, 1, 3])
+        self.assertEqual(2, view.degree_out(0))
+        self.assertEqual(2, view.degree_in(3))
+        self.assertEqual({0, 1}, set(view.incoming[3]))
+
+    def test_hidden_vertex(self):
+        for cls in [Undirected, Directed]:
+            view = GraphView(build(cls), vertex_filter=lambda x: x != 1)
+            self.assertNotIn(1, view.vertices)
+            self.assertRaises(KeyError, view.__getitem__, 1)
+            self.assertRaises(KeyError, list, view.edges_from(1))
+            self.assertEqual({2, 3}, set(view[0]))
+        self.assertRaises(KeyError, view.incoming.__getitem__, 1)
+        self.assertRaises(KeyError, view.degree_in, 1)
+        self.assertEqual({0}, set(view.incoming[2]))
+
+    def test_edge_subgraph(self):
+        graph = build(Undirected)
+        view = edge_subgraph(graph, lambda x, y, p: p['weight'] < 7)
+        self.assertEqual(set(graph.vertices), set(view.vertices))
+        self.assertEqual({(0, 1), (2, 3), (3, 4), (3, 5), (4, 5), (4, 6),
+                          (5, 6)}, set(view.edges))
+        self.assertEqual({(0, 1)}, {e for e, _ in view.edges_from(0)})
+
+    def test_view_sees_changes(self):
+        graph = build(Undirected)
+        view = induced_subgraph(graph, [0, 1, 2])
+        graph.insert_edge(1, 2, weight=1)
+        self.assertTrue(view.connected(1, 2))
+        graph.remove_edge(0, 1)
+        self.assertFalse(view.connected(0, 1))
+
+    def test_views_can_be_stacked(self):
+        graph = build(Directed)
+        view = GraphView(induced_subgraph(graph, range(6)),
+                         edge_filter=lambda x, y, p: x != 3)
+        self.assertEqual({(0, 1), (0, 2), (0, 3), (1, 3), (1, 4), (2, 3),
+                          (2, 5), (4, 5)}, set(view.edges))
+
+    def test_algorithms_accept_views(self):
+        graph = build(Undirected)
+        view = induced_subgraph(graph, [0, 1, 3, 4, 6])
+        expected = view.copy()
+
+        self.assertEqual(sorted(kruskal(expected)), sorted(kruskal(view)))
+        self.assertEqual(sorted(map(sorted, prim(expected))),
+                         sorted(map(sorted, prim(view))))
+        self.assertEqual(floyd(expected), floyd(view))
+        self.assertEqual([0, 3, 4, 6],
+                         dijkstra_path(dijkstra(view, 0), 0, 6))
+        self.assertEqual(edmonds_karp(expected, 0, 6)[1],
+                         edmonds_karp(view, 0, 6)[1])
+
+        bfs = BFS(view)
+        bfs.execute(0)
+        self.assertEqual(4, bfs[6].parent)
+
+
+class TestReversedView(TestCase):
+    def test_reversed(self):
+        graph = build(Directed)
+        view = reversed_graph(graph)
+        self.assertTrue(view.directed)
+        self.assertEqual({(y, x) for x, y in graph.edges}, set(view.edges))
+        self.assertEqual(graph.edges[(0, 1)], view.edges[(1, 0)])
+        self.assertEqual(set(graph.incoming[3]), set(view[3]))
+        self.assertEqual(set(graph[3]), set(view.incoming[3]))
+        self.assertEqual(graph.degree_in(3), view.degree_out(3))
+        self.assertEqual(graph.degree_out(3), view.degree_in(3))
+        self.assertTrue(view.connected(1, 0))
+        self.assertFalse(view.connected(0, 1))
+        self.assertEqual([(1, 0)], list(view.edges_between(1, 0)))
+        self.assertEqual(graph, reversed_graph(view).copy())
+
+    def test_reversed_algorithms(self):
+        graph = build(Directed)
+        view = reversed_graph(graph)
+        order = {v: i for i, v in enumerate(top_sort(view))}
+        for x, y in graph.edges:
+            self.assertLess(order[y], order[x])
+        self.assertEqual([6, 5, 3, 0],
+                         dijkstra_path(dijkstra(view, 6), 6, 0))
+
+        graph.insert_edge(6, 0)
+        self.assertEqual(sorted(map(sorted, strong_components(graph))),
+                         sorted(map(sorted, strong_components(view))))
+
+    def test_reversed_undirected(self):
+        with self.assertRaises(ValueError):
+            reversed_graph(Undirected())
@@ -4,3 +4,12 @@ import sys
 sys.path.insert(0, os.path.abspath('../..'))
 from algolib.priority_queue import PriorityQueue
 from algolib.priority_queue import BucketQueue
+from algolib.priority_queue import DaryHeap
+from algolib.priority_queue import RadixHeap
+from algolib.priority_queue import DialQueue
+from algolib.priority_queue import PairingHeap
+from algolib.priority_queue import FibonacciHeap
+from algolib.priority_queue import SynchronizedQueue
+from algolib.priority_queue import AsyncQueue
+from algolib.priority_queue import IntegerBucketQueue
+from algolib.priority_queue import MinMaxHeap
@@ -0,0 +1,46 @@
+import asyncio
+from unittest import TestCase
+from .context import AsyncQueue, DaryHeap
+
+
+class TestAsyncQueue(TestCase):
+    def test_operations(self):
+        queue = AsyncQueue((i, i) for i in range(5, 0, -1))
+        self.assertEqual(5, len(queue))
+        queue.push(0, 0)
+        queue.change_priority(-1, 3)
+        self.assertEqual((-1, 3), queue.min())
+        self.assertEqual((-1, 3), queue.pop_nowait())
+        self.assertEqual((0, 0), asyncio.run(queue.pop()))
+
+    def test_queue_constructor(self):
+        queue = AsyncQueue([(2, 'a'), (1, 'b')], queue_constructor=DaryHeap)
+        self.assertEqual((1, 'b'), queue.pop_nowait())
+
+    def test_empty(self):
+        queue = AsyncQueue()
+        self.assertRaises(asyncio.QueueEmpty, queue.pop_nowait)
+
+        async def timeout():
+            await asyncio.wait_for(queue.pop(), 0.01)
+
+        self.assertRaises(asyncio.TimeoutError, asyncio.run, timeout())
+
+    def test_wait(self):
+        async def main():
+            queue = AsyncQueue()
+            consumers = [asyncio.ensure_future(queue.pop()) for _ in range(3)]
+            await asyncio.sleep(0)
+
+            # Cancelled waiter doesn't swallow items
+            consumers[0].cancel()
+            queue.push(2, 'b')
+            queue.push(1, 'a')
+            queue.push(3, 'c')
+            queue.change_priority(0, 'c')
+            results = await asyncio.gather(*consumers[1:])
+            return results, len(queue)
+
+        results, remaining = asyncio.run(main())
+        self.assertEqual([(0, 'c'), (1, 'a')], results)
+        self.assertEqual(1, remaining)
@@ -1,5 +1,6 @@
 from unittest import TestCase
 import random
+from random import Random
 from .context import BucketQueue
 
 
@@ -59,3 +60,51 @@ class TestBucketQueue(TestCase):
 
             start += 10
         self.assertEqual(popped_keys, set(range(100)))
+
+    def test_remove(self):
+        queue = BucketQueue((i % 5, i) for i in range(20))
+        self.assertEqual(3, queue.remove(8))
+        self.assertNotIn(8, queue)
+        self.assertIn(7, queue)
+        self.assertEqual(19, len(queue))
+        self.assertRaises(KeyError, queue.remove, 8)
+        queue.discard(8)
+        queue.discard(0)
+        queue.discard(5)
+        queue.discard(10)
+        queue.discard(15)
+        self.assertEqual(1, queue.min()[0])
+        self.assertEqual([1] * 4 + [2] * 4 + [3] * 3 + [4] * 4,
+                         [queue.pop()[0] for _ in range(len(queue))])
+
+    def test_get_priority(self):
+        queue = BucketQueue((i % 5, i) for i in range(20))
+        self.assertEqual(3, queue.get_priority(13))
+        queue.change_priority(10, 13)
+        self.assertEqual(10, queue.get_priority(13))
+        self.assertRaises(KeyError, queue.get_priority, 20)
+
+    def test_remove_random(self):
+        rng = Random(0)
+        queue = BucketQueue()
+        expected = {}
+        for _ in range(3000):
+            operation = rng.random()
+            key = rng.randrange(100)
+            if operation < 0.4:
+                if key not in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.push(expected[key], key)
+            elif operation < 0.6:
+                if key in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.change_priority(expected[key], key)
+            elif operation < 0.9:
+                self.assertEqual(key in expected, key in queue)
+                if key in expected:
+                    self.assertEqual(expected.pop(key), queue.remove(key))
+            elif expected:
+                priority, key = queue.pop()
+                self.assertEqual(min(expected.values()), priority)
+                self.assertEqual(expected.pop(key), priority)
+            self.assertEqual(len(expected), len(queue))
@@ -0,0 +1,94 @@
+from unittest import TestCase
+from random import Random, sample, shuffle
+from .context import DaryHeap
+
+
+class TestDaryHeap(TestCase):
+    def test_len(self):
+        queue = DaryHeap(zip(range(10), range(10)))
+        self.assertEqual(10, len(queue))
+
+    def test_invalid_d(self):
+        self.assertRaises(ValueError, DaryHeap, d=1)
+
+    def test_push(self):
+        for d in [2, 3, 4, 8]:
+            queue = DaryHeap(d=d)
+            for i in range(10):
+                queue.push(i, i)
+            for i in range(19, 9, -1):
+                queue.push(i, i)
+
+            self.assertEqual(list(range(20)),
+                             [queue.pop()[0] for _ in range(20)])
+
+    def test_min(self):
+        test_data = list(range(-10, 10))
+        shuffle(test_data)
+        queue = DaryHeap((i, i + 5) for i in test_data)
+        self.assertEqual((-10, -5), queue.min())
+
+    def test_pop(self):
+        queue = DaryHeap((-i, i) for i in range(10))
+        for i in range(9, -1, -1):
+            self.assertEqual((-i, i), queue.pop())
+        self.assertFalse(queue)
+
+    def test_pop_same_value(self):
+        # Keys with same priority are not compared
+        queue = DaryHeap((0, str(i) if i % 2 else i) for i in range(10))
+        self.assertEqual(10, len({queue.pop()[1] for _ in range(10)}))
+
+    def test_push_pop(self):
+        queue = DaryHeap((i, i) for i in range(0, 10, 2))
+        self.assertEqual((0, 0), queue.push_pop(5, 5))
+        self.assertEqual((0, 0), queue.push_pop(0, 0))
+        self.assertEqual((2, 2), queue.push_pop(10, 10))
+        self.assertEqual([4, 5, 6, 8, 10],
+                         [queue.pop()[1] for _ in range(len(queue))])
+
+    def test_replace(self):
+        queue = DaryHeap((i, i) for i in range(10))
+        self.assertEqual((0, 0), queue.replace(-1, -1))
+        self.assertEqual((-1, -1), queue.replace(10, 10))
+        self.assertEqual(list(range(1, 11)),
+                         [queue.pop()[0] for _ in range(len(queue))])
+
+    def test_change_priority(self):
+        values = sample(range(100), 20)
+        queue = DaryHeap(zip(values[:10], range(10)))
+
+        for priority, key in zip(values[10:], range(10)):
+            queue.change_priority(priority, key)
+
+        self.assertEqual(sorted(list(range(10)), key=lambda x: values[x + 10]),
+                         [queue.pop()[1] for _ in range(len(queue))])
+
+    def test_random(self):
+        rng = Random(0)
+        for d in [2, 4, 8]:
+            queue = DaryHeap(((rng.randrange(50), k) for k in range(100)),
+                             d=d)
+            expected = {}
+            for priority, key in [queue.pop() for _ in range(100)]:
+                expected[key] = priority
+            self.assertEqual(100, len(expected))
+
+            for key in range(200):
+                priority = rng.randrange(1000)
+                queue.push(priority, key)
+                expected[key] = priority
+            for _ in range(500):
+                key = rng.randrange(200)
+                priority = rng.randrange(1000)
+                if key in expected:
+                    queue.change_priority(priority, key)
+                    expected[key] = priority
+                if rng.random() < 0.3 and queue:
+                    priority, key = queue.pop()
+                    self.assertEqual(min(expected.values()), priority)
+                    self.assertEqual(expected.pop(key), priority)
+
+            result = [queue.pop() for _ in range(len(queue))]
+            self.assertEqual(sorted(expected.values()),
+                             [p for p, _ in result])
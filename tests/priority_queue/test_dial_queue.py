@@ -0,0 +1,127 @@
+from unittest import TestCase
+from random import Random
+from .context import DialQueue
+
+INF = float('inf')
+
+
+class TestDialQueue(TestCase):
+    def test_len(self):
+        queue = DialQueue(zip(range(10), range(10)), span=10)
+        self.assertEqual(10, len(queue))
+        self.assertTrue(queue)
+        self.assertFalse(DialQueue())
+
+    def test_pop(self):
+        queue = DialQueue(((i * 7 % 11 + 100, i) for i in range(11)), span=10)
+        self.assertEqual(list(range(100, 111)),
+                         [queue.pop()[0] for _ in range(11)])
+        self.assertFalse(queue)
+
+    def test_min(self):
+        queue = DialQueue([(5, 'a'), (3, 'b'), (9, 'c')], span=6)
+        self.assertEqual((3, 'b'), queue.min())
+        self.assertEqual((3, 'b'), queue.pop())
+        self.assertEqual((5, 'a'), queue.min())
+
+    def test_insertion_order(self):
+        queue = DialQueue((0, i) for i in range(10))
+        self.assertEqual(list(range(10)), [queue.pop()[1] for _ in range(10)])
+
+    def test_infinite(self):
+        queue = DialQueue(((INF, i) for i in range(5)), span=10)
+        queue.change_priority(100, 3)
+        queue.change_priority(110, 1)
+        self.assertEqual((100, 3), queue.pop())
+        self.assertEqual((110, 1), queue.pop())
+        self.assertEqual({0, 2, 4}, {queue.pop()[1] for _ in range(3)})
+        queue.push(1000, 5)
+        self.assertEqual((1000, 5), queue.pop())
+
+    def test_errors(self):
+        queue = DialQueue([(5, 'a'), (8, 'b'), (9, 'c')], span=5)
+        self.assertRaises(ValueError, queue.push, 11, 'd')
+        queue.pop()
+        self.assertRaises(ValueError, queue.push, 3, 'd')
+        self.assertRaises(ValueError, queue.change_priority, 3, 'b')
+        self.assertEqual(2, len(queue))
+        queue.change_priority(4, 'b')
+        self.assertEqual((4, 'b'), queue.pop())
+
+    def test_bounds_recomputed(self):
+        queue = DialQueue([(0, 'a'), (10, 'b')], span=10)
+        queue.change_priority(INF, 'b')
+        queue.push(-5, 'c')
+        queue.change_priority(-8, 'a')
+        self.assertEqual([(-8, 'a'), (-5, 'c'), (INF, 'b')],
+                         [queue.pop() for _ in range(3)])
+        queue.push(0, 'd')
+        queue.push(10, 'e')
+        queue.change_priority(-1, 'e')
+        self.assertEqual([(-1, 'e'), (0, 'd')], [queue.pop(), queue.pop()])
+
+    def test_empty(self):
+        queue = DialQueue([(INF, 'a')])
+        queue.pop()
+        self.assertRaises(IndexError, queue.pop)
+        self.assertRaises(IndexError, queue.min)
+
+    def test_empty_window(self):
+        # Window moves when there are no finite items
+        queue = DialQueue([(INF, 'a'), (INF, 'b'), (INF, 'c')], span=5)
+        queue.change_priority(5, 'a')
+        self.assertEqual((5, 'a'), queue.pop())
+        queue.change_priority(9, 'b')
+        queue.change_priority(7, 'c')
+        self.assertEqual([(7, 'c'), (9, 'b')], [queue.pop(), queue.pop()])
+        queue.push(100, 'd')
+        queue.push(96, 'e')
+        self.assertEqual([(96, 'e'), (100, 'd')], [queue.pop(), queue.pop()])
+
+    def test_random(self):
+        rng = Random(0)
+        span = 20
+        queue = DialQueue(((INF, k) for k in range(200)), span=span)
+        expected = dict.fromkeys(range(200), INF)
+        last = 0
+        while expected:
+            for _ in range(rng.randrange(5)):
+                key = rng.randrange(200)
+                if key in expected:
+                    priority = last + rng.randrange(span + 1)
+                    if priority < expected[key]:
+                        queue.change_priority(priority, key)
+                        expected[key] = priority
+
+            priority, key = queue.pop()
+            self.assertEqual(min(expected.values()), priority)
+            self.assertEqual(expected.pop(key), priority)
+            last = priority if priority != INF else last
+            self.assertEqual(len(expected), len(queue))
+
+    def test_random_span(self):
+        rng = Random(1)
+        span = 10
+        queue = DialQueue(span=span)
+        expected = {}
+        for _ in range(3000):
+            key = rng.randrange(30)
+            priority = rng.choice([INF, rng.randrange(-20, 40)])
+            finite = [p for k, p in expected.items() if p != INF and k != key]
+            if priority != INF:
+                finite.append(priority)
+            valid = not finite or max(finite) - min(finite) <= span
+            operation = rng.random()
+            if operation < 0.6:
+                method = queue.change_priority if key in expected \
+                    else queue.push
+                if valid:
+                    method(priority, key)
+                    expected[key] = priority
+                else:
+                    self.assertRaises(ValueError, method, priority, key)
+            elif expected:
+                item = queue.pop()
+                self.assertEqual(min(expected.values()), item[0])
+                self.assertEqual(expected.pop(item[1]), item[0])
+            self.assertEqual(len(expected), len(queue))
@@ -0,0 +1,81 @@
+from unittest import TestCase
+from random import Random, sample, shuffle
+from .context import FibonacciHeap
+
+
+class TestFibonacciHeap(TestCase):
+    def test_len(self):
+        queue = FibonacciHeap(zip(range(10), range(10)))
+        self.assertEqual(10, len(queue))
+        self.assertFalse(FibonacciHeap())
+
+    def test_empty(self):
+        queue = FibonacciHeap([(1, 'a')])
+        queue.pop()
+        self.assertRaises(IndexError, queue.pop)
+        self.assertRaises(IndexError, queue.min)
+
+    def test_push(self):
+        queue = FibonacciHeap()
+        for i in range(10):
+            queue.push(i, i)
+        for i in range(19, 9, -1):
+            queue.push(i, i)
+
+        self.assertEqual(list(range(20)), [queue.pop()[0] for _ in range(20)])
+        self.assertFalse(queue)
+
+    def test_min(self):
+        test_data = list(range(-10, 10))
+        shuffle(test_data)
+        queue = FibonacciHeap((i, i + 5) for i in test_data)
+        self.assertEqual((-10, -5), queue.min())
+
+    def test_pop_same_value(self):
+        # Keys with same priority are not compared
+        queue = FibonacciHeap((0, str(i) if i % 2 else i) for i in range(10))
+        self.assertEqual(10, len({queue.pop()[1] for _ in range(10)}))
+
+    def test_change_priority(self):
+        values = sample(range(100), 20)
+        queue = FibonacciHeap(zip(values[:10], range(10)))
+
+        for priority, key in zip(values[10:], range(10)):
+            queue.change_priority(priority, key)
+
+        self.assertEqual(sorted(list(range(10)), key=lambda x: values[x + 10]),
+                         [queue.pop()[1] for _ in range(len(queue))])
+
+    def test_random(self):
+        rng = Random(0)
+        queue = FibonacciHeap((rng.randrange(50), k) for k in range(100))
+        expected = {}
+        for _ in range(100):
+            priority, key = queue.pop()
+            self.assertGreaterEqual(priority, max(expected.values() or [0]))
+            expected[key] = priority
+        self.assertFalse(queue)
+
+        for key, priority in expected.items():
+            queue.push(priority, key)
+        for _ in range(3000):
+            operation = rng.random()
+            if operation < 0.6:
+                key = rng.choice(list(expected))
+                priority = rng.randrange(1000)
+                queue.change_priority(priority, key)
+                expected[key] = priority
+            elif operation < 0.8 or not expected:
+                key = rng.randrange(10 ** 6)
+                if key not in expected:
+                    priority = rng.randrange(1000)
+                    queue.push(priority, key)
+                    expected[key] = priority
+            else:
+                self.assertEqual(min(expected.values()), queue.min()[0])
+                priority, key = queue.pop()
+                self.assertEqual(expected.pop(key), priority)
+            self.assertEqual(len(expected), len(queue))
+
+        result = [queue.pop() for _ in range(len(queue))]
+        self.assertEqual(sorted(expected.values()), [p for p, _ in result])
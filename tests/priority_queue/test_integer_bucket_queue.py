@@ -0,0 +1,88 @@
+from unittest import TestCase
+from random import Random
+from .context import IntegerBucketQueue
+
+INF = float('inf')
+
+
+class TestIntegerBucketQueue(TestCase):
+    def test_len(self):
+        queue = IntegerBucketQueue(zip([1] * 10, range(10)))
+        self.assertEqual(10, len(queue))
+        self.assertFalse(IntegerBucketQueue(max_priority=10))
+
+    def test_fifo(self):
+        queue = IntegerBucketQueue((i % 3, i) for i in range(12))
+        self.assertEqual([0, 3, 6, 9, 1, 4, 7, 10, 2, 5, 8, 11],
+                         [queue.pop()[1] for _ in range(12)])
+
+    def test_min(self):
+        queue = IntegerBucketQueue([(5, 'a'), (3, 'b'), (9, 'c')])
+        self.assertEqual((3, 'b'), queue.min())
+        queue.push(1, 'd')
+        self.assertEqual((1, 'd'), queue.min())
+
+    def test_cursor_moves_back(self):
+        queue = IntegerBucketQueue([(5, 'a'), (8, 'b')])
+        self.assertEqual((5, 'a'), queue.pop())
+        queue.push(2, 'c')
+        queue.change_priority(0, 'b')
+        self.assertEqual([(0, 'b'), (2, 'c')], [queue.pop(), queue.pop()])
+
+    def test_infinite(self):
+        queue = IntegerBucketQueue((INF, i) for i in range(5))
+        queue.change_priority(3, 3)
+        queue.change_priority(1, 1)
+        self.assertEqual([(1, 1), (3, 3)], [queue.pop(), queue.pop()])
+        self.assertEqual([0, 2, 4], [queue.pop()[1] for _ in range(3)])
+
+    def test_negative(self):
+        queue = IntegerBucketQueue([(1, 'a')])
+        self.assertRaises(ValueError, queue.push, -1, 'b')
+        self.assertRaises(ValueError, queue.change_priority, -1, 'a')
+        self.assertEqual(1, queue.get_priority('a'))
+
+    def test_empty(self):
+        queue = IntegerBucketQueue([(INF, 'a')])
+        queue.pop()
+        self.assertRaises(IndexError, queue.pop)
+        self.assertRaises(IndexError, queue.min)
+
+    def test_remove(self):
+        queue = IntegerBucketQueue((i % 4, i) for i in range(8))
+        self.assertEqual(2, queue.remove(6))
+        self.assertNotIn(6, queue)
+        self.assertRaises(KeyError, queue.remove, 6)
+        queue.discard(6)
+        queue.discard(0)
+        self.assertEqual([4, 1, 5, 2, 3, 7],
+                         [queue.pop()[1] for _ in range(len(queue))])
+
+    def test_random(self):
+        rng = Random(0)
+        queue = IntegerBucketQueue(max_priority=5)
+        expected = {}
+        order = {}
+        for step in range(5000):
+            operation = rng.random()
+            key = rng.randrange(100)
+            if operation < 0.4:
+                if key not in expected:
+                    expected[key] = rng.randrange(30)
+                    order[key] = step
+                    queue.push(expected[key], key)
+            elif operation < 0.6:
+                if key in expected:
+                    expected[key] = rng.randrange(30)
+                    order[key] = step
+                    queue.change_priority(expected[key], key)
+            elif operation < 0.7:
+                queue.discard(key)
+                expected.pop(key, None)
+            elif expected:
+                item = queue.pop()
+                self.assertEqual(min((p, order[k], k)
+                                     for k, p in expected.items())[::2],
+                                 item)
+                del expected[item[1]]
+            self.assertEqual(len(expected), len(queue))
@@ -0,0 +1,121 @@
+from unittest import TestCase
+from random import Random
+from .context import MinMaxHeap
+
+
+class TestMinMaxHeap(TestCase):
+    def test_len(self):
+        queue = MinMaxHeap(zip(range(10), range(10)))
+        self.assertEqual(10, len(queue))
+        self.assertFalse(MinMaxHeap())
+
+    def test_invalid_capacity(self):
+        self.assertRaises(ValueError, MinMaxHeap, capacity=0)
+
+    def test_min_max(self):
+        queue = MinMaxHeap([(5, 'a'), (3, 'b'), (9, 'c'), (7, 'd')])
+        self.assertEqual((3, 'b'), queue.min())
+        self.assertEqual((9, 'c'), queue.max())
+        queue.push(1, 'e')
+        queue.push(10, 'f')
+        self.assertEqual((1, 'e'), queue.min())
+        self.assertEqual((10, 'f'), queue.max())
+
+    def test_single(self):
+        queue = MinMaxHeap([(1, 'a')])
+        self.assertEqual(queue.min(), queue.max())
+        self.assertEqual((1, 'a'), queue.pop_max())
+        self.assertRaises(IndexError, queue.max)
+        self.assertRaises(IndexError, queue.pop_min)
+        self.assertRaises(IndexError, queue.pop_max)
+
+    def test_pop(self):
+        rng = Random(0)
+        priorities = [rng.randrange(50) for _ in range(100)]
+        queue = MinMaxHeap(zip(priorities, range(100)))
+        popped = []
+        while queue:
+            popped.append(queue.pop_min()[0])
+            if queue:
+                popped.append(queue.pop_max()[0])
+
+        expected = sorted(priorities)
+        self.assertEqual(expected[:50], popped[::2])
+        self.assertEqual(expected[50:][::-1], popped[1::2])
+
+    def test_pop_same_value(self):
+        queue = MinMaxHeap((1, object()) for _ in range(20))
+        self.assertEqual(20, len([queue.pop()[0] for _ in range(20)]))
+
+    def test_change_priority(self):
+        queue = MinMaxHeap(zip(range(10), range(10)))
+        queue.change_priority(20, 0)
+        queue.change_priority(-1, 9)
+        queue.change_priority(4.5, 5)
+        self.assertEqual((-1, 9), queue.min())
+        self.assertEqual((20, 0), queue.max())
+        self.assertEqual(4.5, queue.get_priority(5))
+        self.assertEqual([9, 1, 2, 3, 4, 5, 6, 7, 8, 0],
+                         [queue.pop_min()[1] for _ in range(10)])
+
+    def test_remove(self):
+        queue = MinMaxHeap(zip(range(10), range(10)))
+        self.assertEqual(4, queue.remove(4))
+        self.assertNotIn(4, queue)
+        self.assertRaises(KeyError, queue.remove, 4)
+        queue.discard(4)
+        queue.discard(9)
+        self.assertEqual([0, 1, 2, 3, 5, 6, 7, 8],
+                         [queue.pop_min()[1] for _ in range(len(queue))])
+
+    def test_capacity(self):
+        queue = MinMaxHeap(capacity=3)
+        self.assertIsNone(queue.push(5, 'a'))
+        self.assertIsNone(queue.push(3, 'b'))
+        self.assertIsNone(queue.push(8, 'c'))
+        self.assertEqual((8, 'c'), queue.push(1, 'd'))
+        self.assertEqual((9, 'e'), queue.push(9, 'e'))
+        self.assertEqual(3, len(queue))
+        self.assertNotIn('e', queue)
+        self.assertEqual([(1, 'd'), (3, 'b'), (5, 'a')],
+                         [queue.pop_min() for _ in range(3)])
+
+    def test_capacity_k_smallest(self):
+        rng = Random(1)
+        priorities = [rng.random() for _ in range(1000)]
+        queue = MinMaxHeap(zip(priorities, range(1000)), capacity=10)
+        self.assertEqual(sorted(priorities)[:10],
+                         [queue.pop_min()[0] for _ in range(10)])
+
+    def test_random(self):
+        rng = Random(0)
+        for size in (10, 100):
+            queue = MinMaxHeap()
+            expected = {}
+            for _ in range(5000):
+                operation = rng.random()
+                key = rng.randrange(size)
+                if operation < 0.35:
+                    if key not in expected:
+                        expected[key] = rng.randrange(size)
+                        queue.push(expected[key], key)
+                elif operation < 0.6:
+                    if key in expected:
+                        expected[key] = rng.randrange(size)
+                        queue.change_priority(expected[key], key)
+                elif operation < 0.7:
+                    queue.discard(key)
+                    expected.pop(key, None)
+                elif expected:
+                    if operation < 0.85:
+                        priority, key = queue.pop_min()
+                        self.assertEqual(min(expected.values()), priority)
+                    else:
+                        priority, key = queue.pop_max()
+                        self.assertEqual(max(expected.values()), priority)
+                    self.assertEqual(expected.pop(key), priority)
+
+                self.assertEqual(len(expected), len(queue))
+                if expected:
+                    self.assertEqual(min(expected.values()), queue.min()[0])
+                    self.assertEqual(max(expected.values()), queue.max()[0])
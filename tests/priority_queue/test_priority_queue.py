@@ -1,5 +1,5 @@
 from unittest import TestCase
-from random import sample, shuffle
+from random import Random, sample, shuffle
 from .context import PriorityQueue
 
 
@@ -57,3 +57,145 @@ class TestBinaryQueue(TestCase):
         self.assertEqual(sorted(list(range(10)), key=lambda x: values[x + 10]),
                          [queue.pop()[1] for _ in range(len(queue))])
 
+    def test_push_many(self):
+        rng = Random(0)
+        for size, batch in [(0, 10), (100, 5), (10, 100), (100, 100)]:
+            values = [rng.randrange(1000) for _ in range(size + batch)]
+            queue = PriorityQueue(zip(values[:size], range(size)))
+            queue.push_many(zip(values[size:], range(size, size + batch)))
+            self.assertEqual(size + batch, len(queue))
+
+            # Positions must be valid for change_priority
+            for key in range(0, size + batch, 3):
+                values[key] = rng.randrange(1000)
+                queue.change_priority(values[key], key)
+
+            self.assertEqual(sorted(zip(values, range(size + batch))),
+                             queue.pop_many(size + batch))
+
+    def test_pop_many(self):
+        queue = PriorityQueue((i, i) for i in range(10, 0, -1))
+        self.assertEqual([(1, 1), (2, 2), (3, 3)], queue.pop_many(3))
+        self.assertEqual(7, len(queue))
+        self.assertEqual([], queue.pop_many(0))
+        self.assertEqual(7, len(queue.pop_many(10)))
+        self.assertFalse(queue)
+
+    def test_nsmallest(self):
+        rng = Random(1)
+        values = [rng.randrange(100) for _ in range(50)]
+        queue = PriorityQueue(zip(values, range(50)))
+        expected = sorted(zip(values, range(50)))
+        for k in [0, 1, 5, 50, 60]:
+            self.assertEqual(expected[:k], queue.nsmallest(k))
+        self.assertEqual(50, len(queue))
+        self.assertEqual([], PriorityQueue().nsmallest(3))
+
+    def test_merge(self):
+        first = PriorityQueue((i, i) for i in range(0, 20, 2))
+        second = PriorityQueue((i, i) for i in range(1, 20, 2))
+        first.merge(second)
+        self.assertEqual(10, len(second))
+        self.assertEqual([(i, i) for i in range(20)], first.pop_many(20))
+
+    def test_remove(self):
+        queue = PriorityQueue((i % 5, i) for i in range(20))
+        self.assertEqual(3, queue.remove(8))
+        self.assertNotIn(8, queue)
+        self.assertIn(7, queue)
+        self.assertEqual(19, len(queue))
+        self.assertRaises(KeyError, queue.remove, 8)
+        queue.discard(8)
+        queue.discard(0)
+        queue.discard(5)
+        queue.discard(10)
+        queue.discard(15)
+        self.assertEqual(1, queue.min()[0])
+        self.assertEqual([1] * 4 + [2] * 4 + [3] * 3 + [4] * 4,
+                         [queue.pop()[0] for _ in range(len(queue))])
+
+    def test_get_priority(self):
+        queue = PriorityQueue((i % 5, i) for i in range(20))
+        self.assertEqual(3, queue.get_priority(13))
+        queue.change_priority(10, 13)
+        self.assertEqual(10, queue.get_priority(13))
+        self.assertRaises(KeyError, queue.get_priority, 20)
+
+    def test_remove_random(self):
+        rng = Random(0)
+        queue = PriorityQueue()
+        expected = {}
+        for _ in range(3000):
+            operation = rng.random()
+            key = rng.randrange(100)
+            if operation < 0.4:
+                if key not in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.push(expected[key], key)
+            elif operation < 0.6:
+                if key in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.change_priority(expected[key], key)
+            elif operation < 0.9:
+                self.assertEqual(key in expected, key in queue)
+                if key in expected:
+                    self.assertEqual(expected.pop(key), queue.remove(key))
+            elif expected:
+                priority, key = queue.pop()
+                self.assertEqual(min(expected.values()), priority)
+                self.assertEqual(expected.pop(key), priority)
+            self.assertEqual(len(expected), len(queue))
+
+    def test_lazy(self):
+        queue = PriorityQueue(((i % 5, i) for i in range(20)), lazy=True)
+        self.assertEqual(0, queue.remove(0))
+        self.assertEqual(0, queue.remove(5))
+        self.assertEqual(18, len(queue))
+        self.assertNotIn(0, queue)
+        self.assertEqual(0, queue.min()[0])
+        self.assertEqual(2, len(queue.nsmallest(2)))
+        self.assertTrue(all(k not in (0, 5) for _, k in queue.nsmallest(18)))
+
+        queue.push(0, 0)
+        self.assertEqual([0, 0, 0], [queue.pop()[0] for _ in range(3)])
+        self.assertEqual((1, 1), queue.push_pop(2, 100))
+
+        other = PriorityQueue(((i, i) for i in range(30, 40)), lazy=True)
+        other.remove(35)
+        queue.merge(other)
+        self.assertNotIn(35, queue)
+        self.assertEqual(15 + 9 + 1, len(queue))
+
+    def test_lazy_pop_many(self):
+        queue = PriorityQueue([(1, 'a'), (2, 'b'), (3, 'c')], lazy=True)
+        queue.remove('b')
+        self.assertEqual([(1, 'a'), (3, 'c')], queue.pop_many(5))
+        self.assertFalse(queue)
+
+    def test_lazy_random(self):
+        rng = Random(1)
+        queue = PriorityQueue(lazy=True)
+        expected = {}
+        for _ in range(5000):
+            operation = rng.random()
+            key = rng.randrange(200)
+            if operation < 0.4:
+                if key not in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.push(expected[key], key)
+            elif operation < 0.5:
+                if key in expected:
+                    expected[key] = rng.randrange(50)
+                    queue.change_priority(expected[key], key)
+            elif operation < 0.9:
+                self.assertEqual(key in expected, key in queue)
+                queue.discard(key)
+                expected.pop(key, None)
+            elif expected:
+                priority, key = queue.pop()
+                self.assertEqual(min(expected.values()), priority)
+                self.assertEqual(expected.pop(key), priority)
+            self.assertEqual(len(expected), len(queue))
+
+        self.assertEqual(sorted(expected.values()),
+                         [queue.pop()[0] for _ in range(len(queue))])
@@ -0,0 +1,87 @@
+from unittest import TestCase
+from random import Random
+from .context import RadixHeap
+
+INF = float('inf')
+
+
+class TestRadixHeap(TestCase):
+    def test_len(self):
+        queue = RadixHeap(zip(range(10), range(10)))
+        self.assertEqual(10, len(queue))
+        self.assertTrue(queue)
+        self.assertFalse(RadixHeap())
+
+    def test_pop(self):
+        queue = RadixHeap((i * 37 % 101, i) for i in range(101))
+        self.assertEqual(list(range(101)),
+                         [queue.pop()[0] for _ in range(101)])
+        self.assertFalse(queue)
+
+    def test_min(self):
+        queue = RadixHeap([(5, 'a'), (3, 'b'), (9, 'c')])
+        self.assertEqual((3, 'b'), queue.min())
+        self.assertEqual((3, 'b'), queue.pop())
+        self.assertEqual((5, 'a'), queue.min())
+
+    def test_insertion_order(self):
+        queue = RadixHeap((0, i) for i in range(10))
+        self.assertEqual(list(range(10)), [queue.pop()[1] for _ in range(10)])
+
+    def test_infinite(self):
+        queue = RadixHeap((INF, i) for i in range(5))
+        queue.change_priority(0, 3)
+        queue.change_priority(10, 1)
+        self.assertEqual((0, 3), queue.pop())
+        self.assertEqual((10, 1), queue.pop())
+        self.assertEqual({0, 2, 4}, {queue.pop()[1] for _ in range(3)})
+
+    def test_monotone(self):
+        queue = RadixHeap([(5, 'a'), (8, 'b')])
+        queue.pop()
+        self.assertRaises(ValueError, queue.push, 4, 'c')
+        self.assertRaises(ValueError, queue.change_priority, 4, 'b')
+        queue.push(5, 'c')
+        queue.change_priority(6, 'b')
+        self.assertEqual([(5, 'c'), (6, 'b')], [queue.pop(), queue.pop()])
+
+    def test_push_after_min(self):
+        queue = RadixHeap([(5, 'a'), (10, 'b'), (12, 'c')])
+        self.assertEqual((5, 'a'), queue.pop())
+        self.assertEqual((10, 'b'), queue.min())
+        queue.push(7, 'd')
+        self.assertEqual((7, 'd'), queue.min())
+        self.assertEqual([(7, 'd'), (10, 'b'), (12, 'c')],
+                         [queue.pop() for _ in range(3)])
+
+    def test_min_matches_pop(self):
+        queue = RadixHeap([(9, 'a'), (6, 'b'), (6, 'c'), (INF, 'd')])
+        while queue:
+            item = queue.min()
+            self.assertEqual(item, queue.pop())
+
+    def test_empty(self):
+        queue = RadixHeap([(INF, 'a')])
+        queue.pop()
+        self.assertRaises(IndexError, queue.pop)
+        self.assertRaises(IndexError, queue.min)
+
+    def test_random(self):
+        rng = Random(0)
+        queue = RadixHeap((INF, k) for k in range(200))
+        expected = dict.fromkeys(range(200), INF)
+        last = 0
+        while expected:
+            for _ in range(rng.randrange(5)):
+                key = rng.randrange(200)
+                if key in expected:
+                    priority = last + rng.randrange(1000)
+                    if priority < expected[key]:
+                        queue.change_priority(priority, key)
+                        expected[key] = priority
+
+            priority, key = queue.pop()
+            self.assertEqual(min(expected.values()), priority)
+            self.assertEqual(expected.pop(key), priority)
+            last = priority if priority != INF else last
+            self.assertEqual(len(expected), len(queue))
@@ -0,0 +1,62 @@
+from queue import Empty
+from threading import Thread
+from time import monotonic
+from unittest import TestCase
+from .context import SynchronizedQueue, DaryHeap
+
+
+class TestSynchronizedQueue(TestCase):
+    def test_operations(self):
+        queue = SynchronizedQueue((i, i) for i in range(5, 0, -1))
+        self.assertEqual(5, len(queue))
+        queue.push(0, 0)
+        queue.change_priority(-1, 3)
+        self.assertEqual((-1, 3), queue.min())
+        self.assertEqual([(-1, 3), (0, 0), (1, 1)],
+                         [queue.pop() for _ in range(3)])
+
+    def test_queue_constructor(self):
+        queue = SynchronizedQueue([(2, 'a'), (1, 'b')],
+                                  queue_constructor=DaryHeap)
+        self.assertEqual((1, 'b'), queue.pop())
+
+    def test_empty(self):
+        queue = SynchronizedQueue()
+        self.assertRaises(Empty, queue.pop, block=False)
+        start = monotonic()
+        self.assertRaises(Empty, queue.pop, timeout=0.05)
+        self.assertGreaterEqual(monotonic() - start, 0.04)
+
+    def test_threads(self):
+        queue = SynchronizedQueue()
+        results = []
+
+        def consume():
+            while True:
+                _, key = queue.pop(timeout=5)
+                if isinstance(key, tuple):
+                    break
+                results.append(key)
+
+        def produce(start):
+            # Consumers may pop an item as soon as it's pushed so the final
+            # priority is given directly
+            for i in range(start, start + 250):
+                queue.push(-i if i % 2 else i, i)
+
+        consumers = [Thread(target=consume) for _ in range(4)]
+        producers = [Thread(target=produce, args=(i * 250,))
+                     for i in range(4)]
+        for thread in consumers + producers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+
+        # Stop markers are popped after all the other items
+        for i in range(4):
+            queue.push(float('inf'), ('stop', i))
+        for thread in consumers:
+            thread.join()
+
+        self.assertEqual(list(range(1000)), sorted(results))
+        self.assertEqual(0, len(queue))